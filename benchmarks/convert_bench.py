@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Microbenchmark of `pympris.common.convert`
+against the previous namedtuple based implementation.
+
+Converts GetTracksMetadata-like replies (arrays of a{sv} dictionaries).
+
+Usage::
+
+    python benchmarks/convert_bench.py [tracks] [repeat]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+from collections import namedtuple
+from functools import partial
+
+import dbus
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '..')))
+
+from pympris.common import convert, PY3
+
+
+def convert_legacy(dbus_obj):
+    """`convert` as it was implemented before the lookup table."""
+    _isinstance = partial(isinstance, dbus_obj)
+    ConvertType = namedtuple('ConvertType', 'pytype dbustypes')
+
+    pyint = ConvertType(int, (dbus.Byte, dbus.Int16, dbus.Int32, dbus.Int64,
+                              dbus.UInt16, dbus.UInt32, dbus.UInt64))
+    pybool = ConvertType(bool, (dbus.Boolean, ))
+    pyfloat = ConvertType(float, (dbus.Double, ))
+    pylist = ConvertType(lambda _obj: list(map(convert_legacy, dbus_obj)),
+                         (dbus.Array, ))
+    pytuple = ConvertType(lambda _obj: tuple(map(convert_legacy, dbus_obj)),
+                          (dbus.Struct, ))
+    types_str = (dbus.ObjectPath, dbus.Signature, dbus.String)
+    if not PY3:
+        types_str += (dbus.UTF8String,)
+    pystr = ConvertType(str if PY3 else unicode, types_str)
+
+    pydict = ConvertType(
+        lambda _obj: dict(zip(map(convert_legacy, dbus_obj.keys()),
+                              map(convert_legacy, dbus_obj.values())
+                              )
+                          ),
+        (dbus.Dictionary, )
+    )
+
+    for conv in (pyint, pybool, pyfloat, pylist, pytuple, pystr, pydict):
+        if any(map(_isinstance, conv.dbustypes)):
+            return conv.pytype(dbus_obj)
+    else:
+        return dbus_obj
+
+
+def make_metadata(index):
+    """Returns metadata of one track as a player sends it."""
+    return dbus.Dictionary({
+        'mpris:trackid': dbus.ObjectPath('/org/mpris/track/%d' % index),
+        'mpris:length': dbus.Int64(215000000 + index),
+        'mpris:artUrl': dbus.String('file:///covers/%d.png' % index),
+        'xesam:title': dbus.String('Title %d' % index),
+        'xesam:album': dbus.String('Album %d' % (index // 10)),
+        'xesam:artist': dbus.Array([dbus.String('Artist %d' % index),
+                                    dbus.String('Guest')], signature='s'),
+        'xesam:trackNumber': dbus.Int32(index % 20),
+        'xesam:useCount': dbus.UInt32(index),
+        'xesam:userRating': dbus.Double(0.8),
+        'xesam:explicit': dbus.Boolean(False),
+    }, signature='sv')
+
+
+def main(tracks=1000, repeat=5):
+    reply = dbus.Array([make_metadata(i) for i in range(tracks)],
+                       signature='a{sv}')
+    assert convert(reply) == convert_legacy(reply)
+
+    for name, func in (('legacy', convert_legacy), ('table', convert)):
+        best = min(timeit.repeat(partial(func, reply),
+                                 number=1, repeat=repeat))
+        print("%-8s %8.2f ms per %d tracks" % (name, best * 1000, tracks))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
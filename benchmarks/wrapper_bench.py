@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Microbenchmark of per-call overhead added by `pympris.Base.BaseMeta`
+against the previous stacked `ExceptionMeta` and `ConverterMeta` wrappers.
+
+Calls a void method and reads a property of interface classes
+which talk to a stub instead of the bus, so only wrappers are measured.
+
+Usage::
+
+    python benchmarks/wrapper_bench.py [number] [repeat]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+import dbus
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                '..')))
+
+from pympris.common import ExceptionMeta, ConverterMeta, WrapperMeta, returns
+
+
+class StubInterface(object):
+
+    def Next(self):
+        return None
+
+    def Get(self, prop_name):
+        return dbus.Double(0.5)
+
+
+def make_class(meta):
+    """Returns interface class built by metaclass `meta`."""
+
+    def Next(self):
+        return self.iface.Next()
+
+    def Volume(self):
+        return self.iface.Get('Volume')
+
+    cls = meta('Player', (object, ), {'Next': returns('')(Next),
+                                      'Volume': property(Volume)})
+    instance = cls()
+    instance.iface = StubInterface()
+    return instance
+
+
+class StackedMeta(ExceptionMeta, ConverterMeta):
+    """`BaseMeta` as it was implemented before `WrapperMeta`."""
+
+
+def main(number=200000, repeat=5):
+    players = (('bare', make_class(type)),
+               ('stacked', make_class(StackedMeta)),
+               ('fused', make_class(WrapperMeta)))
+
+    for name, player in players:
+        results = []
+        for stmt in (player.Next, lambda: player.Volume):
+            best = min(timeit.repeat(stmt, number=number, repeat=repeat))
+            results.append(best / number * 1e9)
+        print("%-8s Next() %6.0f ns   Volume %6.0f ns" % ((name, ) +
+                                                          tuple(results)))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -9,21 +9,27 @@ This module provides a `Base` class used as a base class
 for implementing MPRIS2 interfaces.
 """
 
+import copy
 from functools import partial
 
 import dbus
 
 from .common import (
-    signal_wrapper, filter_properties_signals,
-    ExceptionMeta, ConverterMeta,
+    filter_properties_signals,
+    WrapperMeta, PyMPRISException, PropertiesSnapshot, returns, native,
+    convert, lazy_convert, call_async, effective_timeout, pympris_exception,
 )
+from .core import (PyMPRISNotSupported, PyMPRISUnknownProperty,
+                   PyMPRISInvalidArgs)
+from .SignalDispatcher import SignalDispatcher
+from .PlayerHealth import PlayerHealth
 
 __all__ = ('Base', )
 
 IPROPERTIES = "org.freedesktop.DBus.Properties"
 
 
-class BaseMeta(ExceptionMeta, ConverterMeta):
+class BaseMeta(WrapperMeta):
     """
     `BaseMeta` metaclass uses to avoid returning dbus types and exceptions.
     """
@@ -32,6 +38,170 @@ BaseVersionFix = BaseMeta('BaseVersionFix', (object,), {})
 """`BaseVersionFix` class uses to support both python2 and python3 versions."""
 
 
+class _HandlerWrapper(object):
+
+    """Converts signal's arguments from dbus types before calling handler.
+
+    Wrappers of the same handler are equal, so a handler
+    can be disconnected using a new wrapper.
+    """
+
+    CONVERSIONS = {'eager': convert, 'lazy': lazy_convert, 'raw': None}
+
+    def __init__(self, handler, skip_iface=False, conversion='eager'):
+        self.handler = handler
+        # PropertiesChanged's first argument is the interface name
+        self.skip_iface = skip_iface
+        try:
+            self.convert = self.CONVERSIONS[conversion]
+        except KeyError:
+            raise ValueError("Unknown conversion %r" % conversion)
+
+    def __call__(self, *args):
+        if self.skip_iface:
+            args = args[1:]
+        if self.convert is None:
+            return self.handler(*args)
+        return self.handler(*map(self.convert, args))
+
+    def __eq__(self, other):
+        return (isinstance(other, _HandlerWrapper) and
+                self.handler == other.handler and
+                self.skip_iface == other.skip_iface)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.handler, self.skip_iface))
+
+    def __repr__(self):
+        return repr(self.handler)
+
+    def close(self):
+        """Called when the handler is disconnected."""
+
+
+class _CoalescingWrapper(_HandlerWrapper):
+
+    """Merges 'PropertiesChanged' signals received within `coalesce`
+    seconds (or until the main loop is idle if it's 'idle')
+    and calls handler once with combined properties.
+    """
+
+    def __init__(self, handler, coalesce, conversion='eager'):
+        super(_CoalescingWrapper, self).__init__(handler, skip_iface=True,
+                                                 conversion=conversion)
+        try:
+            valid = coalesce == 'idle' or coalesce > 0
+        except TypeError:
+            valid = False
+        if not valid:
+            raise ValueError("coalesce must be 'idle' or positive number "
+                             "of seconds, not %r" % (coalesce, ))
+        self.coalesce = coalesce
+        self._changed = {}
+        self._invalidated = []
+        self._source = None
+
+    def __call__(self, iface, changed_props, invalidated_props):
+        if self.convert is not None:
+            changed_props = self.convert(changed_props)
+            invalidated_props = self.convert(invalidated_props)
+        for prop_name in changed_props:
+            self._changed[prop_name] = changed_props[prop_name]
+            if prop_name in self._invalidated:
+                self._invalidated.remove(prop_name)
+        for prop_name in invalidated_props:
+            self._changed.pop(prop_name, None)
+            if prop_name not in self._invalidated:
+                self._invalidated.append(prop_name)
+
+        if self._source is None:
+            GLib = _glib()
+            if self.coalesce == 'idle':
+                self._source = GLib.idle_add(self._flush)
+            else:
+                self._source = GLib.timeout_add(int(self.coalesce * 1000),
+                                                self._flush)
+
+    def _flush(self):
+        self._source = None
+        changed_props, self._changed = self._changed, {}
+        invalidated_props, self._invalidated = self._invalidated, []
+        self.handler(changed_props, invalidated_props)
+        return False
+
+    def close(self):
+        """Drops pending properties."""
+        if self._source is not None:
+            _glib().source_remove(self._source)
+            self._source = None
+        self._changed = {}
+        self._invalidated = []
+
+
+def _glib():
+    """Returns GLib module used by dbus main loop."""
+    try:
+        from gi.repository import GLib
+    except ImportError:
+        import gobject as GLib
+    return GLib
+
+
+class AsyncInterface(object):
+
+    """DBUS interface which methods don't wait for replies
+    and return :class:`pympris.common.PendingReply` objects."""
+
+    def __init__(self, base, dbus_interface, timeout=-1):
+        self._base = base
+        self._dbus_interface = dbus_interface
+        self._timeout = timeout
+
+    def __getattr__(self, member):
+        if member.startswith('__') and member.endswith('__'):
+            raise AttributeError(member)
+        return lambda *args: self._base.call_async(
+            self._dbus_interface, member, args, timeout=self._timeout)
+
+
+class TimeoutInterface(object):
+
+    """DBUS interface which methods are called with `timeout`
+    limited by the active :func:`pympris.common.deadline`
+    and recorded by :class:`pympris.PlayerHealth`."""
+
+    def __init__(self, interface, timeout=None, health=None):
+        """
+        :param interface: `dbus.Interface` object.
+        :param float timeout: timeout of calls in seconds,
+                              None means default dbus timeout.
+        :param health: :class:`pympris.PlayerHealth` object or None.
+        """
+        self._interface = interface
+        self._timeout = timeout
+        self._health = health
+
+    def __getattr__(self, member):
+        attr = getattr(self._interface, member)
+        # only dbus methods are resolved by dbus.Interface.__getattr__
+        if member.startswith('_') or hasattr(type(self._interface), member):
+            return attr
+        timeout = self._timeout
+        health = self._health
+
+        def method(*args, **kwargs):
+            kwargs['timeout'] = effective_timeout(
+                kwargs.get('timeout', timeout))
+            if health is None:
+                return attr(*args, **kwargs)
+            return health.call(attr, *args, **kwargs)
+        self.__dict__[member] = method
+        return method
+
+
 class Base(BaseVersionFix):
 
     """`Base` class provides common functionality
@@ -39,7 +209,17 @@ class Base(BaseVersionFix):
 
     OBJ_PATH = "/org/mpris/MediaPlayer2"
 
-    def __init__(self, name, bus=None, private=False):
+    UNCACHED_PROPERTIES = frozenset()
+    """Properties which are never served from the cache
+    because the player doesn't emit 'PropertiesChanged' for them."""
+
+    OPTIONAL_PROPERTIES = frozenset()
+    """Properties the player may not implement. Once the player reports
+    one of them unsupported, reading it raises the same exception
+    without a dbus call."""
+
+    def __init__(self, name, bus=None, private=False, cached=False,
+                 proxy=None, dispatcher=None, timeout=None, health=None):
         """Init inner attributes to work with dbus.
 
         :param name: unique or well-known objects name
@@ -47,6 +227,19 @@ class Base(BaseVersionFix):
                     new SessionBus() object will be created if value is None.
         :param private: if True, create bus object using private connection
                         (uses only if bus is None).
+        :param cached: if True, read all properties once using GetAll
+                       and keep them up to date using 'PropertiesChanged'
+                       signal (requires a main loop to receive signals).
+        :param proxy: proxy object of `name` to share it
+                      with other interfaces; created if value is None.
+        :param dispatcher: :class:`pympris.SignalDispatcher` of `name`
+                           to share it with other interfaces;
+                           created if value is None.
+        :param float timeout: default timeout of calls in seconds;
+                              None means default dbus timeout (25 seconds).
+        :param health: :class:`pympris.PlayerHealth` of `name`
+                       to share it with other interfaces;
+                       created if value is None.
         """
         if not bus:
             bus = dbus.SessionBus(private=private)
@@ -56,51 +249,297 @@ class Base(BaseVersionFix):
         self.name = name
         """objects name from the functions argument"""
 
-        self.proxy = bus.get_object(name, self.OBJ_PATH)
+        if proxy is None:
+            proxy = bus.get_object(name, self.OBJ_PATH)
+        self.proxy = proxy
         """DBUS proxy object"""
 
-        self.iface = dbus.Interface(self.proxy, self.IFACE)
+        if health is None:
+            health = PlayerHealth(bus, name, self.OBJ_PATH)
+        self.health = health
+        """Responsiveness of the player, calls fail fast
+        with :class:`pympris.common.PyMPRISUnavailable`
+        while it doesn't respond"""
+
+        self._bind_interfaces(timeout)
+
+        if dispatcher is None:
+            dispatcher = SignalDispatcher(bus, name, self.OBJ_PATH)
+        self.dispatcher = dispatcher
+        """Dispatcher of the object's signals"""
+
+        self.cached = cached
+        """True if properties are served from the cache"""
+
+        self._cache = {}
+        self._absent = {}
+        if cached:
+            # subscribe first, so changes made during GetAll aren't lost
+            self.dispatcher.connect(
+                IPROPERTIES, 'PropertiesChanged',
+                filter_properties_signals(self._update_cache, self.IFACE),
+                arg0=self.IFACE)
+            try:
+                self.refresh_cache()
+            except PyMPRISException:
+                # properties will be fetched one by one on demand
+                pass
+            self.get = self._get_cached
+
+    @returns('')
+    def _bind_interfaces(self, timeout):
+        """Creates dbus interfaces which calls use `timeout`."""
+        self.timeout = timeout
+        """Default timeout of calls in seconds or None"""
+
+        self.iface = TimeoutInterface(dbus.Interface(self.proxy, self.IFACE),
+                                      timeout, self.health)
         """DBUS interface (uses self.IFACE path to create it)"""
 
-        self.properties = dbus.Interface(self.proxy, IPROPERTIES)
+        self.properties = TimeoutInterface(
+            dbus.Interface(self.proxy, IPROPERTIES), timeout, self.health)
         """DBUS interface to work with object's properties"""
 
         self.get = partial(self.properties.Get, self.IFACE)
         """function to receive property's value"""
 
-        self.set = partial(self.properties.Set, self.IFACE)
+        # Set signature can't be guessed from the value
+        # if the proxy doesn't introspect the object
+        self.set = partial(self.properties.Set, self.IFACE, signature='ssv')
         """function to set property's value"""
 
-    def register_signal_handler(self, signal_name, handler_function):
+    @native
+    def with_timeout(self, timeout):
+        """Returns view of the object which calls use `timeout`::
+
+            player.with_timeout(0.5).Next()
+            status = player.with_timeout(0.2).PlaybackStatus
+
+        The view always asks the player, even in cached mode.
+
+        :param float timeout: timeout of calls in seconds,
+                              None means default dbus timeout.
+        """
+        view = copy.copy(self)
+        view.__dict__.pop('_nowait', None)
+        view.cached = False
+        view._bind_interfaces(timeout)
+        return view
+
+    @property
+    @native
+    def nowait(self):
+        """View of the object which methods and properties
+        don't wait for replies::
+
+            reply = player.nowait.Next()
+            volume = player.nowait.Volume.result()
+            player.nowait.Volume = 0.5  # fire-and-forget
+
+        Methods, property getters and `get_all` return
+        :class:`pympris.common.PendingReply` objects.
+        """
+        try:
+            return self._nowait
+        except AttributeError:
+            pass
+        self._nowait = self._async_view()
+        return self._nowait
+
+    @native
+    def _async_view(self, timeout=None):
+        """Returns view of the object which methods and properties
+        don't wait for replies (see :attr:`nowait`).
+
+        :param float timeout: timeout of calls in seconds,
+                              None means `self.timeout`.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        view = copy.copy(self)
+        # the view always asks the player
+        view.cached = False
+        view.iface = AsyncInterface(self, self.IFACE, timeout)
+        view.get = lambda prop_name: self.call_async(
+            IPROPERTIES, 'Get', (self.IFACE, prop_name), 'ss', timeout)
+        view.set = lambda prop_name, value: self.call_async(
+            IPROPERTIES, 'Set', (self.IFACE, prop_name, value), 'ssv',
+            timeout)
+        view.get_all = lambda: self.call_async(
+            IPROPERTIES, 'GetAll', (self.IFACE, ), 's',
+            timeout).then(PropertiesSnapshot)
+        return view
+
+    @native
+    def call_async(self, dbus_interface, method, args=(), signature=None,
+                   timeout=None):
+        """Calls `method` without waiting for the reply.
+
+        :param str dbus_interface: interface name.
+        :param str method: method name.
+        :param tuple args: method's arguments in dbus types.
+        :param str signature: signature of the arguments;
+                              guessed from `args` if it's None.
+        :param float timeout: timeout in seconds, None means `self.timeout`.
+        :rtype: :class:`pympris.common.PendingReply`
+        :raises PyMPRISUnavailable: if the player doesn't respond
+                                    (see :attr:`health`).
+        """
+        if timeout is None:
+            timeout = self.timeout
+        self.health.before_call()
+        return self.health.track(call_async(
+            self.bus, self.name, self.OBJ_PATH, dbus_interface, method,
+            args, signature, timeout))
+
+    @native
+    def get_all(self):
+        """Reads all properties of the interface using one GetAll call.
+
+        Refreshes the cache in cached mode.
+
+        :returns: converted values of all properties.
+        :rtype: :class:`pympris.common.PropertiesSnapshot`
+        """
+        props = self.properties.GetAll(self.IFACE)
+        if self.cached:
+            self._fill_cache(props)
+        return PropertiesSnapshot(convert(props))
+
+    @returns('')
+    def refresh_cache(self):
+        """Reloads all cached properties using one GetAll call."""
+        self._fill_cache(self.properties.GetAll(self.IFACE))
+
+    @returns('')
+    def _fill_cache(self, props):
+        """Replaces the cache content by `props`."""
+        self._cache = dict((prop_name, value)
+                           for prop_name, value in props.items()
+                           if prop_name not in self.UNCACHED_PROPERTIES)
+
+    @native
+    def _get_cached(self, prop_name):
+        """Returns property's value from the cache.
+
+        Properties missing in the cache (never received or invalidated)
+        are fetched from the player and stored.
+        """
+        try:
+            return self._cache[prop_name]
+        except KeyError:
+            value = self.properties.Get(self.IFACE, prop_name)
+            if prop_name not in self.UNCACHED_PROPERTIES:
+                self._cache[prop_name] = value
+            return value
+
+    @native
+    def _get_optional(self, prop_name):
+        """Returns value of property from OPTIONAL_PROPERTIES
+        remembering that the player doesn't implement it.
+
+        :raises PyMPRISUnknownProperty: if the player doesn't implement it.
+        """
+        exc = self._absent.get(prop_name)
+        if exc is not None:
+            # a new object, so tracebacks don't pile up
+            absent = type(exc)(*exc.args)
+            absent._dbus_name = exc._dbus_name
+            raise absent
+        try:
+            try:
+                return self.get(prop_name)
+            except dbus.exceptions.DBusException as err:
+                raise pympris_exception(err)
+        except PyMPRISException as err:
+            # `get` is wrapped by the metaclass in cached mode
+            exc = err
+            # GDBus and Qt reply InvalidArgs to Get of unknown property
+            if isinstance(exc, PyMPRISInvalidArgs):
+                exc = PyMPRISUnknownProperty(*err.args)
+                exc._dbus_name = err.get_dbus_name()
+            if isinstance(exc, PyMPRISNotSupported):
+                self._absent[prop_name] = exc
+            raise exc
+
+    @returns('')
+    def _update_cache(self, changed_props, invalidated_props):
+        """Applies 'PropertiesChanged' signal to the cache."""
+        for prop_name, value in changed_props.items():
+            self._absent.pop(prop_name, None)
+            if prop_name not in self.UNCACHED_PROPERTIES:
+                self._cache[prop_name] = value
+        for prop_name in invalidated_props:
+            self._cache.pop(prop_name, None)
+
+    @returns('')
+    def register_signal_handler(self, signal_name, handler_function,
+                                conversion='eager'):
         """register `handler_function` to receive `signal_name`.
 
-        Uses class's dbus interface self.IFACE, objects name self.name
-        and objects path self.OBJ_PATH to match signal.
+        Uses class's dbus interface self.IFACE to match signal;
+        signals are received by self.dispatcher.
 
         :param str signal_name: The signal name;
                                 None(default) matches all names.
         :param function handler_function: The function to be called.
+        :param str conversion: how signal's arguments are converted:
+            'eager' converts them to python types,
+            'lazy' passes arrays and dictionaries as views
+            converting items on access (see
+            :func:`pympris.common.lazy_convert`),
+            'raw' passes dbus types as is.
         """
-        self.bus.add_signal_receiver(signal_wrapper(handler_function),
-                                     signal_name=signal_name,
-                                     dbus_interface=self.IFACE,
-                                     bus_name=self.name,
-                                     path=self.OBJ_PATH)
+        self.dispatcher.connect(
+            self.IFACE, signal_name,
+            _HandlerWrapper(handler_function, conversion=conversion))
 
-    def register_properties_handler(self, handler_function):
-        """register `handler_function` to receive `signal_name`.
+    @returns('')
+    def unregister_signal_handler(self, signal_name, handler_function):
+        """unregister `handler_function` registered
+        by :meth:`register_signal_handler` with the same `signal_name`.
 
-        Uses dbus interface IPROPERTIES and objects path self.OBJ_PATH
-        to match 'PropertiesChanged' signal.
+        :raises ValueError: if `handler_function` isn't registered.
+        """
+        self.dispatcher.disconnect(self.IFACE, signal_name,
+                                   _HandlerWrapper(handler_function)).close()
 
-        :param function handler_function: The function to be called.
+    @returns('')
+    def register_properties_handler(self, handler_function,
+                                    conversion='eager', coalesce=None):
+        """register `handler_function` to receive 'PropertiesChanged' signal
+        for class's dbus interface self.IFACE.
+
+        :param function handler_function: The function to be called
+                                          with changed and invalidated
+                                          properties.
+        :param str conversion: how signal's arguments are converted,
+                               see :meth:`register_signal_handler`.
+        :param coalesce: if not None, signals are merged and
+            `handler_function` is called once per burst:
+            a number merges signals received within `coalesce` seconds
+            since the first one, 'idle' merges signals until
+            the main loop is idle. Requires GLib main loop.
         """
+        if coalesce is None:
+            handler = _HandlerWrapper(handler_function, skip_iface=True,
+                                      conversion=conversion)
+        else:
+            handler = _CoalescingWrapper(handler_function, coalesce,
+                                         conversion=conversion)
+        self.dispatcher.connect(IPROPERTIES, 'PropertiesChanged', handler,
+                                arg0=self.IFACE)
 
-        handler = filter_properties_signals(
-            signal_wrapper(handler_function), self.IFACE)
+    @returns('')
+    def unregister_properties_handler(self, handler_function):
+        """unregister `handler_function` registered
+        by :meth:`register_properties_handler`.
 
-        self.bus.add_signal_receiver(handler,
-                                     signal_name='PropertiesChanged',
-                                     dbus_interface=IPROPERTIES,
-                                     bus_name=self.name,
-                                     path=self.OBJ_PATH)
+        Properties pending in coalescing mode are dropped.
+
+        :raises ValueError: if `handler_function` isn't registered.
+        """
+        self.dispatcher.disconnect(
+            IPROPERTIES, 'PropertiesChanged',
+            _HandlerWrapper(handler_function, skip_iface=True),
+            arg0=self.IFACE).close()
@@ -23,32 +23,155 @@ Usage::
     print(mp.track_list.Tracks)
     print(mp.playlists.PlaylistCount)
 
+    state = mp.snapshot()
+    print(state.player.PlaybackStatus, state.player.Volume)
+
     if mp.root.CanQuit:
         mp.root.Quit()
 """
 
+from xml.etree import ElementTree
+
+import dbus
+
+from .common import PyMPRISException, effective_timeout
+from .core import MediaPlayerSnapshot
+from .Base import Base
+from .SignalDispatcher import SignalDispatcher
+from .PlayerHealth import PlayerHealth
 from .Root import Root
 from .Player import Player
 from .PlayLists import PlayLists
 from .TrackList import TrackList
 
-__all__ = ('MediaPlayer', )
+__all__ = ('MediaPlayer', 'MediaPlayerSnapshot', )
 
 
 class MediaPlayer(object):
 
-    """Class implements all MPRIS2 interfaces."""
+    """Class implements all MPRIS2 interfaces.
+
+    All interfaces share one bus connection, one proxy object
+    which doesn't introspect the player and one signal dispatcher.
+    Interfaces are created on first access; optional interfaces
+    (TrackList and Playlists) are None if the player doesn't implement them.
+    """
 
-    def __init__(self, dbus_name, bus=None, private=False):
+    def __init__(self, dbus_name, bus=None, private=False, cached=False,
+                 timeout=None):
         super(MediaPlayer, self).__init__()
-        self.root = Root(dbus_name, bus, private)
-        """Instance of :class:`pympris.Root` class"""
+        if not bus:
+            bus = dbus.SessionBus(private=private)
+        self.bus = bus
+        """Bus object from the functions argument or SessionBus()"""
 
-        self.player = Player(dbus_name, bus, private)
-        """Instance of :class:`pympris.Player` class"""
+        self.name = dbus_name
+        """objects name from the functions argument"""
+
+        self.proxy = bus.get_object(dbus_name, Base.OBJ_PATH,
+                                    introspect=False)
+        """DBUS proxy object shared by all interfaces"""
 
-        self.playlists = PlayLists(dbus_name, bus, private)
-        """Instance of :class:`pympris.PlayLists` class"""
+        self.dispatcher = SignalDispatcher(bus, dbus_name, Base.OBJ_PATH)
+        """Dispatcher of signals shared by all interfaces"""
 
-        self.track_list = TrackList(dbus_name, bus, private)
-        """Instance of :class:`pympris.TrackList` class"""
+        self.health = PlayerHealth(bus, dbus_name, Base.OBJ_PATH)
+        """:class:`pympris.PlayerHealth` shared by all interfaces:
+        latency of calls and state of the circuit breaker"""
+
+        self.cached = cached
+        """True if interfaces serve properties from the cache"""
+
+        self.timeout = timeout
+        """Default timeout of calls in seconds or None
+        (default dbus timeout)"""
+
+        self._interfaces = {}
+        self._introspected = None
+
+    @property
+    def root(self):
+        """Instance of :class:`pympris.Root` class"""
+        return self._interface(Root)
+
+    @property
+    def player(self):
+        """Instance of :class:`pympris.Player` class"""
+        return self._interface(Player)
+
+    @property
+    def playlists(self):
+        """Instance of :class:`pympris.PlayLists` class
+        or None if the player doesn't implement Playlists interface"""
+        return self._interface(PlayLists)
+
+    @property
+    def track_list(self):
+        """Instance of :class:`pympris.TrackList` class
+        or None if the player doesn't implement TrackList interface"""
+        return self._interface(TrackList)
+
+    @property
+    def interfaces(self):
+        """Names of interfaces the player's object implements
+        according introspection data (requested once),
+        or None if the player doesn't support introspection."""
+        if self._introspected is None:
+            try:
+                xml = self.proxy.Introspect(
+                    dbus_interface=dbus.INTROSPECTABLE_IFACE,
+                    timeout=effective_timeout(self.timeout))
+                node = ElementTree.fromstring(xml)
+                self._introspected = frozenset(
+                    iface.get('name') for iface in node.findall('interface'))
+            except (dbus.exceptions.DBusException, ElementTree.ParseError):
+                self._introspected = False
+        return self._introspected or None
+
+    def supports(self, iface_name):
+        """Checks whether the player implements `iface_name` interface.
+
+        Uses Root.HasTrackList for TrackList interface
+        and introspection data for others; interfaces are assumed
+        implemented if the player doesn't support introspection.
+
+        :param str iface_name: interface name, e.g. TrackList.IFACE.
+        :rtype: bool
+        """
+        if iface_name == TrackList.IFACE:
+            return self.root.HasTrackList
+        interfaces = self.interfaces
+        return interfaces is None or iface_name in interfaces
+
+    def _interface(self, cls):
+        """Returns instance of `cls` creating it on first access."""
+        try:
+            return self._interfaces[cls]
+        except KeyError:
+            pass
+        iface = None
+        if cls in (Root, Player) or self.supports(cls.IFACE):
+            iface = cls(self.name, self.bus, cached=self.cached,
+                        proxy=self.proxy, dispatcher=self.dispatcher,
+                        timeout=self.timeout, health=self.health)
+        self._interfaces[cls] = iface
+        return iface
+
+    def snapshot(self):
+        """Reads properties of all interfaces using one GetAll call
+        per interface.
+
+        :returns: snapshot of the player's state.
+        :rtype: :class:`MediaPlayerSnapshot`
+        """
+        optional = []
+        for attr in ('playlists', 'track_list'):
+            try:
+                # the first access probes whether the interface exists
+                iface = getattr(self, attr)
+                optional.append(iface.get_all() if iface else None)
+            except PyMPRISException:
+                optional.append(None)
+        return MediaPlayerSnapshot(self.root.get_all(),
+                                   self.player.get_all(),
+                                   *optional)
@@ -20,13 +20,24 @@ Usage::
     items = pl.GetPlaylists(0, 100, PlaylistOrdering.Alphabetical, reversed=False)
     for uri, name, icon_uri in items:
         print(uri, name, icon_uri)
+
+    for uri, name, icon_uri in pl.iter_playlists(PlaylistOrdering.Alphabetical,
+                                                 page_size=50):
+        print(uri, name, icon_uri)
 """
 
-from .common import convert2dbus
+from collections import OrderedDict
+
+from .common import compile_signature, convert, then, returns, native
 from .Base import Base
 
 __all__ = ('PlayLists', 'PlaylistOrdering', )
 
+_uint32 = compile_signature('u')
+_str = compile_signature('s')
+_bool = compile_signature('b')
+_path = compile_signature('o')
+
 
 class PlaylistOrdering(object):
     Alphabetical = 'Alphabetical'
@@ -45,15 +56,30 @@ class PlayLists(Base):
     IFACE = "org.mpris.MediaPlayer2.Playlists"
     """The D-Bus MediaPlayer2.Playlists interface name"""
 
-    def __init__(self, name, bus=None, private=False):
-        super(PlayLists, self).__init__(name, bus, private)
+    PLAYLISTS_CACHE_SIZE = 16
+    """Maximum number of GetPlaylists results kept in cached mode"""
+
+    def __init__(self, *args, **kwargs):
+        """Takes the same arguments as :class:`pympris.Base.Base`.
 
+        In cached mode GetPlaylists results are cached too.
+        Results containing a playlist are dropped when 'PlaylistChanged'
+        signal arrives for it; all results are dropped when PlaylistCount
+        or Orderings changes.
+        """
+        self._playlists = OrderedDict()
+        super(PlayLists, self).__init__(*args, **kwargs)
+        if self.cached:
+            self.register_signal_handler('PlaylistChanged',
+                                         self._playlist_changed)
+
+    @returns('')
     def ActivatePlaylist(self, playlist_id):
         """Starts playing the given playlist.
 
         :param: str playlist_id: The id of the playlist to activate.
         """
-        self.iface.ActivatePlaylist(playlist_id)
+        return self.iface.ActivatePlaylist(_path(playlist_id))
 
     def GetPlaylists(self, start, max_count, order, reversed):
         """Gets a set of playlists.
@@ -64,11 +90,65 @@ class PlayLists(Base):
         :param str order: The ordering that should be used.
         :param bool reversed: Whether the order should be reversed.
         """
-        cv = convert2dbus
-        return self.iface.GetPlaylists(cv(start, 'u'),
-                                       cv(max_count, 'u'),
-                                       cv(order, 's'),
-                                       cv(reversed, 'b'))
+        if not self.cached:
+            return self.iface.GetPlaylists(_uint32(start), _uint32(max_count),
+                                           _str(order), _bool(reversed))
+        key = (start, max_count, order, bool(reversed))
+        try:
+            playlists = self._playlists.pop(key)
+        except KeyError:
+            playlists = convert(self.iface.GetPlaylists(
+                _uint32(start), _uint32(max_count),
+                _str(order), _bool(reversed)))
+            if len(self._playlists) >= self.PLAYLISTS_CACHE_SIZE:
+                self._playlists.popitem(last=False)
+        # the most recently used result goes last
+        self._playlists[key] = playlists
+        return list(playlists)
+
+    @native
+    def iter_playlists(self, order, reversed=False, page_size=100):
+        """Gets all playlists page by page.
+
+        The next page is requested while the current one is consumed.
+        Iteration stops early if PlaylistCount changes, because pages
+        of the changed list may skip or repeat playlists.
+
+        :param str order: The ordering that should be used.
+        :param bool reversed: Whether the order should be reversed.
+        :param int page_size: The maximum number of playlists in one call.
+        :returns: generator yielding (id, name, icon) of each playlist.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        nowait = self.nowait
+
+        def request(start):
+            # PlaylistCount is read along with every page
+            # to notice changes without a main loop
+            return (nowait.PlaylistCount,
+                    nowait.GetPlaylists(start, page_size, order, reversed))
+
+        count = None
+        start = 0
+        page = request(start)
+        try:
+            while page is not None:
+                count_reply, playlists_reply = page
+                playlists = playlists_reply.result()
+                if count is None:
+                    count = count_reply.result()
+                elif count_reply.result() != count:
+                    return
+                start += page_size
+                page = None
+                if start < count and len(playlists) == page_size:
+                    page = request(start)
+                for playlist in playlists:
+                    yield playlist
+        finally:
+            for reply in page or ():
+                reply.cancel()
 
     @property
     def PlaylistCount(self):
@@ -83,6 +163,31 @@ class PlayLists(Base):
     @property
     def ActivePlaylist(self):
         """The currently-active playlist."""
-        valid, info = tuple(self.get('ActivePlaylist'))
-        if valid:
-            return info
+        return then(self.get('ActivePlaylist'), _active_playlist)
+
+    @returns('')
+    def _update_cache(self, changed_props, invalidated_props):
+        """Applies 'PropertiesChanged' signal to the cache."""
+        super(PlayLists, self)._update_cache(changed_props, invalidated_props)
+        for prop_name in ('PlaylistCount', 'Orderings'):
+            if prop_name in changed_props or prop_name in invalidated_props:
+                self._playlists.clear()
+                break
+
+    @returns('')
+    def _playlist_changed(self, playlist):
+        """Drops cached data containing the changed playlist."""
+        playlist_id = playlist[0]
+        for key, playlists in list(self._playlists.items()):
+            if any(item[0] == playlist_id for item in playlists):
+                del self._playlists[key]
+        active = self._cache.get('ActivePlaylist')
+        if active is not None and active[1][0] == playlist_id:
+            del self._cache['ActivePlaylist']
+
+
+def _active_playlist(value):
+    """Returns playlist info of ActivePlaylist value if it's valid."""
+    valid, info = tuple(value)
+    if valid:
+        return info
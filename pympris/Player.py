@@ -26,11 +26,18 @@ Usage::
 
 """
 
-from .common import convert2dbus
+from .common import (compile_signature, convert, convert_metadata, then,
+                     returns, native)
 from .Base import Base
 
 __all__ = ('Player', )
 
+_int64 = compile_signature('x')
+_double = compile_signature('d')
+_bool = compile_signature('b')
+_str = compile_signature('s')
+_path = compile_signature('o')
+
 
 class Player(Base):
 
@@ -41,41 +48,50 @@ class Player(Base):
     IFACE = "org.mpris.MediaPlayer2.Player"
     """The D-Bus MediaPlayer2.Player interface name"""
 
-    def __init__(self, name, bus=None, private=False):
-        super(Player, self).__init__(name, bus, private)
+    UNCACHED_PROPERTIES = frozenset(['Position'])
+
+    OPTIONAL_PROPERTIES = frozenset(['LoopStatus', 'Shuffle'])
 
+    @returns('')
     def Next(self):
         """Skips to the next track in the tracklist."""
-        self.iface.Next()
+        return self.iface.Next()
 
+    @returns('')
     def Previous(self):
         """Skips to the previous track in the tracklist."""
-        self.iface.Previous()
+        return self.iface.Previous()
 
+    @returns('')
     def Pause(self):
         """Pauses playback."""
-        self.iface.Pause()
+        return self.iface.Pause()
 
+    @returns('')
     def PlayPause(self):
         """Pauses playback."""
-        self.iface.PlayPause()
+        return self.iface.PlayPause()
 
+    @returns('')
     def Stop(self):
         """Stops playback."""
-        self.iface.Stop()
+        return self.iface.Stop()
 
+    @returns('')
     def Play(self):
         """Starts or resumes playback."""
-        self.iface.Play()
+        return self.iface.Play()
 
+    @returns('')
     def Seek(self, offset):
         """Seeks forward in the current track
 
         :param int offset: The number of microseconds to seek forward.
                            A negative value seeks back.
         """
-        self.iface.Seek(convert2dbus(offset, 'x'))
+        return self.iface.Seek(_int64(offset))
 
+    @returns('')
     def SetPosition(self, track_id, position):
         """Sets the current track position in microseconds.
 
@@ -87,9 +103,9 @@ class Player(Base):
         If the Position argument is greater than the track length, do nothing.
         If the CanSeek property is false, this has no effect.
         """
-        self.iface.SetPosition(convert2dbus(track_id, 'o'),
-                               convert2dbus(position, 'x'))
+        return self.iface.SetPosition(_path(track_id), _int64(position))
 
+    @returns('')
     def OpenUri(self, uri):
         """Opens the Uri given as an argument
 
@@ -104,7 +120,7 @@ class Player(Base):
         If the uri scheme or the mime-type of the uri to open is not supported,
         this method does nothing and may raise an error.
         """
-        self.iface.OpenUri(uri)
+        return self.iface.OpenUri(_str(uri))
 
     @property
     def PlaybackStatus(self):
@@ -126,7 +142,7 @@ class Player(Base):
                    the begining once it has finished playing
                 - "Playlist" if the playback loops through a list of tracks
         """
-        return self.get('LoopStatus')
+        return self._get_optional('LoopStatus')
 
     @LoopStatus.setter
     def LoopStatus(self, status):
@@ -140,7 +156,7 @@ class Player(Base):
                     the begining once it has finished playing
             "Playlist" if the playback loops through a list of tracks
         """
-        self.set('LoopStatus', status)
+        return self.set('LoopStatus', _str(status))
 
     @property
     def Rate(self):
@@ -155,7 +171,7 @@ class Player(Base):
     @Rate.setter
     def Rate(self, value):
         """The current playback rate."""
-        self.set('Rate', value)
+        return self.set('Rate', _double(value))
 
     @property
     def Shuffle(self):
@@ -167,7 +183,7 @@ class Player(Base):
         :setter: Sets a value of false indicates that playback.
         :type: bool
         """
-        return self.get('Shuffle')
+        return self._get_optional('Shuffle')
 
     @Shuffle.setter
     def Shuffle(self, value):
@@ -175,13 +191,24 @@ class Player(Base):
         is progressing linearly through a playlist, while true means playback
         is progressing through a playlist in some other order.
         """
-        self.set('Shuffle', value)
+        return self.set('Shuffle', _bool(value))
 
     @property
     def Metadata(self):
         """The metadata of the current element."""
         return self.get('Metadata')
 
+    @native
+    def get_metadata(self, compact=False):
+        """Returns the metadata of the current element.
+
+        :param bool compact: if True, return
+                             :class:`pympris.common.TrackMetadata`
+                             instead of dict.
+        """
+        return then(self.get('Metadata'),
+                    convert_metadata if compact else convert)
+
     @property
     def Volume(self):
         """The volume level
@@ -195,7 +222,7 @@ class Player(Base):
     @Volume.setter
     def Volume(self, value):
         """The volume level"""
-        self.set('Volume', value)
+        return self.set('Volume', _double(value))
 
     @property
     def Position(self):
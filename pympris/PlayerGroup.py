@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides a `PlayerGroup` class which sends the same command
+to several players at once.
+
+Calls are sent to all players without waiting for replies,
+so a command takes about one round-trip regardless of the number
+of players. A main loop isn't required.
+
+Usage::
+
+    group = PlayerGroup(MediaPlayer(name) for name in available_players())
+
+    reply = group.call('Pause', timeout=0.5)
+    for name, err in reply.errors.items():
+        print("%s didn't pause: %s" % (name, err))
+
+    group.set('Volume', 0.2)
+    print(group.call('Raise', interface='root').results)
+    print(group.get('PlaybackStatus').results)
+
+    # any properties of any players at once
+    status, volume, root = read_properties([(mp1, 'player', 'PlaybackStatus'),
+                                            (mp2, 'player', 'Volume'),
+                                            (mp2, 'root', None)])
+    if status.error is None:
+        print(status.value)
+"""
+
+from collections import namedtuple
+
+from .common import PyMPRISException
+from .PlayLists import PlayLists
+from .Player import Player
+from .Root import Root
+from .TrackList import TrackList
+
+__all__ = ('PlayerGroup', 'GroupReply', 'PropertyReply', 'read_properties', )
+
+GroupReply = namedtuple('GroupReply', 'results errors')
+"""Replies of players to a group command.
+`results` maps names of players which succeeded to their results,
+`errors` maps names of players which failed to
+:class:`pympris.common.PyMPRISException` objects."""
+
+PropertyReply = namedtuple('PropertyReply', 'value error')
+"""Reply to one read of :func:`read_properties`: `value` of the property
+or `error` (:class:`pympris.common.PyMPRISException`) if it failed."""
+
+
+_INTERFACES = {'root': Root, 'player': Player,
+               'track_list': TrackList, 'playlists': PlayLists}
+
+
+def read_properties(items, timeout=None):
+    """Reads properties of many players at once.
+
+    All Get/GetAll calls are sent before waiting for any reply,
+    so reading takes about one round-trip.
+
+    :param items: iterable of (media_player, interface, prop_name) tuples,
+                  where media_player is :class:`pympris.MediaPlayer`,
+                  interface is its attribute ('root', 'player',
+                  'track_list' or 'playlists') and prop_name is
+                  property name or None to read all properties.
+    :param float timeout: overall timeout in seconds;
+                          None means the player's default timeout.
+    :returns: list of :class:`PropertyReply` in order of `items`.
+    """
+    views = {}
+    pending = []
+    for mp, interface, prop_name in items:
+        try:
+            key = (id(mp), interface)
+            if key not in views:
+                views[key] = _async_view(mp, interface, timeout)
+            view = views[key]
+            if prop_name is None:
+                pending.append(view.get_all())
+            else:
+                attr = getattr(type(view), prop_name, None)
+                if isinstance(attr, property):
+                    # the getter unpacks and converts the value
+                    pending.append(attr.fget(view))
+                else:
+                    pending.append(view.get(prop_name))
+        except PyMPRISException as err:
+            pending.append(err)
+
+    replies = []
+    for reply in pending:
+        if isinstance(reply, PyMPRISException):
+            replies.append(PropertyReply(None, reply))
+            continue
+        try:
+            replies.append(PropertyReply(reply.result(), None))
+        except PyMPRISException as err:
+            replies.append(PropertyReply(None, err))
+    return replies
+
+
+def _async_view(mp, interface, timeout):
+    """Returns view of `mp`'s interface which doesn't wait for replies."""
+    iface = getattr(mp, interface)
+    if iface is None:
+        raise PyMPRISException("%s doesn't implement %s interface" %
+                               (mp.name, interface))
+    # each call's timeout is the overall timeout
+    # because all of them are sent at once
+    return iface._async_view(timeout)
+
+
+class PlayerGroup(object):
+
+    """Set of :class:`pympris.MediaPlayer` objects controlled together.
+
+    Players are keyed by their names (`MediaPlayer.name`).
+    """
+
+    def __init__(self, media_players=()):
+        """
+        :param media_players: :class:`pympris.MediaPlayer` objects.
+        """
+        self._media_players = {}
+        for mp in media_players:
+            self.add(mp)
+
+    def add(self, mp):
+        """Adds :class:`pympris.MediaPlayer` object to the group."""
+        self._media_players[mp.name] = mp
+
+    def remove(self, name):
+        """Removes player `name` from the group."""
+        del self._media_players[name]
+
+    def __getitem__(self, name):
+        return self._media_players[name]
+
+    def __contains__(self, name):
+        return name in self._media_players
+
+    def __iter__(self):
+        return iter(list(self._media_players))
+
+    def __len__(self):
+        return len(self._media_players)
+
+    def call(self, method, *args, **kwargs):
+        """Calls `method` of all players concurrently.
+
+        :param str method: method name, e.g. 'Pause'.
+        :param args: method's arguments.
+        :param str interface: attribute of :class:`pympris.MediaPlayer`
+                              implementing the method (default 'player').
+        :param float timeout: overall timeout in seconds;
+                              None means the player's default timeout.
+        :rtype: :class:`GroupReply`
+        """
+        interface = kwargs.pop('interface', 'player')
+        timeout = kwargs.pop('timeout', None)
+        if kwargs:
+            raise TypeError("Unexpected arguments %s" % ', '.join(kwargs))
+
+        def send(view):
+            return getattr(view, method)(*args)
+        return self._fan_out(interface, send, timeout)
+
+    def set(self, prop_name, value, interface='player', timeout=None):
+        """Sets property `prop_name` of all players concurrently.
+
+        :param str prop_name: property name, e.g. 'Volume'.
+        :param value: new value.
+        :param str interface: attribute of :class:`pympris.MediaPlayer`
+                              implementing the property (default 'player').
+        :param float timeout: overall timeout in seconds;
+                              None means the player's default timeout.
+        :rtype: :class:`GroupReply`
+        :raises ValueError: if `prop_name` isn't a writable property.
+        """
+        # check before sending anything to any player
+        cls = _INTERFACES.get(interface)
+        prop = getattr(cls, prop_name, None)
+        if not isinstance(prop, property) or prop.fset is None:
+            raise ValueError("%r isn't a writable property of %s interface"
+                             % (prop_name, interface))
+
+        def send(view):
+            # the property's setter converts the value to proper dbus type
+            return prop.fset(view, value)
+        return self._fan_out(interface, send, timeout)
+
+    def get(self, prop_name, interface='player', timeout=None):
+        """Reads property `prop_name` of all players concurrently.
+
+        :param str prop_name: property name, e.g. 'PlaybackStatus';
+                              None reads all properties.
+        :param str interface: attribute of :class:`pympris.MediaPlayer`
+                              implementing the property (default 'player').
+        :param float timeout: overall timeout in seconds;
+                              None means the player's default timeout.
+        :rtype: :class:`GroupReply`
+        """
+        names = list(self._media_players)
+        replies = read_properties(
+            [(self._media_players[name], interface, prop_name)
+             for name in names], timeout)
+        results = {}
+        errors = {}
+        for name, reply in zip(names, replies):
+            if reply.error is None:
+                results[name] = reply.value
+            else:
+                errors[name] = reply.error
+        return GroupReply(results, errors)
+
+    def _fan_out(self, interface, send, timeout):
+        """Sends calls to all players, then waits for all replies."""
+        pending = {}
+        errors = {}
+        for name, mp in self._media_players.items():
+            try:
+                pending[name] = send(_async_view(mp, interface, timeout))
+            except PyMPRISException as err:
+                errors[name] = err
+
+        results = {}
+        for name, reply in pending.items():
+            try:
+                results[name] = reply.result()
+            except PyMPRISException as err:
+                errors[name] = err
+        return GroupReply(results, errors)
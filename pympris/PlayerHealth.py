@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides a `PlayerHealth` class which tracks responsiveness
+of a player and stops calling it when it doesn't respond.
+
+:class:`pympris.MediaPlayer` shares one `PlayerHealth` object
+among its interfaces. After `failure_threshold` calls in a row
+time out the circuit opens: calls raise
+:class:`pympris.common.PyMPRISUnavailable` at once for `cool_down`
+seconds, then the player is pinged using org.freedesktop.DBus.Peer.Ping
+and calls are sent again if it answers.
+
+Usage::
+
+    mp = MediaPlayer('org.mpris.MediaPlayer2.vlc')
+    try:
+        mp.player.Next()
+    except PyMPRISUnavailable:
+        print("the player is hung")
+
+    # choose the fastest available player
+    players = [mp for mp in players if mp.health.available]
+    fastest = min(players, key=lambda mp: mp.health.latency or 0)
+"""
+
+import time
+
+import dbus
+
+from .common import effective_timeout
+from .core import (DBUS_EXCEPTIONS, PyMPRISTimeout, PyMPRISServiceUnknown,
+                   PyMPRISUnavailable)
+
+__all__ = ('PlayerHealth', )
+
+_monotonic = getattr(time, 'monotonic', time.time)
+
+PEER_IFACE = 'org.freedesktop.DBus.Peer'
+
+UNRESPONSIVE_ERRORS = frozenset(
+    dbus_name for dbus_name, cls in DBUS_EXCEPTIONS.items()
+    if issubclass(cls, (PyMPRISTimeout, PyMPRISServiceUnknown)))
+"""Names of dbus errors counted as failures of the player;
+other errors are replies, so the player is responsive."""
+
+
+def _unresponsive(err):
+    """Returns True if dbus or pympris exception `err` means
+    the player didn't respond."""
+    return err.get_dbus_name() in UNRESPONSIVE_ERRORS
+
+
+class PlayerHealth(object):
+
+    """Latency and failures of calls to one player with a circuit breaker.
+
+    The circuit is 'closed' while the player responds, 'open' during
+    `cool_down` seconds after `failure_threshold` failures in a row and
+    'half-open' after that until the next call pings the player.
+    """
+
+    def __init__(self, bus, bus_name, object_path, failure_threshold=3,
+                 cool_down=5.0, probe_timeout=0.5, smoothing=0.2):
+        """
+        :param bus: bus object.
+        :param str bus_name: unique or well-known objects name.
+        :param str object_path: objects path.
+        :param int failure_threshold: number of failures in a row
+                                      which opens the circuit.
+        :param float cool_down: seconds during which calls fail fast.
+        :param float probe_timeout: timeout of Ping probe in seconds.
+        :param float smoothing: weight of the last call's latency
+                                in :attr:`latency` (0 < smoothing <= 1).
+        """
+        self.bus = bus
+        """Bus object from the functions argument"""
+
+        self.bus_name = bus_name
+        """objects name from the functions argument"""
+
+        self.object_path = object_path
+        """objects path from the functions argument"""
+
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.probe_timeout = probe_timeout
+        self.smoothing = smoothing
+
+        self.latency = None
+        """Exponentially weighted moving average of calls' latency
+        in seconds or None if no call has completed yet"""
+
+        self.failures = 0
+        """Number of failed calls in a row"""
+
+        self._opened_at = None
+
+    @property
+    def state(self):
+        """State of the circuit: 'closed', 'open' or 'half-open'."""
+        if self._opened_at is None:
+            return 'closed'
+        if _monotonic() - self._opened_at < self.cool_down:
+            return 'open'
+        return 'half-open'
+
+    @property
+    def available(self):
+        """False if calls to the player fail fast now."""
+        return self.state != 'open'
+
+    def before_call(self):
+        """Checks the circuit before sending a call,
+        pings the player if the cool-down period is over.
+
+        :raises PyMPRISUnavailable: if the circuit is open
+                                    or the player doesn't answer ping.
+        """
+        if self._opened_at is None:
+            return
+        elapsed = _monotonic() - self._opened_at
+        if elapsed < self.cool_down:
+            raise PyMPRISUnavailable(
+                "%s doesn't respond, next attempt in %.1f seconds" %
+                (self.bus_name, self.cool_down - elapsed))
+        if not self.probe():
+            self._opened_at = _monotonic()
+            raise PyMPRISUnavailable("%s doesn't respond to ping" %
+                                     self.bus_name)
+
+    def probe(self):
+        """Pings the player; closes the circuit if it answers.
+
+        :returns: True if the player answered.
+        """
+        start = _monotonic()
+        try:
+            self.bus.call_blocking(self.bus_name, self.object_path,
+                                   PEER_IFACE, 'Ping', '', (),
+                                   timeout=effective_timeout(
+                                       self.probe_timeout))
+        except dbus.exceptions.DBusException:
+            return False
+        self.record(_monotonic() - start)
+        return True
+
+    def record(self, latency, error=None):
+        """Records completed call.
+
+        :param float latency: time of the call in seconds.
+        :param error: exception of the failed call or None.
+        """
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.smoothing * (latency - self.latency)
+        if error is not None and _unresponsive(error):
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self._opened_at = _monotonic()
+        else:
+            self.failures = 0
+            self._opened_at = None
+
+    def call(self, method, *args, **kwargs):
+        """Calls dbus `method` recording its result.
+
+        :raises PyMPRISUnavailable: if the circuit is open.
+        """
+        self.before_call()
+        start = _monotonic()
+        try:
+            result = method(*args, **kwargs)
+        except dbus.exceptions.DBusException as err:
+            self.record(_monotonic() - start, err)
+            raise
+        self.record(_monotonic() - start)
+        return result
+
+    def track(self, reply):
+        """Records result of :class:`pympris.common.PendingReply`
+        when it arrives.
+
+        :returns: `reply`.
+        """
+        start = _monotonic()
+        reply.add_done_callback(
+            lambda reply: self.record(_monotonic() - start, reply._exception))
+        return reply
+
+    def reset(self):
+        """Closes the circuit and forgets failures."""
+        self.failures = 0
+        self._opened_at = None
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides a `PlayerRegistry` class which keeps track of
+available players without polling the bus.
+
+The bus is scanned once, then the registry is updated
+by 'NameOwnerChanged' signal, so a main loop is required.
+
+Usage::
+
+    def added(name, owner):
+        print("Player appeared", name)
+        print(registry[name].root.Identity)
+
+    def removed(name, owner):
+        print("Player disappeared", name)
+
+    registry = PlayerRegistry(bus)
+    registry.register_added_handler(added)
+    registry.register_removed_handler(removed)
+
+    for name in registry:
+        print(name, registry.owner(name))
+"""
+
+import dbus
+
+from .common import convert, discover_players, MPRIS_NAME_PREFIX
+from .MediaPlayer import MediaPlayer
+
+__all__ = ('PlayerRegistry', )
+
+
+class PlayerRegistry(object):
+
+    """Live set of players which implement MPRIS2 interfaces.
+
+    Players are keyed by well-known names. :class:`pympris.MediaPlayer`
+    objects are created on first access and dropped when
+    the player disappears.
+    """
+
+    def __init__(self, bus=None, private=False, **kwargs):
+        """Scans the bus and subscribes to 'NameOwnerChanged' signal.
+
+        :param bus: bus object;
+                    new SessionBus() object will be created if value is None.
+        :param private: if True, create bus object using private connection
+                        (uses only if bus is None).
+        :param kwargs: arguments passed to :class:`pympris.MediaPlayer`.
+        """
+        if not bus:
+            bus = dbus.SessionBus(private=private)
+        self.bus = bus
+        """Bus object from the functions argument or SessionBus()"""
+
+        self._kwargs = kwargs
+        self._owners = {}
+        self._media_players = {}
+        self._added_handlers = []
+        self._removed_handlers = []
+
+        # subscribe before scanning to not miss changes in between
+        self._match = bus.add_signal_receiver(
+            self._name_owner_changed,
+            signal_name='NameOwnerChanged',
+            dbus_interface=dbus.BUS_DAEMON_IFACE,
+            bus_name=dbus.BUS_DAEMON_NAME,
+            path=dbus.BUS_DAEMON_PATH)
+        self._owners.update(discover_players(bus))
+
+    def register_added_handler(self, handler_function):
+        """register `handler_function` to be called when a player appears.
+
+        :param function handler_function: The function to be called
+                                          with well-known and unique names.
+        """
+        self._added_handlers.append(handler_function)
+
+    def register_removed_handler(self, handler_function):
+        """register `handler_function` to be called
+        when a player disappears.
+
+        :param function handler_function: The function to be called
+                                          with well-known and unique names.
+        """
+        self._removed_handlers.append(handler_function)
+
+    def owner(self, name):
+        """Returns unique name of the player's owner.
+
+        :param str name: well-known name of the player.
+        """
+        return self._owners[name]
+
+    def close(self):
+        """Stops tracking players."""
+        self._match.remove()
+        self._owners.clear()
+        for mp in self._media_players.values():
+            mp.dispatcher.close()
+        self._media_players.clear()
+
+    def __getitem__(self, name):
+        """Returns :class:`pympris.MediaPlayer` for well-known `name`."""
+        owner = self._owners[name]
+        try:
+            return self._media_players[name]
+        except KeyError:
+            mp = MediaPlayer(owner, self.bus, **self._kwargs)
+            self._media_players[name] = mp
+            return mp
+
+    def __contains__(self, name):
+        return name in self._owners
+
+    def __iter__(self):
+        return iter(list(self._owners))
+
+    def __len__(self):
+        return len(self._owners)
+
+    def _name_owner_changed(self, name, old_owner, new_owner):
+        if not name.startswith(MPRIS_NAME_PREFIX):
+            return
+        name, old_owner, new_owner = map(convert,
+                                         (name, old_owner, new_owner))
+        if old_owner and name in self._owners:
+            del self._owners[name]
+            mp = self._media_players.pop(name, None)
+            if mp is not None:
+                mp.dispatcher.close()
+            for handler in self._removed_handlers:
+                handler(name, old_owner)
+        if new_owner and self._owners.get(name) != new_owner:
+            self._owners[name] = new_owner
+            for handler in self._added_handlers:
+                handler(name, new_owner)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides a `PositionClock` class which tracks the playback position
+without polling the player.
+
+Position property isn't covered by 'PropertiesChanged' signal,
+so the clock reads it once and then extrapolates it locally
+using Rate and PlaybackStatus. It's resynchronized by signals,
+so a main loop is required.
+
+Usage::
+
+    clock = PositionClock(mp.player)
+
+    def update_progress_bar():
+        progress_bar.set_value(clock.position)
+        return True
+
+    gobject.timeout_add(100, update_progress_bar)
+"""
+
+import time
+
+__all__ = ('PositionClock', )
+
+_monotonic = getattr(time, 'monotonic', time.time)
+
+_SYNCED_PROPERTIES = frozenset(['Metadata', 'PlaybackStatus', 'Rate'])
+
+
+class PositionClock(object):
+
+    """Local estimate of the player's position in microseconds.
+
+    The position is read from the player on start, on 'Seeked' signal,
+    when the current track or Rate changes; between these events
+    reading :attr:`position` doesn't make any dbus calls.
+    """
+
+    def __init__(self, player):
+        """Reads the player's state and subscribes to its signals.
+
+        :param player: :class:`pympris.Player` object.
+        """
+        self.player = player
+        """:class:`pympris.Player` object from the functions argument"""
+
+        self._position = 0
+        self._timestamp = _monotonic()
+        self._playing = False
+        self._rate = 1.0
+        self._track_id = None
+        self._length = None
+
+        player.register_signal_handler('Seeked', self._seeked)
+        player.register_properties_handler(self._properties_changed)
+        self.sync()
+
+    def close(self):
+        """Stops following the player's signals."""
+        self.player.unregister_signal_handler('Seeked', self._seeked)
+        self.player.unregister_properties_handler(self._properties_changed)
+
+    @property
+    def position(self):
+        """Estimated position in microseconds,
+        between 0 and the track's length if it's known.
+
+        :type: int
+        """
+        position = self._position
+        if self._playing:
+            elapsed = _monotonic() - self._timestamp
+            position += elapsed * self._rate * 1000000
+        position = max(position, 0)
+        if self._length is not None:
+            position = min(position, self._length)
+        return int(position)
+
+    @property
+    def playing(self):
+        """True if the position is moving."""
+        return self._playing
+
+    @property
+    def length(self):
+        """Length of the current track in microseconds or None."""
+        return self._length
+
+    def sync(self):
+        """Reads Position, Rate, PlaybackStatus and Metadata
+        using one GetAll call."""
+        props = self.player.get_all()
+        self._rate = props.get('Rate', 1.0)
+        self._playing = props.get('PlaybackStatus') == 'Playing'
+        self._set_metadata(props.get('Metadata', {}))
+        if 'Position' in props:
+            self._set_position(props['Position'])
+        else:
+            self.sync_position()
+
+    def sync_position(self):
+        """Reads Position from the player."""
+        self._set_position(self.player.Position)
+
+    def _set_position(self, position):
+        self._position = position
+        self._timestamp = _monotonic()
+
+    def _set_metadata(self, metadata):
+        """Stores the track's id and length,
+        returns True if the track has changed."""
+        track_id = metadata.get('mpris:trackid')
+        self._length = metadata.get('mpris:length')
+        changed = track_id != self._track_id
+        self._track_id = track_id
+        return changed
+
+    def _seeked(self, position):
+        self._set_position(position)
+
+    def _properties_changed(self, changed_props, invalidated_props):
+        if _SYNCED_PROPERTIES.intersection(invalidated_props):
+            self.sync()
+            return
+
+        resync = False
+        if 'PlaybackStatus' in changed_props:
+            # keep the position reached by now and start/stop moving
+            self._set_position(self.position)
+            status = changed_props['PlaybackStatus']
+            self._playing = status == 'Playing'
+            # players usually rewind stopped tracks
+            resync = status == 'Stopped'
+        if 'Rate' in changed_props:
+            self._rate = changed_props['Rate']
+            resync = True
+        if 'Metadata' in changed_props:
+            resync |= self._set_metadata(changed_props['Metadata'])
+        if resync:
+            self.sync_position()
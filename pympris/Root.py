@@ -25,10 +25,13 @@ Usage::
         root.Quit()
 """
 
+from .common import compile_signature, returns
 from .Base import Base
 
 __all__ = ('Root', )
 
+_bool = compile_signature('b')
+
 
 class Root(Base):
 
@@ -39,6 +42,9 @@ class Root(Base):
     IFACE = "org.mpris.MediaPlayer2"
     """The D-Bus MediaPlayer2 interface name"""
 
+    OPTIONAL_PROPERTIES = frozenset(['Fullscreen', 'CanSetFullscreen'])
+
+    @returns('')
     def Raise(self):
         """Brings the media player's user interface to the front
         using any appropriate mechanism available.
@@ -46,8 +52,9 @@ class Root(Base):
         is displayed, or it may not have a graphical user interface at all.
         In this case, the CanRaise property is false
         and this method does nothing."""
-        self.iface.Raise()
+        return self.iface.Raise()
 
+    @returns('')
     def Quit(self):
         """Causes the media player to stop running.
         The media player may refuse to allow clients to shut it down.
@@ -59,7 +66,7 @@ class Root(Base):
         for example) should allow clients to use this method.
         Otherwise, it should not be needed.
         If the media player does not have a UI, this should be implemented."""
-        self.iface.Quit()
+        return self.iface.Quit()
 
     @property
     def CanQuit(self):
@@ -86,12 +93,12 @@ class Root(Base):
         However, even if it is true, the media player may still be unable
         to fulfil the request, in which case attempting to set this property
         will have no effect (but should not raise an error)."""
-        return self.get('Fullscreen')
+        return self._get_optional('Fullscreen')
 
     @Fullscreen.setter
     def Fullscreen(self, state):
         """Set Fullscreen property"""
-        self.set('Fullscreen', state)
+        return self.set('Fullscreen', _bool(state))
 
     @property
     def CanSetFullscreen(self):
@@ -104,7 +111,7 @@ class Root(Base):
         In this case, the value will not change.
         If the media player knows in advance that it will not be able
         to fulfil the request, however, this property should be false."""
-        return self.get('CanSetFullscreen')
+        return self._get_optional('CanSetFullscreen')
 
     @property
     def CanRaise(self):
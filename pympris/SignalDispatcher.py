@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides a `SignalDispatcher` class which receives all signals
+of a player's object using one match rule and routes them to handlers.
+
+:class:`pympris.MediaPlayer` shares one dispatcher among its interfaces,
+so handlers of all interfaces cost the bus daemon a single match rule.
+
+Usage::
+
+    dispatcher = SignalDispatcher(bus, 'org.mpris.MediaPlayer2.vlc',
+                                  '/org/mpris/MediaPlayer2')
+
+    def seeked(position):
+        print(position)
+
+    dispatcher.connect(Player.IFACE, 'Seeked', seeked)
+    ...
+    dispatcher.disconnect(Player.IFACE, 'Seeked', seeked)
+"""
+
+import logging
+
+__all__ = ('SignalDispatcher', )
+
+logger = logging.getLogger(__name__)
+
+try:
+    _string_types = basestring
+except NameError:
+    _string_types = str
+
+
+class SignalDispatcher(object):
+
+    """Routes signals of one object to handlers registered in-process.
+
+    The match rule is added when the first handler is connected
+    and removed when the last one is disconnected.
+    """
+
+    def __init__(self, bus, bus_name, object_path):
+        """
+        :param bus: bus object.
+        :param str bus_name: unique or well-known objects name.
+        :param str object_path: objects path.
+        """
+        self.bus = bus
+        """Bus object from the functions argument"""
+
+        self.bus_name = bus_name
+        """objects name from the functions argument"""
+
+        self.object_path = object_path
+        """objects path from the functions argument"""
+
+        self._handlers = {}
+        self._match = None
+
+    def connect(self, dbus_interface, signal_name, handler, arg0=None):
+        """Calls `handler` with arguments of matching signals.
+
+        :param str dbus_interface: interface name.
+        :param str signal_name: signal name; None matches all names.
+        :param function handler: The function to be called.
+        :param str arg0: if not None, matches only signals
+                         which first argument equals `arg0`.
+        """
+        key = (dbus_interface, signal_name, arg0)
+        self._handlers.setdefault(key, []).append(handler)
+        if self._match is None:
+            self._match = self.bus.add_signal_receiver(
+                self._dispatch,
+                bus_name=self.bus_name,
+                path=self.object_path,
+                interface_keyword='dbus_interface',
+                member_keyword='member')
+
+    def disconnect(self, dbus_interface, signal_name, handler, arg0=None):
+        """Stops calling `handler` connected with the same arguments.
+
+        :returns: the connected handler equal to `handler`.
+        :raises ValueError: if `handler` isn't connected.
+        """
+        key = (dbus_interface, signal_name, arg0)
+        handlers = self._handlers.get(key, [])
+        if handler not in handlers:
+            raise ValueError("%r isn't connected to %s.%s" %
+                             (handler, dbus_interface, signal_name))
+        handler = handlers.pop(handlers.index(handler))
+        if not handlers:
+            del self._handlers[key]
+        if not self._handlers and self._match is not None:
+            self._match.remove()
+            self._match = None
+        return handler
+
+    def close(self):
+        """Disconnects all handlers."""
+        self._handlers.clear()
+        if self._match is not None:
+            self._match.remove()
+            self._match = None
+
+    def __len__(self):
+        """Returns number of connected handlers."""
+        return sum(len(handlers) for handlers in self._handlers.values())
+
+    def _dispatch(self, *args, **kwargs):
+        dbus_interface = kwargs.pop('dbus_interface')
+        member = kwargs.pop('member')
+        keys = [(dbus_interface, member, None), (dbus_interface, None, None)]
+        if args and isinstance(args[0], _string_types):
+            keys.append((dbus_interface, member, args[0]))
+        for key in keys:
+            # copy: handlers may disconnect themselves
+            for handler in tuple(self._handlers.get(key, ())):
+                try:
+                    handler(*args)
+                except Exception:
+                    logger.exception("Error in handler of %s.%s signal",
+                                     dbus_interface, member)
@@ -16,13 +16,24 @@ Usage::
     print(tl.Tracks)
     tl.RemoveTrack(tl.Tracks[2])
 
+    for metadata in tl.iter_tracks_metadata(tl.Tracks, batch_size=50):
+        print(metadata.get('xesam:title'))
+
 """
 
-from .common import convert2dbus
+from collections import deque
+
+from .common import (compile_signature, convert, convert_metadata, then,
+                     returns, native)
 from .Base import Base
 
 __all__ = ('TrackList', )
 
+_paths = compile_signature('ao')
+_path = compile_signature('o')
+_bool = compile_signature('b')
+_str = compile_signature('s')
+
 
 class TrackList(Base):
 
@@ -33,18 +44,62 @@ class TrackList(Base):
     IFACE = "org.mpris.MediaPlayer2.TrackList"
     """The D-Bus MediaPlayer2.Player.TrackList interface name"""
 
-    def __init__(self, name, bus=None, private=False):
-        super(TrackList, self).__init__(name, bus, private)
-
-    def GetTracksMetadata(self, track_ids):
+    @native
+    def GetTracksMetadata(self, track_ids, compact=False):
         """Gets all the metadata available for a set of tracks.
 
         :param track_ids: list of track ids
+        :param bool compact: if True, return metadata as
+                             :class:`pympris.common.TrackMetadata`
+                             instead of dicts.
 
         :returns: Metadata of the set of tracks given as input.
         """
-        return self.iface.GetTracksMetadata(convert2dbus(track_ids, 'ao'))
-
+        return then(self.iface.GetTracksMetadata(_paths(track_ids)),
+                    convert_metadata if compact else convert)
+
+    @native
+    def iter_tracks_metadata(self, track_ids, batch_size=100, in_flight=2,
+                             compact=False):
+        """Gets metadata for a set of tracks in batches.
+
+        Splits `track_ids` into GetTracksMetadata calls of `batch_size`
+        ids each and keeps up to `in_flight` calls pending, so replies
+        stay small and the next batches are requested while the current
+        one is consumed.
+
+        :param track_ids: list of track ids.
+        :param int batch_size: maximum number of ids in one call.
+        :param int in_flight: maximum number of pending calls.
+        :param bool compact: if True, yield
+                             :class:`pympris.common.TrackMetadata`
+                             instead of dicts.
+        :returns: generator yielding metadata of each track, in order.
+        """
+        to_python = convert_metadata if compact else convert
+        if batch_size < 1 or in_flight < 1:
+            raise ValueError("batch_size and in_flight must be positive")
+        track_ids = list(track_ids)
+        starts = iter(range(0, len(track_ids), batch_size))
+        pending = deque()
+        try:
+            while True:
+                for start in starts:
+                    batch = _paths(track_ids[start:start + batch_size])
+                    pending.append(self.call_async(
+                        self.IFACE, 'GetTracksMetadata', (batch, ), 'ao'
+                    ).then(to_python))
+                    if len(pending) >= in_flight:
+                        break
+                if not pending:
+                    return
+                for metadata in pending.popleft().result():
+                    yield metadata
+        finally:
+            for reply in pending:
+                reply.cancel()
+
+    @returns('')
     def AddTrack(self, uri, after_track, set_as_current):
         """Adds a URI in the TrackList.
 
@@ -54,23 +109,24 @@ class TrackList(Base):
         :param bool set_as_current: Whether the newly inserted track
                                     should be considered as the current track.
         """
-        self.iface.AddTrack(uri,
-                            convert2dbus(after_track, 'o'),
-                            convert2dbus(set_as_current, 'b'))
+        return self.iface.AddTrack(_str(uri), _path(after_track),
+                                   _bool(set_as_current))
 
+    @returns('')
     def RemoveTrack(self, track_id):
         """Removes an item from the TrackList.
 
         :param str track_id: Identifier of the track to be removed.
         """
-        self.iface.RemoveTrack(convert2dbus(track_id, 'o'))
+        return self.iface.RemoveTrack(_path(track_id))
 
+    @returns('')
     def GoTo(self, track_id):
         """Skip to the specified TrackId.
 
         :param str track_id: Identifier of the track to skip to.
         """
-        self.iface.GoTo(convert2dbus(track_id, 'o'))
+        return self.iface.GoTo(_path(track_id))
 
     @property
     def Tracks(self):
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides a `TrackListMirror` class which keeps a client-side copy
+of the player's tracklist.
+
+The tracklist is loaded once and then updated by TrackList signals
+(TrackAdded, TrackRemoved, TrackMetadataChanged, TrackListReplaced),
+so a main loop is required.
+
+Usage::
+
+    mirror = TrackListMirror(mp.track_list)
+    for track_id in mirror:
+        print(mirror.metadata(track_id).get('xesam:title'))
+
+    print(mirror.index(track_id), len(mirror))
+"""
+
+from .common import TrackMetadata
+
+__all__ = ('TrackListMirror', 'NO_TRACK', )
+
+NO_TRACK = '/org/mpris/MediaPlayer2/TrackList/NoTrack'
+"""Special track id meaning "no track"."""
+
+
+class TrackListMirror(object):
+
+    """Client-side copy of the tracklist.
+
+    Track ids are kept in order; lookup of metadata and membership
+    by track id takes O(1). Metadata is cached as
+    :class:`pympris.common.TrackMetadata`: it's taken from signals
+    and requested from the player only for tracks without it.
+    The tracklist is reloaded if a signal refers to an unknown track.
+    """
+
+    def __init__(self, track_list, prefetch=False):
+        """Loads the tracklist and subscribes to TrackList signals.
+
+        :param track_list: :class:`pympris.TrackList` object.
+        :param bool prefetch: if True, load metadata of all tracks
+                              at once, otherwise load it on demand.
+        """
+        self.track_list = track_list
+        """:class:`pympris.TrackList` object from the functions argument"""
+
+        self._tracks = []
+        self._metadata = {}
+        self._positions = None
+
+        for signal_name, handler in self._signal_handlers():
+            track_list.register_signal_handler(signal_name, handler)
+
+        self.reload(prefetch)
+
+    def close(self):
+        """Stops following TrackList signals."""
+        for signal_name, handler in self._signal_handlers():
+            self.track_list.unregister_signal_handler(signal_name, handler)
+
+    def reload(self, prefetch=False):
+        """Reloads track ids and drops cached metadata.
+
+        :param bool prefetch: if True, load metadata of all tracks.
+        """
+        self._replace(self.track_list.Tracks, keep_metadata=False)
+        if prefetch:
+            self.fetch_metadata(self._tracks)
+
+    @property
+    def tracks(self):
+        """List of track ids in order."""
+        return list(self._tracks)
+
+    def index(self, track_id):
+        """Returns position of `track_id` in the tracklist.
+
+        :raises ValueError: if the track isn't in the tracklist.
+        """
+        if self._positions is None:
+            self._positions = dict((track, position)
+                                   for position, track
+                                   in enumerate(self._tracks))
+        try:
+            return self._positions[track_id]
+        except KeyError:
+            raise ValueError("%s is not in the tracklist" % track_id)
+
+    def metadata(self, track_id):
+        """Returns metadata of `track_id`,
+        requesting it from the player if it isn't cached.
+
+        :raises KeyError: if the track isn't in the tracklist.
+        """
+        metadata = self._metadata[track_id]
+        if metadata is None:
+            self.fetch_metadata([track_id])
+            metadata = self._metadata[track_id]
+        return metadata
+
+    def fetch_metadata(self, track_ids):
+        """Requests metadata of tracks which haven't it cached
+        using batched GetTracksMetadata calls.
+
+        :param track_ids: list of track ids.
+        """
+        missing = [track_id for track_id in track_ids
+                   if self._metadata.get(track_id, False) is None]
+        if not missing:
+            return
+        for metadata in self.track_list.iter_tracks_metadata(missing,
+                                                             compact=True):
+            track_id = metadata.get('mpris:trackid')
+            if track_id in self._metadata:
+                self._metadata[track_id] = metadata
+
+    def __len__(self):
+        return len(self._tracks)
+
+    def __iter__(self):
+        return iter(self._tracks)
+
+    def __contains__(self, track_id):
+        return track_id in self._metadata
+
+    def __getitem__(self, position):
+        return self._tracks[position]
+
+    def _signal_handlers(self):
+        return (('TrackAdded', self._track_added),
+                ('TrackRemoved', self._track_removed),
+                ('TrackMetadataChanged', self._track_metadata_changed),
+                ('TrackListReplaced', self._track_list_replaced))
+
+    def _replace(self, track_ids, keep_metadata):
+        old_metadata = self._metadata if keep_metadata else {}
+        self._tracks = list(track_ids)
+        self._metadata = dict((track_id, old_metadata.get(track_id))
+                              for track_id in self._tracks)
+        self._positions = None
+
+    def _track_added(self, metadata, after_track):
+        track_id = metadata['mpris:trackid']
+        if after_track == NO_TRACK:
+            position = 0
+        elif after_track in self._metadata:
+            position = self.index(after_track) + 1
+        else:
+            # the copy is out of sync (e.g. signals were missed)
+            self.reload()
+            if track_id in self._metadata:
+                self._metadata[track_id] = TrackMetadata(metadata)
+            return
+        if track_id in self._metadata:
+            # the track moves
+            if self.index(track_id) < position:
+                position -= 1
+            self._tracks.remove(track_id)
+        self._tracks.insert(position, track_id)
+        self._metadata[track_id] = TrackMetadata(metadata)
+        self._positions = None
+
+    def _track_removed(self, track_id):
+        if self._metadata.pop(track_id, False) is not False:
+            self._tracks.remove(track_id)
+            self._positions = None
+
+    def _track_metadata_changed(self, track_id, metadata):
+        if track_id not in self._metadata:
+            return
+        new_id = metadata.get('mpris:trackid', track_id)
+        if new_id != track_id:
+            # the track was replaced by a track with another id
+            self._tracks[self.index(track_id)] = new_id
+            del self._metadata[track_id]
+            self._positions = None
+        self._metadata[new_id] = TrackMetadata(metadata)
+
+    def _track_list_replaced(self, track_ids, current_track):
+        self._replace(track_ids, keep_metadata=True)
@@ -49,6 +49,9 @@ Usage::
         mp.track_list.RemoveTrack(tracks[-1])
         mp.track_list.GoTo(tracks[0])
 
+    # mp.track_list and mp.playlists are None
+    # if the player doesn't implement these interfaces
+
     n = mp.playlists.PlaylistCount
     ordering = pympris.PlaylistOrdering.LastPlayDate
     playlists = mp.playlists.GetPlaylists(0, n, ordering, reversed=False)
@@ -103,12 +106,33 @@ Usage::
 
 """
 
-from .MediaPlayer import MediaPlayer
-from .PlayLists import PlayLists, PlaylistOrdering
-from .Player import Player
-from .Root import Root
-from .TrackList import TrackList
-from .common import available_players, PyMPRISException
+from .core import (PyMPRISException, PyMPRISTimeout, PyMPRISUnavailable,
+                   PyMPRISServiceUnknown, PyMPRISNotSupported,
+                   PyMPRISUnknownMethod, PyMPRISUnknownProperty,
+                   PyMPRISInvalidArgs, PropertiesSnapshot,
+                   MediaPlayerSnapshot)
+
+try:
+    import dbus
+except ImportError:
+    # the asyncio client (pympris.aio) works without dbus-python
+    dbus = None
+
+if dbus is not None:
+    from .MediaPlayer import MediaPlayer
+    from .PlayLists import PlayLists, PlaylistOrdering
+    from .Player import Player
+    from .PlayerGroup import (PlayerGroup, GroupReply, PropertyReply,
+                              read_properties)
+    from .PlayerHealth import PlayerHealth
+    from .PlayerRegistry import PlayerRegistry
+    from .PositionClock import PositionClock
+    from .Root import Root
+    from .SignalDispatcher import SignalDispatcher
+    from .TrackList import TrackList
+    from .TrackListMirror import TrackListMirror
+    from .common import (available_players, discover_players, deadline,
+                         PendingReply, TrackMetadata)
 
 __version__ = '1.5dev'
 __description__ = 'Library to control media players using MPRIS2 interfaces'
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+This module provides a `Base` class used as a base class
+for implementing MPRIS2 interfaces on top of asyncio.
+"""
+
+import asyncio
+
+from jeepney import DBusAddress, MatchRule, message_bus, new_method_call
+
+from ..core import PropertiesSnapshot
+from .common import call, unwrap
+
+__all__ = ('Base', 'awaitable_property', )
+
+IPROPERTIES = "org.freedesktop.DBus.Properties"
+
+
+def awaitable_property(prop_name, doc=None):
+    """Returns read-only property which value is a coroutine
+    reading `prop_name` property::
+
+        volume = await player.Volume
+    """
+    return property(lambda self: self.get(prop_name), doc=doc)
+
+
+class Base(object):
+
+    """`Base` class provides common functionality
+    for other classes which implement MPRIS2 interfaces."""
+
+    OBJ_PATH = "/org/mpris/MediaPlayer2"
+
+    WRITABLE_PROPERTIES = {}
+    """Signatures of properties which can be changed using `set`."""
+
+    def __init__(self, name, router):
+        """Init inner attributes to work with dbus.
+
+        :param name: unique or well-known objects name
+        :param router: jeepney asyncio router (`jeepney.io.asyncio`).
+        """
+        self.router = router
+        """Router object from the functions argument"""
+
+        self.name = name
+        """objects name from the functions argument"""
+
+        self.address = DBusAddress(self.OBJ_PATH, name, self.IFACE)
+        """DBUS address of the interface (uses self.IFACE)"""
+
+        self.properties = DBusAddress(self.OBJ_PATH, name, IPROPERTIES)
+        """DBUS address of the interface to work with object's properties"""
+
+    async def call(self, method, signature=None, *args):
+        """Calls `method` of the interface and waits for the reply.
+
+        :param str method: method name.
+        :param str signature: signature of the arguments.
+        :returns: converted reply.
+        """
+        return await call(self.router,
+                          new_method_call(self.address, method,
+                                          signature, args))
+
+    async def get(self, prop_name):
+        """Returns property's value."""
+        return await call(self.router,
+                          new_method_call(self.properties, 'Get', 'ss',
+                                          (self.IFACE, prop_name)))
+
+    async def set(self, prop_name, value):
+        """Sets property's value.
+
+        :param str prop_name: property name,
+                              one of `WRITABLE_PROPERTIES` keys.
+        :param value: new value.
+        """
+        signature = self.WRITABLE_PROPERTIES[prop_name]
+        await call(self.router,
+                   new_method_call(self.properties, 'Set', 'ssv',
+                                   (self.IFACE, prop_name,
+                                    (signature, value))))
+
+    async def get_all(self):
+        """Reads all properties of the interface using one GetAll call.
+
+        :rtype: :class:`pympris.common.PropertiesSnapshot`
+        """
+        props = await call(self.router,
+                           new_method_call(self.properties, 'GetAll', 's',
+                                           (self.IFACE, )))
+        return PropertiesSnapshot(props)
+
+    async def _owner(self):
+        """Returns unique name of the object's owner.
+
+        Received signals contain only unique sender names."""
+        if self.name.startswith(':'):
+            return self.name
+        return await call(self.router, message_bus.GetNameOwner(self.name))
+
+    async def _receive(self, rule, skip=0):
+        """Async generator yielding arguments of messages matching `rule`
+        (without first `skip` arguments)."""
+        match = rule.serialise()
+        await call(self.router, message_bus.AddMatch(match))
+        rule.header_fields['sender'] = await self._owner()
+        try:
+            with self.router.filter(rule, queue=asyncio.Queue()) as queue:
+                while True:
+                    msg = await queue.get()
+                    yield unwrap(msg)[skip:]
+        finally:
+            await call(self.router, message_bus.RemoveMatch(match))
+
+    def signals(self, signal_name=None):
+        """Async iterator over signals of the interface.
+
+        Usage::
+
+            async for position, in player.signals('Seeked'):
+                print(position)
+
+        :param str signal_name: The signal name;
+                                None(default) matches all names.
+        :returns: list of signal's arguments.
+        """
+        rule = MatchRule(type='signal', sender=self.name,
+                         interface=self.IFACE, member=signal_name,
+                         path=self.OBJ_PATH)
+        return self._receive(rule)
+
+    def properties_changes(self):
+        """Async iterator over 'PropertiesChanged' signals of the interface.
+
+        Usage::
+
+            async for changed_props, invalidated_props in \\
+                    player.properties_changes():
+                print(changed_props)
+
+        :returns: list [changed properties dict, invalidated properties].
+        """
+        rule = MatchRule(type='signal', sender=self.name,
+                         interface=IPROPERTIES, member='PropertiesChanged',
+                         path=self.OBJ_PATH)
+        rule.add_arg_condition(0, self.IFACE)
+        return self._receive(rule, skip=1)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides an asyncio version of :class:`pympris.MediaPlayer`.
+
+Usage::
+
+    async with open_dbus_router() as router:
+        mp = MediaPlayer('org.mpris.MediaPlayer2.rhythmbox', router)
+        print(await mp.root.Identity)
+        if await mp.player.CanGoNext:
+            await mp.player.Next()
+"""
+
+import asyncio
+
+from ..core import PyMPRISException, MediaPlayerSnapshot
+from .Root import Root
+from .Player import Player
+from .PlayLists import PlayLists
+from .TrackList import TrackList
+
+__all__ = ('MediaPlayer', )
+
+
+class MediaPlayer(object):
+
+    """Class implements all MPRIS2 interfaces."""
+
+    def __init__(self, dbus_name, router):
+        super(MediaPlayer, self).__init__()
+        self.root = Root(dbus_name, router)
+        """Instance of :class:`pympris.aio.Root` class"""
+
+        self.player = Player(dbus_name, router)
+        """Instance of :class:`pympris.aio.Player` class"""
+
+        self.playlists = PlayLists(dbus_name, router)
+        """Instance of :class:`pympris.aio.PlayLists` class"""
+
+        self.track_list = TrackList(dbus_name, router)
+        """Instance of :class:`pympris.aio.TrackList` class"""
+
+    async def snapshot(self):
+        """Reads properties of all interfaces concurrently
+        using one GetAll call per interface.
+
+        :rtype: :class:`pympris.MediaPlayerSnapshot`
+        """
+        snapshots = await asyncio.gather(
+            self.root.get_all(), self.player.get_all(),
+            self.playlists.get_all(), self.track_list.get_all(),
+            return_exceptions=True)
+        for index, snapshot in enumerate(snapshots):
+            if not isinstance(snapshot, BaseException):
+                continue
+            # playlists and track_list interfaces are optional
+            if index < 2 or not isinstance(snapshot, PyMPRISException):
+                raise snapshot
+            snapshots[index] = None
+        return MediaPlayerSnapshot(*snapshots)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides an asyncio version of :class:`pympris.PlayLists`.
+
+Usage::
+
+    pl = PlayLists('org.mpris.MediaPlayer2.rhythmbox', router)
+    print(await pl.PlaylistCount)
+
+    items = await pl.GetPlaylists(0, 100, PlaylistOrdering.Alphabetical,
+                                  reversed=False)
+    for uri, name, icon_uri in items:
+        print(uri, name, icon_uri)
+"""
+
+from .Base import Base, awaitable_property
+
+__all__ = ('PlayLists', )
+
+
+class PlayLists(Base):
+
+    """Class implements methods and properties
+    to work with MPRIS2 Playlists interface.
+    See :class:`pympris.PlayLists` for details.
+    """
+
+    IFACE = "org.mpris.MediaPlayer2.Playlists"
+    """The D-Bus MediaPlayer2.Playlists interface name"""
+
+    async def ActivatePlaylist(self, playlist_id):
+        """Starts playing the given playlist.
+
+        :param: str playlist_id: The id of the playlist to activate.
+        """
+        await self.call('ActivatePlaylist', 'o', playlist_id)
+
+    async def GetPlaylists(self, start, max_count, order, reversed):
+        """Gets a set of playlists.
+
+        :param int start: The index of the first playlist to be fetched
+                           (according to the ordering).
+        :param int max_count: The maximum number of playlists to fetch.
+        :param str order: The ordering that should be used.
+        :param bool reversed: Whether the order should be reversed.
+        """
+        return await self.call('GetPlaylists', 'uusb',
+                               start, max_count, order, reversed)
+
+    PlaylistCount = awaitable_property('PlaylistCount')
+    Orderings = awaitable_property('Orderings')
+
+    @property
+    def ActivePlaylist(self):
+        """The currently-active playlist."""
+        return self._active_playlist()
+
+    async def _active_playlist(self):
+        valid, info = await self.get('ActivePlaylist')
+        if valid:
+            return info
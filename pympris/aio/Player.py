@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides an asyncio version of :class:`pympris.Player`.
+
+Usage::
+
+    player = Player('org.mpris.MediaPlayer2.vlc', router)
+    if await player.CanPause:
+        await player.PlayPause()
+
+    await player.set('Volume', await player.Volume * 2)
+
+    async for position, in player.signals('Seeked'):
+        print(position)
+"""
+
+from .Base import Base, awaitable_property
+
+__all__ = ('Player', )
+
+
+class Player(Base):
+
+    """Class implements methods and properties
+    to work with MPRIS2 Player interface.
+    See :class:`pympris.Player` for details.
+    """
+
+    IFACE = "org.mpris.MediaPlayer2.Player"
+    """The D-Bus MediaPlayer2.Player interface name"""
+
+    WRITABLE_PROPERTIES = {'LoopStatus': 's', 'Rate': 'd',
+                           'Shuffle': 'b', 'Volume': 'd'}
+
+    async def Next(self):
+        """Skips to the next track in the tracklist."""
+        await self.call('Next')
+
+    async def Previous(self):
+        """Skips to the previous track in the tracklist."""
+        await self.call('Previous')
+
+    async def Pause(self):
+        """Pauses playback."""
+        await self.call('Pause')
+
+    async def PlayPause(self):
+        """Pauses playback."""
+        await self.call('PlayPause')
+
+    async def Stop(self):
+        """Stops playback."""
+        await self.call('Stop')
+
+    async def Play(self):
+        """Starts or resumes playback."""
+        await self.call('Play')
+
+    async def Seek(self, offset):
+        """Seeks forward in the current track
+
+        :param int offset: The number of microseconds to seek forward.
+                           A negative value seeks back.
+        """
+        await self.call('Seek', 'x', offset)
+
+    async def SetPosition(self, track_id, position):
+        """Sets the current track position in microseconds.
+
+        :param str track_id: The currently playing track's identifier.
+        :param int position: Track position in microseconds.
+        """
+        await self.call('SetPosition', 'ox', track_id, position)
+
+    async def OpenUri(self, uri):
+        """Opens the Uri given as an argument
+
+        :param str uri: Uri of the track to load.
+        """
+        await self.call('OpenUri', 's', uri)
+
+    PlaybackStatus = awaitable_property('PlaybackStatus')
+    LoopStatus = awaitable_property('LoopStatus')
+    Rate = awaitable_property('Rate')
+    Shuffle = awaitable_property('Shuffle')
+    Metadata = awaitable_property('Metadata')
+    Volume = awaitable_property('Volume')
+    Position = awaitable_property('Position')
+    MinimumRate = awaitable_property('MinimumRate')
+    MaximumRate = awaitable_property('MaximumRate')
+    CanGoNext = awaitable_property('CanGoNext')
+    CanGoPrevious = awaitable_property('CanGoPrevious')
+    CanPlay = awaitable_property('CanPlay')
+    CanPause = awaitable_property('CanPause')
+    CanSeek = awaitable_property('CanSeek')
+    CanControl = awaitable_property('CanControl')
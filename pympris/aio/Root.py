@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides an asyncio version of :class:`pympris.Root`.
+
+Usage::
+
+    root = Root('org.mpris.MediaPlayer2.vlc', router)
+    print(await root.Identity)
+
+    if await root.CanRaise:
+        await root.Raise()
+"""
+
+from .Base import Base, awaitable_property
+
+__all__ = ('Root', )
+
+
+class Root(Base):
+
+    """Class implements methods and properties
+    to work with MPRIS2 MediaPlayer2 interface.
+    See :class:`pympris.Root` for details.
+    """
+
+    IFACE = "org.mpris.MediaPlayer2"
+    """The D-Bus MediaPlayer2 interface name"""
+
+    WRITABLE_PROPERTIES = {'Fullscreen': 'b'}
+
+    async def Raise(self):
+        """Brings the media player's user interface to the front."""
+        await self.call('Raise')
+
+    async def Quit(self):
+        """Causes the media player to stop running."""
+        await self.call('Quit')
+
+    CanQuit = awaitable_property('CanQuit')
+    Fullscreen = awaitable_property('Fullscreen')
+    CanSetFullscreen = awaitable_property('CanSetFullscreen')
+    CanRaise = awaitable_property('CanRaise')
+    HasTrackList = awaitable_property('HasTrackList')
+    Identity = awaitable_property('Identity')
+    DesktopEntry = awaitable_property('DesktopEntry')
+    SupportedUriSchemes = awaitable_property('SupportedUriSchemes')
+    SupportedMimeTypes = awaitable_property('SupportedMimeTypes')
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides an asyncio version of :class:`pympris.TrackList`.
+
+Usage::
+
+    tl = TrackList('org.mpris.MediaPlayer2.vlc', router)
+    tracks = await tl.Tracks
+    await tl.RemoveTrack(tracks[2])
+"""
+
+from .Base import Base, awaitable_property
+
+__all__ = ('TrackList', )
+
+
+class TrackList(Base):
+
+    """Class implements methods and properties
+    to work with MPRIS2 TrackList interface.
+    See :class:`pympris.TrackList` for details.
+    """
+
+    IFACE = "org.mpris.MediaPlayer2.TrackList"
+    """The D-Bus MediaPlayer2.Player.TrackList interface name"""
+
+    async def GetTracksMetadata(self, track_ids):
+        """Gets all the metadata available for a set of tracks.
+
+        :param track_ids: list of track ids
+
+        :returns: Metadata of the set of tracks given as input.
+        """
+        return await self.call('GetTracksMetadata', 'ao', track_ids)
+
+    async def AddTrack(self, uri, after_track, set_as_current):
+        """Adds a URI in the TrackList.
+
+        :param str uri: The uri of the item to add.
+        :param str after_track: The identifier of the track
+                                after which the new item should be inserted.
+        :param bool set_as_current: Whether the newly inserted track
+                                    should be considered as the current track.
+        """
+        await self.call('AddTrack', 'sob', uri, after_track, set_as_current)
+
+    async def RemoveTrack(self, track_id):
+        """Removes an item from the TrackList.
+
+        :param str track_id: Identifier of the track to be removed.
+        """
+        await self.call('RemoveTrack', 'o', track_id)
+
+    async def GoTo(self, track_id):
+        """Skip to the specified TrackId.
+
+        :param str track_id: Identifier of the track to skip to.
+        """
+        await self.call('GoTo', 'o', track_id)
+
+    Tracks = awaitable_property('Tracks')
+    CanEditTracks = awaitable_property('CanEditTracks')
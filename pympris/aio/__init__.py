@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""Asyncio client for MPRIS2 interfaces.
+
+It mirrors :class:`pympris.MediaPlayer` and interface classes,
+but methods and properties are awaitable and signals are received
+using async iterators. It's built on top of jeepney
+(`pip install jeepney`) and doesn't block the event loop.
+It requires python 3.6 or newer.
+
+Writable properties are changed using `set` method
+as python doesn't support asynchronous setters.
+
+Usage::
+
+    import asyncio
+    from jeepney.io.asyncio import open_dbus_router
+
+    from pympris import aio
+
+
+    async def main():
+        async with open_dbus_router() as router:
+            players_ids = list(await aio.available_players(router))
+            mp = aio.MediaPlayer(players_ids[0], router)
+
+            print(await mp.root.Identity)
+            if await mp.player.CanPause:
+                await mp.player.PlayPause()
+            await mp.player.set('Volume', 0.5)
+
+            async for changed_props, invalidated_props in \\
+                    mp.player.properties_changes():
+                print(changed_props)
+
+    asyncio.run(main())
+"""
+
+from .MediaPlayer import MediaPlayer
+from .PlayLists import PlayLists
+from .Player import Player
+from .Root import Root
+from .TrackList import TrackList
+from .common import available_players
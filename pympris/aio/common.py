@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides helper functions for the asyncio client.
+
+jeepney returns plain python values except variants
+which are (signature, value) pairs, so replies are unwrapped
+according their signatures.
+"""
+
+import asyncio
+
+from jeepney import HeaderFields, MessageType, message_bus
+
+from ..core import dbus_error, PyMPRISException, MPRIS_NAME_PREFIX
+
+__all__ = ('call', 'unwrap', 'available_players', )
+
+_BASIC_CODES = frozenset('ybnqiuxtdhsog')
+
+_unwrappers = {}
+
+
+def _parse(signature, pos):
+    """Parses one complete type starting at `signature[pos]`.
+
+    :returns: tuple (unwrapper, end position);
+              unwrapper is None if the value doesn't contain variants.
+    """
+    code = signature[pos]
+    if code in _BASIC_CODES:
+        return None, pos + 1
+
+    if code == 'v':
+        return _unwrap_variant, pos + 1
+
+    if code == '(':
+        fields = []
+        end = pos + 1
+        while signature[end] != ')':
+            field, end = _parse(signature, end)
+            fields.append(field)
+        if not any(fields):
+            return None, end + 1
+        return (lambda value: tuple([field(item) if field else item
+                                     for field, item in zip(fields, value)]),
+                end + 1)
+
+    if code == 'a' and signature[pos + 1] == '{':
+        _, end = _parse(signature, pos + 2)
+        item, end = _parse(signature, end)
+        if item is None:
+            return None, end + 1
+        return (lambda value: {key: item(obj) for key, obj in value.items()},
+                end + 1)
+
+    if code == 'a':
+        item, end = _parse(signature, pos + 1)
+        if item is None:
+            return None, end
+        return lambda value: [item(obj) for obj in value], end
+
+    raise ValueError("Unknown type code %r in signature %r" %
+                     (code, signature))
+
+
+def _unwrappers_for(signature):
+    """Returns unwrappers for each complete type of `signature`."""
+    try:
+        return _unwrappers[signature]
+    except KeyError:
+        pass
+    funcs = []
+    pos = 0
+    while pos < len(signature):
+        func, pos = _parse(signature, pos)
+        funcs.append(func)
+    _unwrappers[signature] = funcs
+    return funcs
+
+
+def _unwrap_variant(value):
+    signature, obj = value
+    func, = _unwrappers_for(signature)
+    return func(obj) if func else obj
+
+
+def unwrap(msg):
+    """Returns message's body without variant wrappers.
+
+    :param msg: jeepney message.
+    :returns: list of arguments.
+    """
+    signature = msg.header.fields.get(HeaderFields.signature, '')
+    return [func(arg) if func else arg
+            for func, arg in zip(_unwrappers_for(signature), msg.body)]
+
+
+async def call(router, msg):
+    """Sends method call `msg` and waits for the reply.
+
+    :param router: jeepney asyncio router.
+    :param msg: jeepney method call message.
+    :returns: None, a value or a tuple of values like dbus-python does.
+    :raises PyMPRISException: if the reply is an error.
+    """
+    reply = await router.send_and_get_reply(msg)
+    if reply.header.message_type is MessageType.error:
+        raise dbus_error(reply.header.fields.get(HeaderFields.error_name),
+                         *reply.body)
+    args = unwrap(reply)
+    if not args:
+        return None
+    if len(args) == 1:
+        return args[0]
+    return tuple(args)
+
+
+async def available_players(router):
+    """Searchs and returns set of unique names of objects
+    which implements MPRIS2 interfaces.
+
+    Owners of all names are requested concurrently.
+
+    :param router: jeepney asyncio router.
+    :returns: set of unique names.
+    :type: set
+    """
+    names = await call(router, message_bus.ListNames())
+    owners = await asyncio.gather(*[
+        call(router, message_bus.GetNameOwner(name))
+        for name in names if name.startswith(MPRIS_NAME_PREFIX)],
+        return_exceptions=True)
+    players = set()
+    for owner in owners:
+        if isinstance(owner, PyMPRISException):
+            # the name has been released since ListNames call
+            continue
+        if isinstance(owner, BaseException):
+            raise owner
+        players.add(owner)
+    return players
@@ -9,17 +9,145 @@ Module provides helper functions.
 """
 
 import sys
+import time
+import threading
 import types
-from collections import namedtuple
+from contextlib import contextmanager
 from functools import wraps, partial
 
+try:
+    from collections.abc import Mapping, MutableMapping, Sequence
+except ImportError:
+    from collections import Mapping, MutableMapping, Sequence
+
 import dbus
 
+from .core import (MPRIS_NAME_PREFIX, PyMPRISException, PyMPRISTimeout,
+                   dbus_error, PropertiesSnapshot)
+
 __all__ = ('signal_wrapper', 'filter_properties_signals', 'convert2dbus',
-           'ExceptionMeta', 'ConverterMeta', )
+           'compile_signature', 'ExceptionMeta', 'ConverterMeta',
+           'WrapperMeta', 'returns', 'native', 'deadline',
+           'effective_timeout', 'PropertiesSnapshot', 'PendingReply',
+           'TrackMetadata', 'convert_metadata', 'lazy_convert',
+           'LazySequence', 'LazyMapping', )
 
 PY3 = (sys.version_info[0] == 3)
-MPRIS_NAME_PREFIX = "org.mpris.MediaPlayer2"
+
+_monotonic = getattr(time, 'monotonic', time.time)
+
+if PY3:
+    _intern = sys.intern
+else:
+    def _intern(key):
+        # intern() accepts only byte strings in python 2
+        return intern(key) if isinstance(key, str) else key
+_BASIC_TYPES = {
+    'b': dbus.Boolean, 'y': dbus.Byte, 'n': dbus.Int16,
+    'i': dbus.Int32, 'x': dbus.Int64, 'q': dbus.UInt16, 'u': dbus.UInt32,
+    't': dbus.UInt64, 'd': dbus.Double, 'o': dbus.ObjectPath,
+    'g': dbus.Signature, 's': dbus.String if PY3 else dbus.UTF8String}
+"""Maps basic dbus type codes to dbus types."""
+
+_compiled_signatures = {}
+
+
+def _compile(signature, pos):
+    """Compiles one complete type starting at `signature[pos]`.
+
+    :returns: tuple (converter, end position, nested) where nested is True
+              if items of a container must be converted one by one
+              (False means the container's signature is enough
+              for dbus-python to marshal them).
+    """
+    try:
+        code = signature[pos]
+    except IndexError:
+        raise ValueError("Incomplete signature %r" % signature)
+
+    if code in _BASIC_TYPES:
+        return _BASIC_TYPES[code], pos + 1, False
+
+    if code == 'v':
+        # dbus-python guesses variant's type from the value
+        return None, pos + 1, False
+
+    if code == '(':
+        fields = []
+        end = pos + 1
+        while end < len(signature) and signature[end] != ')':
+            field, end, _ = _compile(signature, end)
+            fields.append(field)
+        if end >= len(signature) or not fields:
+            raise ValueError("Invalid struct in signature %r" % signature)
+        return (partial(_to_struct, tuple(fields), signature[pos + 1:end]),
+                end + 1, True)
+
+    if code == 'a' and signature[pos + 1:pos + 2] == '{':
+        key, end, _ = _compile(signature, pos + 2)
+        if signature[pos + 2] not in _BASIC_TYPES:
+            raise ValueError("Invalid dict key in signature %r" % signature)
+        value, end, nested = _compile(signature, end)
+        if signature[end:end + 1] != '}':
+            raise ValueError("Invalid dict entry in signature %r" % signature)
+        entry_signature = signature[pos + 2:end]
+        if nested:
+            return (partial(_to_dict, value, entry_signature), end + 1, True)
+        return (partial(dbus.Dictionary, signature=entry_signature),
+                end + 1, True)
+
+    if code == 'a':
+        item, end, nested = _compile(signature, pos + 1)
+        item_signature = signature[pos + 1:end]
+        if nested:
+            return partial(_to_array, item, item_signature), end, True
+        return partial(dbus.Array, signature=item_signature), end, True
+
+    raise ValueError("Unknown type code %r in signature %r" %
+                     (code, signature))
+
+
+def _to_array(item, item_signature, value):
+    return dbus.Array([item(obj) for obj in value], signature=item_signature)
+
+
+def _to_dict(item, entry_signature, value):
+    return dbus.Dictionary({key: item(obj) for key, obj in value.items()},
+                           signature=entry_signature)
+
+
+def _to_struct(fields, fields_signature, value):
+    return dbus.Struct([field(obj) if field else obj
+                        for field, obj in zip(fields, value)],
+                       signature=fields_signature)
+
+
+def compile_signature(signature):
+    """Returns a function which converts a value from python to dbus type
+    according `signature`.
+
+    Supports any single complete type including nested containers
+    (e.g. 'a{sv}', '(oss)', 'aa{sv}'). Compiled functions are cached.
+
+    :param str signature: dbus type signature.
+    :returns: function taking a python value and returning dbus object.
+    :raises ValueError: if `signature` isn't a single complete type.
+    """
+    try:
+        return _compiled_signatures[signature]
+    except KeyError:
+        pass
+    func, end, _ = _compile(signature, 0)
+    if end != len(signature):
+        raise ValueError("%r is not a single complete type" % signature)
+    if func is None:
+        func = _variant
+    _compiled_signatures[signature] = func
+    return func
+
+
+def _variant(value):
+    return value
 
 
 def convert2dbus(value, signature):
@@ -29,15 +157,48 @@ def convert2dbus(value, signature):
     :param str signature: dbus type signature.
     :returns: value in dbus type.
     """
-    if len(signature) == 2 and signature.startswith('a'):
-        return dbus.Array(value, signature=signature[-1])
-    dbus_string_type = dbus.String if PY3 else dbus.UTF8String
-    type_map = {
-        'b': dbus.Boolean, 'y': dbus.Byte, 'n': dbus.Int16,
-        'i': dbus.Int32, 'x': dbus.Int64, 'q': dbus.UInt16, 'u': dbus.UInt32,
-        't': dbus.UInt64, 'd': dbus.Double, 'o': dbus.ObjectPath,
-        'g': dbus.Signature, 's': dbus_string_type}
-    return type_map[signature](value)
+    return compile_signature(signature)(value)
+
+
+def _convert_array(dbus_obj):
+    return [convert(item) for item in dbus_obj]
+
+
+def _convert_struct(dbus_obj):
+    return tuple([convert(item) for item in dbus_obj])
+
+
+def _convert_dict(dbus_obj):
+    return {convert(key): convert(value) for key, value in dbus_obj.items()}
+
+
+_CONVERT_RULES = (
+    ((dbus.Byte, dbus.Int16, dbus.Int32, dbus.Int64,
+      dbus.UInt16, dbus.UInt32, dbus.UInt64), int),
+    ((dbus.Boolean, ), bool),
+    ((dbus.Double, ), float),
+    ((dbus.Array, ), _convert_array),
+    ((dbus.Struct, ), _convert_struct),
+    ((dbus.ObjectPath, dbus.Signature, dbus.String) +
+     (() if PY3 else (dbus.UTF8String, )), str if PY3 else unicode),
+    ((dbus.Dictionary, ), _convert_dict),
+)
+"""Converters for dbus types in order of priority."""
+
+_CONVERTERS = dict((dbus_type, pytype)
+                   for dbus_types, pytype in _CONVERT_RULES
+                   for dbus_type in dbus_types)
+"""Maps exact dbus type to its converter.
+Other types are resolved once by `_find_converter` and memoized here."""
+
+
+def _find_converter(obj_type):
+    """Returns converter for subclasses of dbus types
+    or None for types which don't need converting."""
+    for dbus_types, pytype in _CONVERT_RULES:
+        if issubclass(obj_type, dbus_types):
+            return pytype
+    return None
 
 
 def convert(dbus_obj):
@@ -46,35 +207,93 @@ def convert(dbus_obj):
     :param dbus_obj: dbus object.
     :returns: dbus_obj in python type.
     """
-    _isinstance = partial(isinstance, dbus_obj)
-    ConvertType = namedtuple('ConvertType', 'pytype dbustypes')
-
-    pyint = ConvertType(int, (dbus.Byte, dbus.Int16, dbus.Int32, dbus.Int64,
-                              dbus.UInt16, dbus.UInt32, dbus.UInt64))
-    pybool = ConvertType(bool, (dbus.Boolean, ))
-    pyfloat = ConvertType(float, (dbus.Double, ))
-    pylist = ConvertType(lambda _obj: list(map(convert, dbus_obj)),
-                         (dbus.Array, ))
-    pytuple = ConvertType(lambda _obj: tuple(map(convert, dbus_obj)),
-                          (dbus.Struct, ))
-    types_str = (dbus.ObjectPath, dbus.Signature, dbus.String)
-    if not PY3:
-        types_str += (dbus.UTF8String,)
-    pystr = ConvertType(str if PY3 else unicode, types_str)
-
-    pydict = ConvertType(
-        lambda _obj: dict(zip(map(convert, dbus_obj.keys()),
-                              map(convert, dbus_obj.values())
-                              )
-                          ),
-        (dbus.Dictionary, )
-    )
-
-    for conv in (pyint, pybool, pyfloat, pylist, pytuple, pystr, pydict):
-        if any(map(_isinstance, conv.dbustypes)):
-            return conv.pytype(dbus_obj)
-    else:
+    obj_type = type(dbus_obj)
+    try:
+        pytype = _CONVERTERS[obj_type]
+    except KeyError:
+        pytype = _CONVERTERS[obj_type] = _find_converter(obj_type)
+    if pytype is None:
         return dbus_obj
+    return pytype(dbus_obj)
+
+
+def lazy_convert(dbus_obj):
+    """Converts dbus_obj from dbus type to python type lazily.
+
+    Arrays and dictionaries are wrapped by read-only views
+    which convert items only when they are accessed;
+    other values are converted immediately.
+
+    :param dbus_obj: dbus object.
+    :returns: :class:`LazySequence`, :class:`LazyMapping`
+              or dbus_obj in python type.
+    """
+    if isinstance(dbus_obj, dbus.Dictionary):
+        return LazyMapping(dbus_obj)
+    if isinstance(dbus_obj, dbus.Array):
+        return LazySequence(dbus_obj)
+    if isinstance(dbus_obj, dbus.Struct):
+        return tuple([lazy_convert(item) for item in dbus_obj])
+    return convert(dbus_obj)
+
+
+class LazySequence(Sequence):
+
+    """Read-only view of a dbus array converting items on access."""
+
+    __slots__ = ('_items', )
+
+    def __init__(self, items):
+        self._items = items
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazySequence(self._items[index])
+        return lazy_convert(self._items[index])
+
+    def __len__(self):
+        return len(self._items)
+
+    def __eq__(self, other):
+        # strings are sequences too, but never equal to an array
+        if not isinstance(other, (list, tuple, LazySequence)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, list(self))
+
+
+class LazyMapping(Mapping):
+
+    """Read-only view of a dbus dictionary converting values on access."""
+
+    __slots__ = ('_items', )
+
+    def __init__(self, items):
+        self._items = items
+
+    def __getitem__(self, key):
+        return lazy_convert(self._items[key])
+
+    def __iter__(self):
+        for key in self._items:
+            yield convert(key)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, dict(self))
 
 
 def converter(f):
@@ -92,33 +311,366 @@ def exception_wrapper(f):
         try:
             return f(*args, **kwds)
         except dbus.exceptions.DBusException as err:
-            _args = err.args
-            raise PyMPRISException(*_args)
+            raise pympris_exception(err)
     return wrapper
 
 
-def available_players():
+_deadlines = threading.local()
+
+
+@contextmanager
+def deadline(timeout):
+    """Context manager limiting total time of calls made inside the block
+    by the current thread::
+
+        with deadline(0.5):
+            status = mp.player.PlaybackStatus
+            metadata = mp.player.Metadata
+
+    Each call's timeout is reduced to the time left; calls made after
+    the deadline raise :class:`PyMPRISTimeout` without being sent.
+    Nested deadlines can only shorten the time left.
+
+    :param float timeout: time limit in seconds.
+    """
+    stack = _deadlines.__dict__.setdefault('stack', [])
+    end = _monotonic() + timeout
+    if stack:
+        end = min(end, stack[-1])
+    stack.append(end)
+    try:
+        yield
+    finally:
+        stack.pop()
+
+
+def effective_timeout(timeout=None):
+    """Returns timeout for a call made now: `timeout` limited
+    by the active :func:`deadline`.
+
+    :param float timeout: timeout in seconds; None or negative value
+                          means default dbus timeout.
+    :returns: timeout in seconds, -1 means default dbus timeout.
+    :raises PyMPRISTimeout: if the deadline has expired.
+    """
+    if timeout is None or timeout < 0:
+        timeout = -1
+    stack = getattr(_deadlines, 'stack', None)
+    if not stack:
+        return timeout
+    remaining = stack[-1] - _monotonic()
+    if remaining <= 0:
+        raise PyMPRISTimeout("Deadline exceeded")
+    return remaining if timeout < 0 else min(timeout, remaining)
+
+
+def available_players(bus=None):
     """Searchs and returns set of unique names of objects
     which implements MPRIS2 interfaces.
 
+    :param bus: bus object;
+                new SessionBus() object will be created if value is None.
     :returns: set of unique names.
     :type: set
     """
-    bus = dbus.SessionBus()
-    players = set()
-    for name in filter(lambda item: item.startswith(MPRIS_NAME_PREFIX),
-                       bus.list_names()):
-        owner_name = bus.get_name_owner(name)
-        players.add(convert(owner_name))
+    return set(discover_players(bus).values())
+
+
+def discover_players(bus=None):
+    """Searchs objects which implements MPRIS2 interfaces.
+
+    Owners of all names are requested concurrently,
+    so it takes about two round-trips regardless of the number of players.
+
+    :param bus: bus object;
+                new SessionBus() object will be created if value is None.
+    :returns: well-known names mapped to unique names.
+    :type: dict
+    """
+    if bus is None:
+        bus = dbus.SessionBus()
+    replies = [(name, call_async(bus, dbus.BUS_DAEMON_NAME,
+                                 dbus.BUS_DAEMON_PATH, dbus.BUS_DAEMON_IFACE,
+                                 'GetNameOwner', (name, ), 's'))
+               for name in bus.list_names()
+               if name.startswith(MPRIS_NAME_PREFIX)]
+    players = {}
+    for name, reply in replies:
+        try:
+            players[convert(name)] = reply.result()
+        except PyMPRISException:
+            # the name has been released since list_names call
+            pass
     return players
 
 
-class PyMPRISException(Exception):
+def call_async(bus, bus_name, object_path, dbus_interface, method,
+               args=(), signature=None, timeout=-1):
+    """Calls `method` without waiting for the reply.
+
+    Doesn't require a main loop: the reply is received either
+    by the main loop or when the result is requested.
+
+    :param bus: bus object.
+    :param str bus_name: unique or well-known objects name.
+    :param str object_path: objects path.
+    :param str dbus_interface: interface name.
+    :param str method: method name.
+    :param tuple args: method's arguments.
+    :param str signature: signature of the arguments;
+                          guessed from `args` if it's None.
+    :param float timeout: timeout in seconds, -1 means default timeout;
+                          it's limited by the active :func:`deadline`.
+    :rtype: :class:`PendingReply`
+    :raises PyMPRISTimeout: if the deadline has expired.
+    """
+    reply = PendingReply()
+    reply._pending_call = bus.call_async(
+        bus_name, object_path, dbus_interface, method, signature, args,
+        reply._reply_handler, reply._error_handler,
+        timeout=effective_timeout(timeout), require_main_loop=False)
+    return reply
+
+
+def pympris_exception(err):
+    """Returns pympris exception corresponding to dbus exception `err`."""
+    return dbus_error(err.get_dbus_name(), *err.args)
 
-    """Base exceprion class"""
 
-    def __init__(self, *args):
-        super(PyMPRISException, self).__init__(*args)
+class PendingReply(object):
+
+    """Result of a method call which doesn't wait for the reply.
+
+    The reply is converted from dbus types and dbus errors are
+    converted to :class:`PyMPRISException`. Done callbacks are called
+    from the main loop when the reply arrives, or from `result`
+    which blocks until the reply arrives if there is no main loop.
+    """
+
+    def __init__(self):
+        self._pending_call = None
+        self._done = False
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    def done(self):
+        """Returns True if the reply was received."""
+        return self._done
+
+    def result(self):
+        """Returns converted reply, waiting for it if needed.
+
+        :raises PyMPRISException: if the method call failed
+                                  or was cancelled.
+        """
+        self._wait()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self):
+        """Returns the exception of the failed call or None."""
+        self._wait()
+        return self._exception
+
+    def add_done_callback(self, callback):
+        """Calls `callback` with this object when the reply arrives
+        (immediately if it has already arrived)."""
+        if self._done:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+    def cancel(self):
+        """Stops waiting for the reply; callbacks will not be called."""
+        if not self._done and self._pending_call is not None:
+            self._pending_call.cancel()
+            self._pending_call = None
+            self._callbacks = []
+
+    def then(self, func):
+        """Returns new `PendingReply` which result is `func(result)`."""
+        reply = PendingReply()
+        reply._pending_call = self._pending_call
+
+        def chain(source):
+            if source._exception is not None:
+                reply.set_exception(source._exception)
+                return
+            try:
+                result = func(source._result)
+            except Exception as err:
+                reply.set_exception(err)
+            else:
+                reply.set_result(result)
+        self.add_done_callback(chain)
+        return reply
+
+    def set_result(self, result):
+        self._result = result
+        self._finish()
+
+    def set_exception(self, exception):
+        self._exception = exception
+        self._finish()
+
+    def _wait(self):
+        if not self._done and self._pending_call is not None:
+            self._pending_call.block()
+        if not self._done:
+            raise PyMPRISException("The reply wasn't received")
+
+    def _finish(self):
+        self._done = True
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def _reply_handler(self, *args):
+        if not args:
+            self.set_result(None)
+        elif len(args) == 1:
+            self.set_result(convert(args[0]))
+        else:
+            self.set_result(tuple(map(convert, args)))
+
+    def _error_handler(self, err):
+        if isinstance(err, dbus.exceptions.DBusException):
+            err = pympris_exception(err)
+        self.set_exception(err)
+
+
+def then(value, func):
+    """Applies `func` to `value` or to the result of `value`
+    if it's a :class:`PendingReply`."""
+    if isinstance(value, PendingReply):
+        return value.then(func)
+    return func(value)
+
+
+_METADATA_FIELDS = (
+    ('mpris:trackid', 'trackid'),
+    ('mpris:length', 'length'),
+    ('mpris:artUrl', 'artUrl'),
+    ('xesam:album', 'album'),
+    ('xesam:albumArtist', 'albumArtist'),
+    ('xesam:artist', 'artist'),
+    ('xesam:asText', 'asText'),
+    ('xesam:audioBPM', 'audioBPM'),
+    ('xesam:autoRating', 'autoRating'),
+    ('xesam:comment', 'comment'),
+    ('xesam:composer', 'composer'),
+    ('xesam:contentCreated', 'contentCreated'),
+    ('xesam:discNumber', 'discNumber'),
+    ('xesam:firstUsed', 'firstUsed'),
+    ('xesam:genre', 'genre'),
+    ('xesam:lastUsed', 'lastUsed'),
+    ('xesam:lyricist', 'lyricist'),
+    ('xesam:title', 'title'),
+    ('xesam:trackNumber', 'trackNumber'),
+    ('xesam:url', 'url'),
+    ('xesam:useCount', 'useCount'),
+    ('xesam:userRating', 'userRating'),
+)
+"""Well-known metadata entries and attributes of `TrackMetadata`
+they are stored in."""
+
+_METADATA_ATTRS = dict(_METADATA_FIELDS)
+
+
+class TrackMetadata(MutableMapping):
+
+    """Compact metadata of a track which behaves like a dict.
+
+    Well-known MPRIS and xesam entries are stored in slots
+    and are also available as attributes named without prefix::
+
+        metadata['xesam:title'] == metadata.title
+
+    Other entries are kept in an overflow dict with interned keys.
+    It isn't a dict subclass: use ``dict(metadata)`` to serialise it,
+    e.g. to JSON.
+    """
+
+    __slots__ = tuple(attr for key, attr in _METADATA_FIELDS) + ('_extra', )
+
+    def __init__(self, items=()):
+        self._extra = None
+        self.update(items)
+
+    def __getitem__(self, key):
+        attr = _METADATA_ATTRS.get(key)
+        if attr is not None:
+            try:
+                return getattr(self, attr)
+            except AttributeError:
+                raise KeyError(key)
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        attr = _METADATA_ATTRS.get(key)
+        if attr is not None:
+            setattr(self, attr, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[_intern(key)] = value
+
+    def __delitem__(self, key):
+        attr = _METADATA_ATTRS.get(key)
+        if attr is not None:
+            try:
+                delattr(self, attr)
+            except AttributeError:
+                raise KeyError(key)
+        else:
+            if self._extra is None:
+                raise KeyError(key)
+            del self._extra[key]
+            if not self._extra:
+                self._extra = None
+
+    def __contains__(self, key):
+        attr = _METADATA_ATTRS.get(key)
+        if attr is not None:
+            return hasattr(self, attr)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for key, attr in _METADATA_FIELDS:
+            if hasattr(self, attr):
+                yield key
+        if self._extra is not None:
+            for key in self._extra:
+                yield key
+
+    def __len__(self):
+        return (sum(1 for key, attr in _METADATA_FIELDS if hasattr(self, attr))
+                + len(self._extra or ()))
+
+    def copy(self):
+        return type(self)(self)
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, dict(self))
+
+
+def convert_metadata(dbus_obj):
+    """Converts metadata from dbus types to :class:`TrackMetadata`.
+
+    :param dbus_obj: metadata ('a{sv}') or list of metadata ('aa{sv}'),
+                     either in dbus or in python types.
+    :returns: :class:`TrackMetadata` or list of them.
+    """
+    if isinstance(dbus_obj, Mapping):
+        metadata = TrackMetadata()
+        for key, value in dbus_obj.items():
+            metadata[convert(key)] = convert(value)
+        return metadata
+    return [convert_metadata(item) for item in dbus_obj]
 
 
 def signal_wrapper(f):
@@ -182,3 +734,77 @@ class ConverterMeta(type):
                                           )
 
         return super(ConverterMeta, cls).__new__(cls, name, parents, dct)
+
+
+def returns(signature):
+    """Decorator declares dbus signature of the method's result.
+
+    Results of methods declared with void signature ('')
+    aren't converted by :class:`WrapperMeta`.
+
+    :param str signature: dbus type signature.
+    """
+    def decorator(f):
+        f._returns = signature
+        return f
+    return decorator
+
+
+def native(f):
+    """Decorator declares that the method returns python objects,
+    so its result isn't converted by :class:`WrapperMeta`."""
+    f._native = True
+    return f
+
+
+def fused_wrapper(f, convert_result=True):
+    """Decorator converts dbus exceptions to pympris exceptions
+    and the result from dbus types to python types in one frame.
+
+    The result isn't converted if `convert_result` is False
+    or `f` is declared by :func:`returns` ('') or :func:`native`.
+    """
+    if getattr(f, '_native', False) or getattr(f, '_returns', None) == '':
+        convert_result = False
+
+    if convert_result:
+        @wraps(f)
+        def wrapper(*args, **kwds):
+            try:
+                result = f(*args, **kwds)
+            except dbus.exceptions.DBusException as err:
+                raise pympris_exception(err)
+            return convert(result)
+    else:
+        @wraps(f)
+        def wrapper(*args, **kwds):
+            try:
+                return f(*args, **kwds)
+            except dbus.exceptions.DBusException as err:
+                raise pympris_exception(err)
+    return wrapper
+
+
+class WrapperMeta(type):
+
+    """Metaclass to wrap all class methods and properties
+    using `fused_wrapper` decorator to avoid raising dbus exceptions
+    and returning dbus types.
+
+    It's equivalent to combining `ExceptionMeta` and `ConverterMeta`
+    but adds one frame per call and skips converting results
+    of methods declared as void or native.
+    """
+
+    def __new__(cls, name, parents, dct):
+        for attr_name, attr in dct.items():
+            if isinstance(attr, types.FunctionType):
+                dct[attr_name] = fused_wrapper(attr)
+            elif isinstance(attr, property) and attr.fget:
+                dct[attr_name] = property(
+                    fused_wrapper(attr.fget),
+                    fused_wrapper(attr.fset, False) if attr.fset else None,
+                    fused_wrapper(attr.fdel, False) if attr.fdel else None,
+                    attr.__doc__)
+
+        return super(WrapperMeta, cls).__new__(cls, name, parents, dct)
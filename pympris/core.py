@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+# Copyright (c) Mikhail Mamrouski.
+# See LICENSE for details.
+
+"""
+Module provides exceptions and snapshots of properties
+which don't depend on dbus-python, so they are shared
+by :mod:`pympris` and the asyncio client :mod:`pympris.aio`.
+"""
+
+from collections import namedtuple
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+__all__ = ('PyMPRISException', 'PyMPRISTimeout', 'PyMPRISUnavailable',
+           'PyMPRISServiceUnknown', 'PyMPRISNotSupported',
+           'PyMPRISUnknownMethod', 'PyMPRISUnknownProperty',
+           'PyMPRISInvalidArgs', 'dbus_error', 'PropertiesSnapshot',
+           'MediaPlayerSnapshot', )
+
+MPRIS_NAME_PREFIX = "org.mpris.MediaPlayer2"
+
+
+class PyMPRISException(Exception):
+
+    """Base exceprion class"""
+
+    _dbus_name = None
+
+    def __init__(self, *args):
+        super(PyMPRISException, self).__init__(*args)
+
+    def get_dbus_name(self):
+        """Returns name of the dbus error which caused the exception
+        or None if it was raised by pympris."""
+        return self._dbus_name
+
+
+class PyMPRISTimeout(PyMPRISException):
+
+    """Exception raised when a call's timeout or deadline expires"""
+
+
+class PyMPRISUnavailable(PyMPRISException):
+
+    """Exception raised instead of calling a player
+    which stopped responding (see :class:`pympris.PlayerHealth`)"""
+
+
+class PyMPRISServiceUnknown(PyMPRISException):
+
+    """Exception raised when the player isn't on the bus"""
+
+
+class PyMPRISNotSupported(PyMPRISException):
+
+    """Exception raised when the player doesn't support
+    the method or property"""
+
+
+class PyMPRISUnknownMethod(PyMPRISNotSupported):
+
+    """Exception raised when the player doesn't implement
+    the method, interface or object"""
+
+
+class PyMPRISUnknownProperty(PyMPRISNotSupported):
+
+    """Exception raised when the player doesn't implement the property"""
+
+
+class PyMPRISInvalidArgs(PyMPRISException):
+
+    """Exception raised when the player rejects arguments of the call"""
+
+
+DBUS_EXCEPTIONS = {
+    'org.freedesktop.DBus.Error.NoReply': PyMPRISTimeout,
+    'org.freedesktop.DBus.Error.Timeout': PyMPRISTimeout,
+    'org.freedesktop.DBus.Error.TimedOut': PyMPRISTimeout,
+    'org.freedesktop.DBus.Error.ServiceUnknown': PyMPRISServiceUnknown,
+    'org.freedesktop.DBus.Error.NameHasNoOwner': PyMPRISServiceUnknown,
+    'org.freedesktop.DBus.Error.Disconnected': PyMPRISServiceUnknown,
+    'org.freedesktop.DBus.Error.NotSupported': PyMPRISNotSupported,
+    'org.freedesktop.DBus.Error.PropertyReadOnly': PyMPRISNotSupported,
+    'org.freedesktop.DBus.Error.UnknownMethod': PyMPRISUnknownMethod,
+    'org.freedesktop.DBus.Error.UnknownInterface': PyMPRISUnknownMethod,
+    'org.freedesktop.DBus.Error.UnknownObject': PyMPRISUnknownMethod,
+    'org.freedesktop.DBus.Error.UnknownProperty': PyMPRISUnknownProperty,
+    'org.freedesktop.DBus.Error.InvalidArgs': PyMPRISInvalidArgs,
+    'org.freedesktop.DBus.Error.InvalidSignature': PyMPRISInvalidArgs,
+}
+"""Maps names of dbus errors to pympris exception classes;
+other errors are converted to :class:`PyMPRISException`."""
+
+
+def dbus_error(dbus_name, *args):
+    """Returns pympris exception for dbus error `dbus_name`
+    with arguments `args`."""
+    exc = DBUS_EXCEPTIONS.get(dbus_name, PyMPRISException)(*args)
+    exc._dbus_name = dbus_name
+    return exc
+
+
+class PropertiesSnapshot(Mapping):
+
+    """Immutable set of properties values of an interface.
+
+    Values are available both as items and as attributes::
+
+        snapshot['Volume'] == snapshot.Volume
+    """
+
+    __slots__ = ('_props', )
+
+    def __init__(self, props):
+        object.__setattr__(self, '_props', dict(props))
+
+    def __getitem__(self, prop_name):
+        return self._props[prop_name]
+
+    def __iter__(self):
+        return iter(self._props)
+
+    def __len__(self):
+        return len(self._props)
+
+    def __getattr__(self, prop_name):
+        # the slot isn't set yet while copying and unpickling
+        try:
+            return object.__getattribute__(self, '_props')[prop_name]
+        except (AttributeError, KeyError):
+            raise AttributeError(prop_name)
+
+    def __reduce__(self):
+        return (type(self), (self._props, ))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("%s is read-only" % type(self).__name__)
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self._props)
+
+
+MediaPlayerSnapshot = namedtuple('MediaPlayerSnapshot',
+                                 'root player playlists track_list')
+"""Properties of all MPRIS2 interfaces of a player at one moment.
+Each field is a :class:`PropertiesSnapshot`;
+optional interfaces the player doesn't implement are None."""
@@ -1,9 +1,16 @@
 #!/usr/bin/env python
 # coding=utf-8
 
+import sys
+
 from setuptools import setup
 from pympris import __version__, __description__, requires, README
 
+packages = ['pympris']
+if sys.version_info >= (3, 6):
+    # asyncio client uses async generators
+    packages.append('pympris.aio')
+
 
 setup(name='pympris',
       version=__version__,
@@ -12,9 +19,10 @@ setup(name='pympris',
       author_email='wst.public.mail@gmail.com',
       url="https://github.com/wistful/pympris",
       license="MIT License",
-      packages=['pympris'],
+      packages=packages,
       long_description=README,
       install_requires=requires,
+      extras_require={'aio': ['jeepney>=0.7']},
       test_suite='tests.convert_test',
       platforms=["Unix,"],
       keywords="mpris, dbus",
@@ -0,0 +1,168 @@
+"""Tests of pympris.aio; they use async syntax, so they're imported
+by aio_test on python 3 only."""
+
+import subprocess
+import unittest
+
+try:
+    from shutil import which
+    import asyncio
+    from jeepney import (HeaderFields, message_bus,
+                         new_method_return, new_error, new_signal,
+                         DBusAddress, MatchRule)
+    from jeepney.io.asyncio import open_dbus_router
+except ImportError:
+    asyncio = None
+
+PLAYER_NAME = 'org.mpris.MediaPlayer2.test'
+IPLAYER = 'org.mpris.MediaPlayer2.Player'
+
+
+class FakePlayer(object):
+
+    """Minimal MPRIS2 player served by a jeepney router."""
+
+    def __init__(self, router):
+        self.router = router
+        self.calls = []
+        self.props = {IPLAYER: {'Volume': ('d', 0.5),
+                                'PlaybackStatus': ('s', 'Playing'),
+                                'Metadata': ('a{sv}', {
+                                    'xesam:title': ('s', 'title'),
+                                    'xesam:artist': ('as', ['artist'])})}}
+
+    async def serve(self):
+        rule = MatchRule(type='method_call')
+        with self.router.filter(rule, queue=asyncio.Queue()) as queue:
+            while True:
+                msg = await queue.get()
+                for reply in self.reply(msg):
+                    await self.router.send(reply)
+
+    def reply(self, msg):
+        iface = msg.header.fields[HeaderFields.interface]
+        member = msg.header.fields[HeaderFields.member]
+        self.calls.append((member, ) + msg.body)
+        if member == 'Get':
+            props = self.props.get(msg.body[0], {})
+            if msg.body[1] not in props:
+                error = 'org.freedesktop.DBus.Error.InvalidArgs'
+                return [new_error(msg, error, 's', ('No such property', ))]
+            return [new_method_return(msg, 'v', (props[msg.body[1]], ))]
+        if member == 'GetAll':
+            return [new_method_return(msg, 'a{sv}',
+                                      (self.props.get(msg.body[0], {}), ))]
+        if member == 'Set':
+            self.props[msg.body[0]][msg.body[1]] = msg.body[2]
+        replies = [new_method_return(msg)]
+        if member == 'Seek':
+            emitter = DBusAddress('/org/mpris/MediaPlayer2', interface=iface)
+            replies.append(new_signal(emitter, 'Seeked', 'x', msg.body))
+        return replies
+
+
+@unittest.skipIf(asyncio is None, "jeepney isn't installed")
+@unittest.skipIf(asyncio is not None and not which('dbus-daemon'),
+                 "dbus-daemon not found")
+class AioTest(unittest.TestCase):
+
+    """Test asyncio client against a private bus daemon."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.daemon = subprocess.Popen(
+            ['dbus-daemon', '--session', '--nofork', '--print-address'],
+            stdout=subprocess.PIPE, universal_newlines=True)
+        cls.address = cls.daemon.stdout.readline().strip()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.daemon.terminate()
+        cls.daemon.wait()
+        cls.daemon.stdout.close()
+
+    def run_with_player(self, test):
+        async def main():
+            async with open_dbus_router(self.address) as service:
+                await service.send_and_get_reply(
+                    message_bus.RequestName(PLAYER_NAME))
+                player = FakePlayer(service)
+                serving = asyncio.ensure_future(player.serve())
+                try:
+                    async with open_dbus_router(self.address) as router:
+                        await test(router, player)
+                finally:
+                    serving.cancel()
+
+        asyncio.run(asyncio.wait_for(main(), 10))
+
+    def test_properties(self):
+        from pympris import aio
+
+        async def test(router, fake):
+            player = aio.Player(PLAYER_NAME, router)
+            self.assertEqual(await player.Volume, 0.5)
+            self.assertEqual(await player.Metadata,
+                             {'xesam:title': 'title',
+                              'xesam:artist': ['artist']})
+            await player.set('Volume', 1)
+            self.assertEqual(fake.props[IPLAYER]['Volume'], ('d', 1.0))
+
+            snapshot = await player.get_all()
+            self.assertEqual(snapshot.PlaybackStatus, 'Playing')
+
+            self.assertEqual(await aio.available_players(router),
+                             set([fake.router.unique_name]))
+
+        self.run_with_player(test)
+
+    def test_errors(self):
+        from pympris import aio, PyMPRISException
+
+        async def test(router, fake):
+            player = aio.Player(PLAYER_NAME, router)
+            with self.assertRaises(PyMPRISException):
+                await player.MinimumRate
+
+        self.run_with_player(test)
+
+    def test_signals(self):
+        from pympris import aio
+
+        async def test(router, fake):
+            player = aio.Player(PLAYER_NAME, router)
+            signals = player.signals('Seeked')
+            received = asyncio.ensure_future(signals.__anext__())
+            await asyncio.sleep(0.1)
+            await player.Seek(15)
+            self.assertEqual(await received, [15])
+            await signals.aclose()
+            self.assertIn(('Seek', 15), fake.calls)
+
+        self.run_with_player(test)
+
+
+class FakeBusDaemonRouter(object):
+
+    """Answers bus daemon calls; one name is released after ListNames."""
+
+    async def send_and_get_reply(self, msg):
+        member = msg.header.fields[HeaderFields.member]
+        if member == 'ListNames':
+            return new_method_return(msg, 'as', ([
+                'org.freedesktop.DBus', 'org.mpris.MediaPlayer2.one',
+                'org.mpris.MediaPlayer2.gone'], ))
+        if msg.body[0].endswith('gone'):
+            error = 'org.freedesktop.DBus.Error.NameHasNoOwner'
+            return new_error(msg, error, 's', ('no such name', ))
+        return new_method_return(msg, 's', (':1.7', ))
+
+
+@unittest.skipIf(asyncio is None, "jeepney isn't installed")
+class AioDiscoveryTest(unittest.TestCase):
+
+    def test_released_name(self):
+        from pympris import aio
+
+        players = asyncio.run(aio.available_players(FakeBusDaemonRouter()))
+        self.assertEqual(players, set([':1.7']))
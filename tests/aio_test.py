@@ -0,0 +1,13 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath('..'))
+
+if sys.version_info >= (3, 7):
+    # pympris.aio and its tests use async syntax
+    from tests.aio_cases import AioTest, AioDiscoveryTest  # noqa: F401
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+import os
+import sys
+import unittest
+
+import dbus
+
+sys.path.insert(0, os.path.abspath('..'))
+
+import pympris.Base
+from pympris.Base import _CoalescingWrapper, IPROPERTIES
+from pympris.common import PendingReply, PropertiesSnapshot
+from pympris.Player import Player
+from tests.fakes import FakeBus, FakeProxy, FakeDispatcher
+
+
+class CachedModeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.log = []
+        self.dispatcher = FakeDispatcher(self.log)
+        self.player = Player('org.mpris.MediaPlayer2.test', bus=object(),
+                             cached=True,
+                             proxy=FakeProxy({'Volume': dbus.Double(0.5)},
+                                             calls=self.log),
+                             dispatcher=self.dispatcher)
+
+    def emit(self, changed_props, invalidated_props):
+        self.dispatcher.emit(IPROPERTIES, 'PropertiesChanged', Player.IFACE,
+                             changed_props, invalidated_props)
+
+    def test_subscribe_before_get_all(self):
+        self.assertEqual(self.log, [('connect', 'PropertiesChanged'),
+                                    ('GetAll', Player.IFACE)])
+
+    def test_cache(self):
+        self.assertEqual(self.player.Volume, 0.5)
+        self.emit({'Volume': dbus.Double(0.2)}, [])
+        self.assertEqual(self.player.Volume, 0.2)
+        self.emit({}, ['Volume'])
+        self.assertEqual(self.player.Volume, 0.5)
+        self.assertEqual(self.log[2:], [('Get', 'Volume')])
+
+
+class NowaitTest(unittest.TestCase):
+
+    def setUp(self):
+        self.props = {'Volume': dbus.Double(0.5),
+                      'PlaybackStatus': dbus.String('Playing')}
+        self.bus = FakeBus({
+            'Next': lambda: None,
+            'Get': lambda iface, prop_name: self.props[prop_name],
+            'Set': self.set,
+            'GetAll': lambda iface: dbus.Dictionary(self.props,
+                                                    signature='sv')})
+        self.player = Player('org.mpris.MediaPlayer2.test', bus=self.bus,
+                             proxy=FakeProxy(), dispatcher=FakeDispatcher())
+
+    def set(self, iface, prop_name, value):
+        self.props[prop_name] = value
+
+    def test_method(self):
+        reply = self.player.nowait.Next()
+        self.assertTrue(isinstance(reply, PendingReply))
+        self.assertEqual(self.bus.calls, [('Next', )])
+        self.assertFalse(reply.done())
+        self.assertEqual(reply.result(), None)
+
+    def test_property(self):
+        reply = self.player.nowait.Volume
+        self.assertTrue(isinstance(reply, PendingReply))
+        self.assertEqual(self.bus.calls, [('Get', Player.IFACE, 'Volume')])
+        self.assertEqual(self.bus.signatures, ['ss'])
+        self.assertEqual(reply.result(), 0.5)
+        self.assertIs(type(reply.result()), float)
+
+    def test_set(self):
+        self.player.nowait.Volume = 0.2
+        self.assertEqual(self.bus.calls,
+                         [('Set', Player.IFACE, 'Volume', 0.2)])
+        self.assertIs(type(self.bus.calls[0][3]), dbus.Double)
+        self.assertEqual(self.bus.signatures, ['ssv'])
+        # fire-and-forget: the reply is delivered by the main loop
+        self.assertEqual(len(self.bus.pending), 1)
+        self.bus.pending[0].block()
+        self.assertEqual(self.props['Volume'], 0.2)
+
+    def test_get_all(self):
+        reply = self.player.nowait.get_all()
+        self.assertEqual(self.bus.calls, [('GetAll', Player.IFACE)])
+        snapshot = reply.result()
+        self.assertTrue(isinstance(snapshot, PropertiesSnapshot))
+        self.assertEqual(snapshot.PlaybackStatus, 'Playing')
+        self.assertEqual(snapshot['Volume'], 0.5)
+
+    def test_view(self):
+        self.assertIs(self.player.nowait, self.player.nowait)
+        cached = Player('org.mpris.MediaPlayer2.test', bus=self.bus,
+                        cached=True, proxy=FakeProxy(self.props),
+                        dispatcher=FakeDispatcher())
+        # the view always asks the player
+        self.assertEqual(cached.nowait.Volume.result(), 0.5)
+        self.assertEqual(self.bus.calls, [('Get', Player.IFACE, 'Volume')])
+
+
+class FakeGLib(object):
+
+    """Stands for GLib module; sources are run by `run`."""
+
+    def __init__(self):
+        self.sources = {}
+        self.delays = []
+
+    def idle_add(self, callback):
+        return self.timeout_add(None, callback)
+
+    def timeout_add(self, interval, callback):
+        source = len(self.delays) + 1
+        self.delays.append(interval)
+        self.sources[source] = callback
+        return source
+
+    def source_remove(self, source):
+        del self.sources[source]
+
+    def run(self):
+        sources, self.sources = self.sources, {}
+        for callback in sources.values():
+            callback()
+
+
+class CoalescingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.glib = FakeGLib()
+        self._glib = pympris.Base._glib
+        pympris.Base._glib = lambda: self.glib
+        self.received = []
+
+    def tearDown(self):
+        pympris.Base._glib = self._glib
+
+    def handler(self, changed_props, invalidated_props):
+        self.received.append((changed_props, invalidated_props))
+
+    def test_merge(self):
+        wrapper = _CoalescingWrapper(self.handler, 0.25)
+        wrapper(Player.IFACE, {'Volume': dbus.Double(0.1),
+                               'Rate': dbus.Double(1.0)}, [])
+        wrapper(Player.IFACE, {'Volume': dbus.Double(0.2)}, ['Metadata'])
+        # a later change cancels invalidation and vice versa
+        wrapper(Player.IFACE, {'Metadata': dbus.Dictionary(
+            {}, signature='sv')}, ['Rate', 'Position'])
+        self.assertEqual(self.received, [])
+        self.assertEqual(self.glib.delays, [250])
+
+        self.glib.run()
+        self.assertEqual(self.received, [({'Volume': 0.2, 'Metadata': {}},
+                                          ['Rate', 'Position'])])
+
+        wrapper(Player.IFACE, {}, ['Volume'])
+        self.glib.run()
+        self.assertEqual(self.received[1], ({}, ['Volume']))
+        self.assertEqual(len(self.glib.delays), 2)
+
+    def test_idle(self):
+        wrapper = _CoalescingWrapper(self.handler, 'idle')
+        wrapper(Player.IFACE, {'Volume': dbus.Double(0.1)}, [])
+        self.assertEqual(self.glib.delays, [None])
+        self.glib.run()
+        self.assertEqual(self.received, [({'Volume': 0.1}, [])])
+
+    def test_close(self):
+        wrapper = _CoalescingWrapper(self.handler, 1)
+        wrapper(Player.IFACE, {'Volume': dbus.Double(0.1)}, ['Rate'])
+        wrapper.close()
+        self.assertEqual(self.glib.sources, {})
+        wrapper(Player.IFACE, {'Shuffle': dbus.Boolean(True)}, [])
+        self.glib.run()
+        self.assertEqual(self.received, [({'Shuffle': True}, [])])
+
+    def test_invalid_coalesce(self):
+        self.assertRaises(ValueError, _CoalescingWrapper, self.handler, 0)
+        self.assertRaises(ValueError, _CoalescingWrapper, self.handler, 'x')
+
+
+if __name__ == '__main__':
+    unittest.main()
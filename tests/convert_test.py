@@ -1,11 +1,17 @@
+import copy
 import os
+import pickle
 import sys
 import unittest
 import dbus
 
 sys.path.insert(0, os.path.abspath('..'))
 
-from pympris.common import convert, convert2dbus
+from pympris.common import (convert, convert2dbus, compile_signature,
+                            convert_metadata, TrackMetadata,
+                            lazy_convert, LazySequence, LazyMapping,
+                            WrapperMeta, returns, native, PyMPRISException,
+                            PropertiesSnapshot)
 
 
 class ConvertTest(unittest.TestCase):
@@ -36,6 +42,43 @@ class ConvertTest(unittest.TestCase):
         for test in tests:
             self.assertIsInstance(convert(test[0]), test[1])
 
+    def test_convert_nested(self):
+        """test converting nested containers and their items"""
+
+        metadata = dbus.Dictionary({
+            'mpris:trackid': dbus.ObjectPath('/track/1'),
+            'mpris:length': dbus.Int64(100),
+            'xesam:artist': dbus.Array([dbus.String('a')], signature='s'),
+            'xesam:userRating': dbus.Double(0.5),
+            'active': dbus.Struct((dbus.Boolean(True), dbus.UInt32(1))),
+        }, signature='sv')
+        value = convert(dbus.Array([metadata], signature='a{sv}'))
+
+        self.assertEqual(value, [{'mpris:trackid': '/track/1',
+                                  'mpris:length': 100,
+                                  'xesam:artist': ['a'],
+                                  'xesam:userRating': 0.5,
+                                  'active': (True, 1)}])
+        self.assertIs(type(value[0]['mpris:length']), int)
+        self.assertIs(type(value[0]['active'][0]), bool)
+        self.assertIs(type(value[0]['xesam:artist']), list)
+
+    def test_convert_passthrough(self):
+        """test values which don't need converting are returned as is"""
+
+        obj = object()
+        self.assertIs(convert(obj), obj)
+        self.assertIs(convert(None), None)
+
+    def test_convert_subclass(self):
+        """test subclasses of dbus types are converted as their base"""
+
+        class Path(dbus.ObjectPath):
+            pass
+
+        self.assertEqual(convert(Path('/path')), '/path')
+        self.assertIsNot(type(convert(Path('/path'))), Path)
+
     def test_convert2dbus(self):
         """Test converting python types to dbus types"""
 
@@ -55,12 +98,143 @@ class ConvertTest(unittest.TestCase):
                  (1.1, 'd', dbus.Double),
                  ('/path/to/stuff', 'o', dbus.ObjectPath),
                  ('(ii)', 'g', dbus.Signature),
-                 ('test', 's', dbus_str_type))
-                        #((1,1), '(ii)', dbus.Struct),
-                        #({1:1}, '{ii}', dbus.Dictionary))
+                 ('test', 's', dbus_str_type),
+                 ((1, 1), '(ii)', dbus.Struct),
+                 ({1: 1}, 'a{ii}', dbus.Dictionary),
+                 (['/a'], 'ao', dbus.Array))
 
         for test in tests:
             self.assertIsInstance(convert2dbus(test[0], test[1]), test[2])
 
+    def test_compile_signature(self):
+        """Test converting nested containers using compiled signatures"""
+
+        value = compile_signature('aa{sv}')([{'xesam:title': 'title'}])
+        self.assertIsInstance(value, dbus.Array)
+        self.assertEqual(value.signature, 'a{sv}')
+        self.assertIsInstance(value[0], dbus.Dictionary)
+        self.assertEqual(value[0].signature, 'sv')
+
+        value = compile_signature('a(oss)')([('/pl/1', 'name', '')])
+        self.assertIsInstance(value[0], dbus.Struct)
+        self.assertIsInstance(value[0][0], dbus.ObjectPath)
+
+        value = compile_signature('a{sa(ii)}')({'key': [(1, 2)]})
+        self.assertIsInstance(value['key'][0][1], dbus.Int32)
+
+        self.assertIs(compile_signature('ao'), compile_signature('ao'))
+
+    def test_compile_invalid_signature(self):
+        """Test compiling invalid signatures"""
+
+        for signature in ('', 'a', '(ii', '()', 'ii', '{ss}', 'a{vs}', 'z'):
+            self.assertRaises(ValueError, compile_signature, signature)
+
+    def test_convert_metadata(self):
+        """Test converting metadata to TrackMetadata"""
+
+        dbus_metadata = dbus.Dictionary({
+            'mpris:trackid': dbus.ObjectPath('/t/1'),
+            'mpris:length': dbus.Int64(100),
+            'xesam:artist': dbus.Array(['artist'], signature='s'),
+            'rhythmbox:rating': dbus.Double(4.0)}, signature='sv')
+        expected = {'mpris:trackid': '/t/1', 'mpris:length': 100,
+                    'xesam:artist': ['artist'], 'rhythmbox:rating': 4.0}
+
+        metadata = convert_metadata(dbus_metadata)
+        self.assertIsInstance(metadata, TrackMetadata)
+        self.assertEqual(metadata, expected)
+        self.assertEqual(dict(metadata), expected)
+        self.assertEqual(metadata.length, 100)
+        self.assertIs(type(metadata['mpris:length']), int)
+
+        tracks = convert_metadata(dbus.Array([dbus_metadata],
+                                             signature='a{sv}'))
+        self.assertEqual(tracks, [expected])
+
+    def test_track_metadata(self):
+        """Test dict access to TrackMetadata"""
+
+        metadata = TrackMetadata({'xesam:title': 'title', 'custom': 1})
+        self.assertEqual(len(metadata), 2)
+        self.assertEqual(metadata['xesam:title'], metadata.title)
+        self.assertIn('custom', metadata)
+        self.assertNotIn('xesam:album', metadata)
+        self.assertEqual(metadata.get('xesam:album', 'none'), 'none')
+        self.assertRaises(KeyError, lambda: metadata['xesam:album'])
+        self.assertRaises(AttributeError, lambda: metadata.album)
+
+        metadata['xesam:album'] = 'album'
+        del metadata['custom']
+        self.assertEqual(metadata.copy(),
+                         {'xesam:title': 'title', 'xesam:album': 'album'})
+        self.assertRaises(KeyError, metadata.__delitem__, 'custom')
+        self.assertFalse(hasattr(metadata, '__dict__'))
+
+    def test_lazy_convert(self):
+        """Test converting containers on access"""
+
+        tracks = dbus.Array([dbus.ObjectPath('/t/1'), dbus.ObjectPath('/t/2')],
+                            signature='o')
+        value = lazy_convert(tracks)
+        self.assertIsInstance(value, LazySequence)
+        self.assertEqual(len(value), 2)
+        self.assertIs(type(value[1]), str if sys.version_info[0] == 3
+                      else unicode)
+        self.assertEqual(value, ['/t/1', '/t/2'])
+        self.assertEqual(value[:1], ['/t/1'])
+        self.assertEqual(value, lazy_convert(tracks))
+        self.assertEqual(value, ('/t/1', '/t/2'))
+        self.assertNotEqual(lazy_convert(dbus.Array(['a', 'b'],
+                                                    signature='s')), 'ab')
+        self.assertFalse(value == '/t/1/t/2')
+
+        metadata = dbus.Dictionary({
+            'xesam:artist': dbus.Array(['artist'], signature='s'),
+            'mpris:length': dbus.Int64(100)}, signature='sv')
+        value = lazy_convert(metadata)
+        self.assertIsInstance(value, LazyMapping)
+        self.assertIsInstance(value['xesam:artist'], LazySequence)
+        self.assertIs(type(value['mpris:length']), int)
+        self.assertEqual(value, {'xesam:artist': ['artist'],
+                                 'mpris:length': 100})
+
+        self.assertEqual(lazy_convert(dbus.Struct((dbus.Int32(1), tracks))),
+                         (1, ['/t/1', '/t/2']))
+        self.assertIs(lazy_convert(dbus.Boolean(True)), True)
+
+    def test_wrapper_meta(self):
+        """Test converting results and exceptions of wrapped methods"""
+
+        value = dbus.Array([dbus.Int32(1)], signature='i')
+
+        def fail(self):
+            raise dbus.exceptions.DBusException('failed')
+
+        cls = WrapperMeta('Wrapped', (object, ), {
+            'converted': lambda self: value,
+            'void': returns('')(lambda self: value),
+            'native': native(lambda self: value),
+            'fail': fail,
+            'prop': property(lambda self: value)})
+        obj = cls()
+
+        self.assertIs(type(obj.converted()), list)
+        self.assertIs(obj.void(), value)
+        self.assertIs(obj.native(), value)
+        self.assertIs(type(obj.prop), list)
+        self.assertRaises(PyMPRISException, obj.fail)
+
+    def test_properties_snapshot(self):
+        snapshot = PropertiesSnapshot({'Volume': 0.5})
+        self.assertEqual(snapshot.Volume, snapshot['Volume'])
+        self.assertRaises(AttributeError, getattr, snapshot, 'Rate')
+        self.assertRaises(AttributeError, setattr, snapshot, 'Volume', 1)
+        for clone in (copy.copy(snapshot), copy.deepcopy(snapshot),
+                      pickle.loads(pickle.dumps(snapshot))):
+            self.assertEqual(type(clone), PropertiesSnapshot)
+            self.assertEqual(dict(clone), {'Volume': 0.5})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,53 @@
+import os
+import sys
+import unittest
+
+import dbus
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.common import available_players, discover_players
+from tests.fakes import FakeBus, dbus_exception, ERROR
+
+
+class DiscoverPlayersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.owners = {'org.mpris.MediaPlayer2.one': ':1.1',
+                       'org.mpris.MediaPlayer2.two': ':1.2'}
+        self.in_flight = []
+        self.bus = FakeBus({'GetNameOwner': self.get_name_owner},
+                           names=['org.freedesktop.DBus', ':1.1',
+                                  'org.mpris.MediaPlayer2.one',
+                                  'org.mpris.MediaPlayer2.gone',
+                                  'org.mpris.MediaPlayer2.two'])
+
+    def get_name_owner(self, name):
+        # calls sent but not answered, including this one
+        self.in_flight.append(len(self.bus.pending) + 1)
+        try:
+            return dbus.String(self.owners[name])
+        except KeyError:
+            # the name has been released since ListNames
+            raise dbus_exception(ERROR + 'NameHasNoOwner')
+
+    def test_discover(self):
+        self.assertEqual(discover_players(self.bus), self.owners)
+        self.assertEqual(sorted(call[1] for call in self.bus.calls),
+                         ['org.mpris.MediaPlayer2.gone',
+                          'org.mpris.MediaPlayer2.one',
+                          'org.mpris.MediaPlayer2.two'])
+        # all owners are requested before waiting for any reply
+        self.assertEqual(self.in_flight, [3, 2, 1])
+
+    def test_available_players(self):
+        self.assertEqual(available_players(self.bus), set([':1.1', ':1.2']))
+
+    def test_no_players(self):
+        self.bus.names = ['org.freedesktop.DBus']
+        self.assertEqual(discover_players(self.bus), {})
+        self.assertEqual(self.bus.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
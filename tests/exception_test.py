@@ -0,0 +1,98 @@
+import os
+import sys
+import unittest
+
+import dbus
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.common import pympris_exception
+from pympris.core import (dbus_error, PyMPRISException, PyMPRISTimeout,
+                          PyMPRISServiceUnknown, PyMPRISNotSupported,
+                          PyMPRISUnknownMethod, PyMPRISUnknownProperty,
+                          PyMPRISInvalidArgs)
+from pympris.Root import Root
+from tests.fakes import (FakeProxy, FakeDispatcher, dbus_exception, ERROR,
+                         INVALID_ARGS)
+
+
+class ExceptionTest(unittest.TestCase):
+
+    def test_classes(self):
+        for name, cls in (('NoReply', PyMPRISTimeout),
+                          ('ServiceUnknown', PyMPRISServiceUnknown),
+                          ('NotSupported', PyMPRISNotSupported),
+                          ('UnknownMethod', PyMPRISUnknownMethod),
+                          ('UnknownProperty', PyMPRISUnknownProperty),
+                          ('InvalidArgs', PyMPRISInvalidArgs)):
+            exc = pympris_exception(dbus_exception(ERROR + name, name))
+            self.assertEqual(type(exc), cls)
+            self.assertEqual(exc.get_dbus_name(), ERROR + name)
+            self.assertEqual(exc.args, (name, ))
+        self.assertTrue(issubclass(PyMPRISUnknownMethod, PyMPRISNotSupported))
+
+    def test_unknown_error(self):
+        exc = pympris_exception(dbus_exception('org.example.Error.Failed'))
+        self.assertEqual(type(exc), PyMPRISException)
+        self.assertEqual(exc.get_dbus_name(), 'org.example.Error.Failed')
+        self.assertEqual(dbus_error(None).get_dbus_name(), None)
+        self.assertEqual(PyMPRISException('x').get_dbus_name(), None)
+
+
+class OptionalPropertiesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.root = Root.__new__(Root)
+        self.root._absent = {}
+        self.root._cache = {}
+        self.root.get = self.get
+
+    def get(self, prop_name):
+        self.calls.append(prop_name)
+        if prop_name == 'Fullscreen':
+            raise dbus_exception(ERROR + 'InvalidArgs', 'No such property')
+        if prop_name == 'CanSetFullscreen':
+            raise dbus_exception(ERROR + 'NoReply')
+        return dbus.Boolean(True)
+
+    def test_absent_property(self):
+        for i in range(3):
+            self.assertRaises(PyMPRISUnknownProperty, getattr,
+                              self.root, 'Fullscreen')
+        self.assertEqual(self.calls, ['Fullscreen'])
+        try:
+            self.root.Fullscreen
+        except PyMPRISUnknownProperty as err:
+            self.assertEqual(err.get_dbus_name(), ERROR + 'InvalidArgs')
+
+        self.root._update_cache({'Fullscreen': dbus.Boolean(True)}, [])
+        self.assertRaises(PyMPRISUnknownProperty, getattr,
+                          self.root, 'Fullscreen')
+        self.assertEqual(len(self.calls), 2)
+
+    def test_other_errors_arent_cached(self):
+        for i in range(2):
+            self.assertRaises(PyMPRISTimeout, getattr,
+                              self.root, 'CanSetFullscreen')
+        self.assertEqual(len(self.calls), 2)
+
+
+class CachedOptionalPropertiesTest(unittest.TestCase):
+
+    def test_absent_property(self):
+        # a GDBus player without Fullscreen property
+        proxy = FakeProxy({'Identity': dbus.String('Fake')},
+                          get_error=INVALID_ARGS)
+        root = Root('org.mpris.MediaPlayer2.test', bus=object(), cached=True,
+                    proxy=proxy, dispatcher=FakeDispatcher())
+        self.assertEqual(root.Identity, 'Fake')
+        for i in range(3):
+            self.assertRaises(PyMPRISNotSupported, getattr,
+                              root, 'Fullscreen')
+        self.assertEqual(proxy.calls, [('GetAll', Root.IFACE),
+                                       ('Get', 'Fullscreen')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+"""Fake dbus objects shared by tests."""
+
+import dbus
+
+ERROR = 'org.freedesktop.DBus.Error.'
+NO_REPLY = ERROR + 'NoReply'
+INVALID_ARGS = ERROR + 'InvalidArgs'
+UNKNOWN_METHOD = ERROR + 'UnknownMethod'
+
+
+def dbus_exception(name, message='error'):
+    return dbus.exceptions.DBusException(message, name=name)
+
+
+class FakeProxy(object):
+
+    """Stands for dbus proxy object; records calls in `calls`.
+
+    GetAll returns `props`, Get returns one of them
+    or raises dbus error `get_error` if it isn't None.
+    Introspect reports `interfaces`; if it's None,
+    the object doesn't support introspection.
+    """
+
+    def __init__(self, props=None, get_error=None, interfaces=None,
+                 calls=None):
+        self.props = dict(props or {})
+        self.get_error = get_error
+        self.interfaces = interfaces
+        self.calls = [] if calls is None else calls
+
+    def get_dbus_method(self, member, dbus_interface=None):
+        return getattr(self, member)
+
+    def Introspect(self, dbus_interface=None, timeout=-1):
+        if self.interfaces is None:
+            raise dbus_exception(UNKNOWN_METHOD)
+        return '<node>%s</node>' % ''.join(
+            '<interface name="%s"/>' % iface for iface in self.interfaces)
+
+    def GetAll(self, iface, timeout=-1):
+        self.calls.append(('GetAll', iface))
+        return dbus.Dictionary(self.props, signature='sv')
+
+    def Get(self, iface, prop_name, timeout=-1):
+        self.calls.append(('Get', prop_name))
+        if self.get_error is not None:
+            raise dbus_exception(self.get_error, 'No such property')
+        return self.props[prop_name]
+
+    def Set(self, iface, prop_name, value, signature=None, timeout=-1):
+        self.calls.append(('Set', prop_name))
+        self.props[prop_name] = value
+
+
+class FakeDispatcher(object):
+
+    """Stands for pympris.SignalDispatcher; `emit` calls handlers
+    connected to the signal. Connections are recorded in `calls`."""
+
+    def __init__(self, calls=None):
+        self.calls = [] if calls is None else calls
+        self.handlers = {}
+
+    def connect(self, dbus_interface, signal_name, handler, arg0=None):
+        self.calls.append(('connect', signal_name))
+        self.handlers.setdefault((dbus_interface, signal_name),
+                                 []).append(handler)
+
+    def disconnect(self, dbus_interface, signal_name, handler, arg0=None):
+        handlers = self.handlers[(dbus_interface, signal_name)]
+        return handlers.pop(handlers.index(handler))
+
+    def close(self):
+        self.handlers.clear()
+
+    def emit(self, dbus_interface, signal_name, *args):
+        for handler in list(self.handlers.get((dbus_interface, signal_name),
+                                              ())):
+            handler(*args)
+
+
+class FakePendingCall(object):
+
+    """Stands for dbus PendingCall; `block` delivers the reply."""
+
+    def __init__(self, deliver):
+        self.deliver = deliver
+        self.delivered = False
+        self.cancelled = False
+
+    def block(self):
+        if not self.delivered and not self.cancelled:
+            self.delivered = True
+            self.deliver()
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeMatch(object):
+
+    def __init__(self, bus, handler, kwargs):
+        self.bus = bus
+        self.handler = handler
+        self.kwargs = kwargs
+
+    def remove(self):
+        self.bus.matches.remove(self)
+
+
+class FakeBus(object):
+
+    """Stands for dbus bus object.
+
+    Method calls are answered by functions from `methods` keyed
+    by method name; all calls fail with NoReply error while `alive`
+    is False. Calls are recorded in `calls` and their signatures
+    in `signatures` when they're sent, replies of `call_async`
+    are delivered when they're waited for.
+    `get_object` returns `proxy`, `list_names` returns `names`
+    and signals are delivered to receivers by `emit`.
+    """
+
+    def __init__(self, methods=None, proxy=None, names=()):
+        self.methods = dict(methods or {})
+        self.proxy = proxy
+        self.names = list(names)
+        self.alive = True
+        self.calls = []
+        self.signatures = []
+        self.matches = []
+        self._sent = []
+
+    @property
+    def pending(self):
+        """Calls sent by `call_async` which replies haven't been
+        delivered and which haven't been cancelled."""
+        return [call for call in self._sent
+                if not call.delivered and not call.cancelled]
+
+    def get_object(self, name, object_path, introspect=True):
+        return self.proxy
+
+    def list_names(self):
+        return dbus.Array(self.names, signature='s')
+
+    def call_blocking(self, bus_name, object_path, dbus_interface, method,
+                      signature, args, timeout=-1):
+        self.calls.append((method, ) + tuple(args))
+        self.signatures.append(signature)
+        return self._reply(method, args)
+
+    def call_async(self, bus_name, object_path, dbus_interface, method,
+                   signature, args, reply_handler, error_handler,
+                   timeout=-1, require_main_loop=True):
+        self.calls.append((method, ) + tuple(args))
+        self.signatures.append(signature)
+
+        def deliver():
+            try:
+                result = self._reply(method, args)
+            except dbus.exceptions.DBusException as err:
+                error_handler(err)
+            else:
+                if result is None:
+                    reply_handler()
+                else:
+                    reply_handler(result)
+        call = FakePendingCall(deliver)
+        self._sent.append(call)
+        return call
+
+    def _reply(self, method, args):
+        if not self.alive:
+            raise dbus_exception(NO_REPLY, 'no reply')
+        return self.methods[method](*args)
+
+    def add_signal_receiver(self, handler, **kwargs):
+        match = FakeMatch(self, handler, kwargs)
+        self.matches.append(match)
+        return match
+
+    def emit(self, dbus_interface, member, *args):
+        for match in list(self.matches):
+            kwargs = match.kwargs
+            if kwargs.get('dbus_interface', dbus_interface) != dbus_interface:
+                continue
+            if kwargs.get('signal_name', member) != member:
+                continue
+            keywords = {}
+            if 'interface_keyword' in kwargs:
+                keywords[kwargs['interface_keyword']] = dbus_interface
+            if 'member_keyword' in kwargs:
+                keywords[kwargs['member_keyword']] = member
+            match.handler(*args, **keywords)
@@ -0,0 +1,33 @@
+import os
+import sys
+import unittest
+
+import dbus
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.MediaPlayer import MediaPlayer
+from pympris.PlayLists import PlayLists
+from pympris.Player import Player
+from pympris.Root import Root
+from tests.fakes import FakeBus, FakeProxy, NO_REPLY
+
+
+class MediaPlayerTest(unittest.TestCase):
+
+    def test_snapshot_probe_fails(self):
+        # the player implements Playlists but doesn't answer HasTrackList
+        proxy = FakeProxy({'Identity': dbus.String('Fake')},
+                          get_error=NO_REPLY, interfaces=[PlayLists.IFACE])
+        mp = MediaPlayer('org.mpris.MediaPlayer2.test', FakeBus(proxy=proxy))
+        snapshot = mp.snapshot()
+        self.assertEqual(snapshot.root.Identity, 'Fake')
+        self.assertEqual(snapshot.playlists.Identity, 'Fake')
+        self.assertEqual(snapshot.track_list, None)
+        self.assertEqual([call[1] for call in proxy.calls
+                          if call[0] == 'GetAll'],
+                         [PlayLists.IFACE, Root.IFACE, Player.IFACE])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import sys
+import unittest
+
+import dbus
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.common import PendingReply, PyMPRISException
+from tests.fakes import FakePendingCall
+
+
+def pending(*args):
+    reply = PendingReply()
+    reply._pending_call = FakePendingCall(
+        lambda: reply._reply_handler(*args))
+    return reply
+
+
+class PendingReplyTest(unittest.TestCase):
+
+    def test_result(self):
+        reply = pending(dbus.Int32(1))
+        self.assertFalse(reply.done())
+        self.assertEqual(reply.result(), 1)
+        self.assertTrue(reply.done())
+
+    def test_then(self):
+        reply = pending(dbus.Int32(1)).then(lambda value: value + 1)
+        self.assertEqual(reply.result(), 2)
+
+    def test_then_error(self):
+        reply = pending(dbus.Int32(1)).then(lambda value: value['key'])
+        self.assertRaises(TypeError, reply.result)
+        self.assertTrue(reply.done())
+        self.assertTrue(isinstance(reply.exception(), TypeError))
+
+    def test_cancel(self):
+        reply = pending(dbus.Int32(1))
+        reply.cancel()
+        self.assertRaises(PyMPRISException, reply.result)
+        self.assertFalse(reply.done())
+
+    def test_without_call(self):
+        self.assertRaises(PyMPRISException, PendingReply().result)
+
+
+if __name__ == '__main__':
+    unittest.main()
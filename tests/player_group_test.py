@@ -0,0 +1,119 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath('..'))
+
+import dbus
+
+from pympris.core import (PropertiesSnapshot, PyMPRISException,
+                          PyMPRISInvalidArgs)
+from pympris.MediaPlayer import MediaPlayer
+from pympris.PlayerGroup import PlayerGroup, read_properties
+from pympris.PlayLists import PlayLists
+from tests.fakes import (FakeBus, FakeProxy, dbus_exception,
+                         INVALID_ARGS)
+
+
+class FakeMediaPlayer(object):
+
+    """Fails the test if the group sends anything to the player."""
+
+    name = 'org.mpris.MediaPlayer2.test'
+
+    @property
+    def player(self):
+        raise AssertionError("the player must not be called")
+
+
+class PlayerGroupTest(unittest.TestCase):
+
+    def test_set_invalid_property(self):
+        group = PlayerGroup([FakeMediaPlayer()])
+        self.assertRaises(ValueError, group.set, 'PlaybackStatus', 'Paused')
+        self.assertRaises(ValueError, group.set, 'Unknown', 1)
+        self.assertRaises(ValueError, group.set, 'Next', 1)
+        self.assertRaises(ValueError, group.set, 'Volume', 1,
+                          interface='unknown')
+
+
+def fake_media_player(name, props, interfaces=()):
+    """Returns MediaPlayer which properties are `props` and a bus
+    recording calls."""
+    def get(iface, prop_name):
+        try:
+            return props[prop_name]
+        except KeyError:
+            raise dbus_exception(INVALID_ARGS, 'No such property')
+    bus = FakeBus({'Get': get,
+                   'GetAll': lambda iface: dbus.Dictionary(props,
+                                                           signature='sv')},
+                  proxy=FakeProxy(interfaces=interfaces))
+    return MediaPlayer(name, bus)
+
+
+class ReadPropertiesTest(unittest.TestCase):
+
+    def setUp(self):
+        active = dbus.Struct((dbus.Boolean(True),
+                              dbus.Struct((dbus.ObjectPath('/p/1'),
+                                           dbus.String('one'),
+                                           dbus.String('')),
+                                          signature='oss')),
+                             signature='b(oss)')
+        self.mp1 = fake_media_player(
+            'org.mpris.MediaPlayer2.one',
+            {'PlaybackStatus': dbus.String('Playing'),
+             'Volume': dbus.Double(0.5)})
+        self.mp2 = fake_media_player(
+            'org.mpris.MediaPlayer2.two',
+            {'PlaybackStatus': dbus.String('Paused'),
+             'Volume': dbus.Double(1.0), 'ActivePlaylist': active},
+            interfaces=[PlayLists.IFACE])
+
+    def test_order(self):
+        replies = read_properties([(self.mp2, 'player', 'Volume'),
+                                   (self.mp1, 'player', 'PlaybackStatus'),
+                                   (self.mp2, 'player', 'PlaybackStatus'),
+                                   (self.mp1, 'player', 'Volume')])
+        self.assertEqual([reply.value for reply in replies],
+                         [1.0, 'Playing', 'Paused', 0.5])
+        self.assertEqual([reply.error for reply in replies],
+                         [None] * 4)
+
+    def test_sent_at_once(self):
+        get = self.mp1.bus.methods['Get']
+        pending = []
+
+        def get_volume(iface, prop_name):
+            pending.append(len(self.mp2.bus.pending))
+            return get(iface, prop_name)
+        self.mp1.bus.methods['Get'] = get_volume
+        read_properties([(self.mp1, 'player', 'Volume'),
+                         (self.mp2, 'player', 'Volume')])
+        # mp2 was asked before the reply of mp1 was awaited
+        self.assertEqual(pending, [1])
+
+    def test_get_all(self):
+        reply, = read_properties([(self.mp1, 'player', None)])
+        self.assertTrue(isinstance(reply.value, PropertiesSnapshot))
+        self.assertEqual(reply.value.Volume, 0.5)
+        self.assertEqual(self.mp1.bus.calls[0][0], 'GetAll')
+
+    def test_errors(self):
+        replies = read_properties([(self.mp1, 'player', 'Shuffle'),
+                                   (self.mp1, 'playlists', 'ActivePlaylist'),
+                                   (self.mp2, 'player', 'Volume')])
+        self.assertEqual(replies[0].value, None)
+        self.assertTrue(isinstance(replies[0].error, PyMPRISInvalidArgs))
+        # mp1 doesn't implement Playlists interface
+        self.assertTrue(isinstance(replies[1].error, PyMPRISException))
+        self.assertEqual(replies[2], (1.0, None))
+
+    def test_getter(self):
+        reply, = read_properties([(self.mp2, 'playlists', 'ActivePlaylist')])
+        self.assertEqual(reply, (('/p/1', 'one', ''), None))
+
+
+if __name__ == '__main__':
+    unittest.main()
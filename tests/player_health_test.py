@@ -0,0 +1,84 @@
+import os
+import sys
+import unittest
+
+import dbus
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.common import PendingReply
+from pympris.core import PyMPRISTimeout, PyMPRISUnavailable, dbus_error
+from pympris.PlayerHealth import PlayerHealth
+from tests.fakes import FakeBus, NO_REPLY, INVALID_ARGS
+
+
+def fail(name):
+    raise dbus.exceptions.DBusException(name, name=name)
+
+
+class PlayerHealthTest(unittest.TestCase):
+
+    def setUp(self):
+        self.bus = FakeBus({'Ping': lambda: None})
+        self.health = PlayerHealth(self.bus, 'org.mpris.MediaPlayer2.test',
+                                   '/org/mpris/MediaPlayer2',
+                                   failure_threshold=2, cool_down=0)
+
+    def pings(self):
+        return self.bus.calls.count(('Ping', ))
+
+    def test_latency(self):
+        self.assertEqual(self.health.latency, None)
+        self.health.record(1.0)
+        self.assertEqual(self.health.latency, 1.0)
+        self.health.record(2.0)
+        self.assertAlmostEqual(self.health.latency, 1.2)
+
+    def test_errors_replied_by_player(self):
+        for i in range(3):
+            self.assertRaises(dbus.exceptions.DBusException,
+                              self.health.call, fail, INVALID_ARGS)
+        self.assertEqual(self.health.failures, 0)
+        self.assertEqual(self.health.state, 'closed')
+
+    def test_circuit(self):
+        self.health.cool_down = 60
+        for i in range(2):
+            self.assertRaises(dbus.exceptions.DBusException,
+                              self.health.call, fail, NO_REPLY)
+        self.assertEqual(self.health.state, 'open')
+        self.assertFalse(self.health.available)
+        self.assertRaises(PyMPRISUnavailable, self.health.call, fail, NO_REPLY)
+        self.assertEqual(self.health.failures, 2)
+        self.assertEqual(self.pings(), 0)
+
+    def test_probe(self):
+        for i in range(2):
+            self.health.record(0.1, dbus_error(NO_REPLY))
+        self.assertEqual(self.health.state, 'half-open')
+
+        self.bus.alive = False
+        self.assertRaises(PyMPRISUnavailable, self.health.call, len, 'a')
+        self.assertEqual(self.pings(), 1)
+
+        self.bus.alive = True
+        self.assertEqual(self.health.call(len, 'ab'), 2)
+        self.assertEqual(self.pings(), 2)
+        self.assertEqual(self.health.state, 'closed')
+        self.assertEqual(self.health.failures, 0)
+
+    def test_deadline_expiry_isnt_failure(self):
+        self.health.record(0.1, PyMPRISTimeout("Deadline exceeded"))
+        self.assertEqual(self.health.failures, 0)
+
+    def test_track(self):
+        reply = self.health.track(PendingReply())
+        reply.set_exception(dbus_error(NO_REPLY))
+        self.assertEqual(self.health.failures, 1)
+        reply = self.health.track(PendingReply())
+        reply.set_result(1)
+        self.assertEqual(self.health.failures, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import sys
+import unittest
+
+import dbus
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.MediaPlayer import MediaPlayer
+from pympris.PlayerRegistry import PlayerRegistry
+from tests.fakes import FakeBus, FakeProxy, dbus_exception, ERROR
+
+ONE = 'org.mpris.MediaPlayer2.one'
+TWO = 'org.mpris.MediaPlayer2.two'
+THREE = 'org.mpris.MediaPlayer2.three'
+
+
+class PlayerRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.owners = {ONE: ':1.1', TWO: ':1.2'}
+        self.bus = FakeBus({'GetNameOwner': self.get_name_owner},
+                           proxy=FakeProxy(),
+                           names=['org.freedesktop.DBus', ':1.1', ONE, TWO])
+        self.registry = PlayerRegistry(self.bus)
+        self.added = []
+        self.removed = []
+        self.registry.register_added_handler(
+            lambda *args: self.added.append(args))
+        self.registry.register_removed_handler(
+            lambda *args: self.removed.append(args))
+
+    def get_name_owner(self, name):
+        try:
+            return dbus.String(self.owners[name])
+        except KeyError:
+            raise dbus_exception(ERROR + 'NameHasNoOwner')
+
+    def name_owner_changed(self, name, old_owner, new_owner):
+        self.bus.emit(dbus.BUS_DAEMON_IFACE, 'NameOwnerChanged',
+                      dbus.String(name), dbus.String(old_owner),
+                      dbus.String(new_owner))
+
+    def test_scan(self):
+        self.assertEqual(sorted(self.registry), [ONE, TWO])
+        self.assertEqual(len(self.registry), 2)
+        self.assertIn(ONE, self.registry)
+        self.assertNotIn(':1.1', self.registry)
+        self.assertEqual(self.registry.owner(TWO), ':1.2')
+        self.assertRaises(KeyError, self.registry.owner, THREE)
+
+    def test_added_removed(self):
+        self.name_owner_changed(THREE, '', ':1.3')
+        self.assertEqual(self.added, [(THREE, ':1.3')])
+        self.assertEqual(self.registry.owner(THREE), ':1.3')
+
+        self.name_owner_changed(ONE, ':1.1', '')
+        self.assertEqual(self.removed, [(ONE, ':1.1')])
+        self.assertEqual(sorted(self.registry), sorted([TWO, THREE]))
+        self.assertEqual(len(self.added), 1)
+
+    def test_owner_changed(self):
+        mp = self.registry[TWO]
+        self.name_owner_changed(TWO, ':1.2', ':1.5')
+        self.assertEqual(self.removed, [(TWO, ':1.2')])
+        self.assertEqual(self.added, [(TWO, ':1.5')])
+        self.assertEqual(self.registry.owner(TWO), ':1.5')
+        self.assertIsNot(self.registry[TWO], mp)
+        self.assertEqual(self.registry[TWO].name, ':1.5')
+
+    def test_other_names(self):
+        self.name_owner_changed('org.example.App', '', ':1.9')
+        self.name_owner_changed(':1.9', '', ':1.9')
+        self.assertEqual(self.added, [])
+        self.assertEqual(len(self.registry), 2)
+
+    def test_media_player(self):
+        mp = self.registry[ONE]
+        self.assertTrue(isinstance(mp, MediaPlayer))
+        self.assertEqual(mp.name, ':1.1')
+        self.assertIs(self.registry[ONE], mp)
+        self.assertRaises(KeyError, self.registry.__getitem__, THREE)
+
+    def test_close(self):
+        mp = self.registry[ONE]
+        mp.player.register_signal_handler('Seeked', lambda position: None)
+        self.assertEqual(len(self.bus.matches), 2)
+        self.registry.close()
+        self.assertEqual(self.bus.matches, [])
+        self.assertEqual(len(self.registry), 0)
+        self.name_owner_changed(THREE, '', ':1.3')
+        self.assertEqual(self.added, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
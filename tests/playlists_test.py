@@ -0,0 +1,179 @@
+import os
+import sys
+import unittest
+
+import dbus
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.Base import IPROPERTIES
+from pympris.PlayLists import PlayLists
+from tests.fakes import FakeBus, FakeProxy, FakeDispatcher
+
+
+def playlist(playlist_id):
+    return dbus.Struct((dbus.ObjectPath(playlist_id),
+                        dbus.String(playlist_id[-1]), dbus.String('')),
+                       signature='oss')
+
+
+class FakePlayListsProxy(FakeProxy):
+
+    """Proxy of a player with 3 playlists; records GetPlaylists calls."""
+
+    def __init__(self):
+        super(FakePlayListsProxy, self).__init__(
+            {'PlaylistCount': dbus.UInt32(3)})
+        self.requested = []
+
+    def GetPlaylists(self, start, max_count, order, reversed, timeout=-1):
+        self.requested.append(int(start))
+        return dbus.Array([playlist('/p/%d' % index)
+                           for index in range(start, start + max_count)],
+                          signature='(oss)')
+
+
+class PlayListsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.proxy = FakePlayListsProxy()
+        self.dispatcher = FakeDispatcher()
+        self.playlists = PlayLists('org.mpris.MediaPlayer2.test',
+                                   bus=object(), cached=True,
+                                   proxy=self.proxy,
+                                   dispatcher=self.dispatcher)
+        self.playlists.PLAYLISTS_CACHE_SIZE = 2
+
+    def get(self, start):
+        return self.playlists.GetPlaylists(start, 2, 'Alphabetical', False)
+
+    def test_lru(self):
+        self.assertEqual(self.get(0), [('/p/0', '0', ''), ('/p/1', '1', '')])
+        self.get(0)
+        self.get(2)
+        self.assertEqual(self.proxy.requested, [0, 2])
+        # the least recently used result is evicted
+        self.get(0)
+        self.get(4)
+        self.get(0)
+        self.get(2)
+        self.assertEqual(self.proxy.requested, [0, 2, 4, 2])
+
+    def test_playlist_changed(self):
+        self.get(0)
+        self.get(2)
+        self.dispatcher.emit(PlayLists.IFACE, 'PlaylistChanged',
+                             playlist('/p/3'))
+        self.get(0)
+        self.get(2)
+        self.assertEqual(self.proxy.requested, [0, 2, 2])
+
+    def test_playlist_count_changed(self):
+        self.get(0)
+        self.dispatcher.emit(IPROPERTIES, 'PropertiesChanged',
+                             PlayLists.IFACE,
+                             {'PlaylistCount': dbus.UInt32(4)}, [])
+        self.assertEqual(self.playlists.PlaylistCount, 4)
+        self.assertNotIn(('Get', 'PlaylistCount'), self.proxy.calls)
+        self.get(0)
+        self.dispatcher.emit(IPROPERTIES, 'PropertiesChanged',
+                             PlayLists.IFACE, {}, ['Orderings'])
+        self.get(0)
+        self.assertEqual(self.proxy.requested, [0, 0, 0])
+
+
+class IterPlaylistsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.items = [playlist('/p/%d' % index) for index in range(5)]
+        self.bus = FakeBus({'Get': self.get,
+                            'GetPlaylists': self.get_playlists})
+        self.playlists = PlayLists('org.mpris.MediaPlayer2.test',
+                                   bus=self.bus, proxy=FakeProxy(),
+                                   dispatcher=FakeDispatcher())
+
+    def get(self, iface, prop_name):
+        return dbus.UInt32(len(self.items))
+
+    def get_playlists(self, start, max_count, order, reversed):
+        return dbus.Array(self.items[start:start + max_count],
+                          signature='(oss)')
+
+    def requested(self):
+        return [int(call[1]) for call in self.bus.calls
+                if call[0] == 'GetPlaylists']
+
+    def test_pages(self):
+        playlists = list(self.playlists.iter_playlists('Alphabetical',
+                                                       page_size=2))
+        self.assertEqual([item[0] for item in playlists],
+                         ['/p/0', '/p/1', '/p/2', '/p/3', '/p/4'])
+        self.assertEqual(self.requested(), [0, 2, 4])
+        self.assertEqual(self.bus.pending, [])
+
+    def test_prefetch(self):
+        playlists = self.playlists.iter_playlists('Alphabetical',
+                                                  page_size=2)
+        self.assertEqual(next(playlists), ('/p/0', '0', ''))
+        # the next page is requested before the current one is consumed
+        self.assertEqual(self.requested(), [0, 2])
+        self.assertEqual(len(self.bus.pending), 2)
+        next(playlists)
+        self.assertEqual(self.requested(), [0, 2])
+
+    def test_count_changed(self):
+        playlists = self.playlists.iter_playlists('Alphabetical',
+                                                  page_size=2)
+        self.assertEqual(next(playlists)[0], '/p/0')
+        self.assertEqual(next(playlists)[0], '/p/1')
+        self.items.insert(0, playlist('/p/new'))
+        self.assertEqual(list(playlists), [])
+        self.assertEqual(self.requested(), [0, 2])
+
+    def test_close(self):
+        playlists = self.playlists.iter_playlists('Alphabetical',
+                                                  page_size=2)
+        next(playlists)
+        self.assertEqual(len(self.bus.pending), 2)
+        playlists.close()
+        self.assertEqual(self.bus.pending, [])
+
+    def test_invalid_page_size(self):
+        self.assertRaises(ValueError, list,
+                          self.playlists.iter_playlists('Alphabetical',
+                                                        page_size=0))
+
+
+class ActivePlaylistTest(unittest.TestCase):
+
+    def setUp(self):
+        active = dbus.Struct((dbus.Boolean(True), playlist('/p/1')),
+                             signature='b(oss)')
+        self.proxy = FakeProxy({'ActivePlaylist': active})
+        self.bus = FakeBus({'Get': lambda iface, prop_name:
+                            self.proxy.props[prop_name]})
+
+    def playlists(self, cached=False):
+        return PlayLists('org.mpris.MediaPlayer2.test', bus=self.bus,
+                         cached=cached, proxy=self.proxy,
+                         dispatcher=FakeDispatcher())
+
+    def assertPlaylist(self, value):
+        self.assertEqual(value, ('/p/1', '1', ''))
+        self.assertIs(type(value), tuple)
+        for item in value:
+            self.assertNotIsInstance(item, (dbus.ObjectPath, dbus.String))
+
+    def test_types(self):
+        self.assertPlaylist(self.playlists().ActivePlaylist)
+        self.assertPlaylist(self.playlists(cached=True).ActivePlaylist)
+        self.assertPlaylist(self.playlists().nowait.ActivePlaylist.result())
+
+    def test_no_active_playlist(self):
+        self.proxy.props['ActivePlaylist'] = dbus.Struct(
+            (dbus.Boolean(False), playlist('/')), signature='b(oss)')
+        self.assertEqual(self.playlists().ActivePlaylist, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
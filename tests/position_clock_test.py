@@ -0,0 +1,125 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.PositionClock import PositionClock
+
+# the package exports the class under the module's name
+clock_module = sys.modules['pympris.PositionClock']
+
+
+class FakePlayer(object):
+
+    """Stands for pympris.Player and counts position reads."""
+
+    def __init__(self, **props):
+        self.props = props
+        self.handlers = {}
+        self.reads = 0
+
+    def get_all(self):
+        self.reads += 1
+        return dict(self.props)
+
+    @property
+    def Position(self):
+        self.reads += 1
+        return self.props['Position']
+
+    def register_signal_handler(self, signal_name, handler_function):
+        self.handlers[signal_name] = handler_function
+
+    def unregister_signal_handler(self, signal_name, handler_function):
+        assert self.handlers.pop(signal_name) == handler_function
+
+    def register_properties_handler(self, handler_function):
+        self.handlers['PropertiesChanged'] = handler_function
+
+    def unregister_properties_handler(self, handler_function):
+        assert self.handlers.pop('PropertiesChanged') == handler_function
+
+    def emit(self, signal_name, *args):
+        self.handlers[signal_name](*args)
+
+
+class PositionClockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 100.0
+        self._monotonic = clock_module._monotonic
+        clock_module._monotonic = lambda: self.now
+        self.player = FakePlayer(
+            Position=1000000, Rate=1.0, PlaybackStatus='Playing',
+            Metadata={'mpris:trackid': '/t/1', 'mpris:length': 10000000})
+        self.clock = PositionClock(self.player)
+
+    def tearDown(self):
+        clock_module._monotonic = self._monotonic
+
+    def test_extrapolation(self):
+        self.assertTrue(self.clock.playing)
+        self.assertEqual(self.clock.length, 10000000)
+        self.assertEqual(self.clock.position, 1000000)
+        self.now += 2.5
+        self.assertEqual(self.clock.position, 3500000)
+        # limited by the track's length
+        self.now += 100
+        self.assertEqual(self.clock.position, 10000000)
+        self.assertEqual(self.player.reads, 1)
+
+    def test_pause_resume(self):
+        self.now += 1
+        self.player.emit('PropertiesChanged',
+                         {'PlaybackStatus': 'Paused'}, [])
+        self.now += 5
+        self.assertFalse(self.clock.playing)
+        self.assertEqual(self.clock.position, 2000000)
+        self.player.emit('PropertiesChanged',
+                         {'PlaybackStatus': 'Playing'}, [])
+        self.now += 1
+        self.assertEqual(self.clock.position, 3000000)
+        self.assertEqual(self.player.reads, 1)
+
+    def test_rate(self):
+        self.player.props['Position'] = 2000000
+        self.player.emit('PropertiesChanged', {'Rate': 2.0}, [])
+        self.assertEqual(self.player.reads, 2)
+        self.now += 1
+        self.assertEqual(self.clock.position, 4000000)
+
+    def test_seeked(self):
+        self.now += 1
+        self.player.emit('Seeked', 500000)
+        self.assertEqual(self.clock.position, 500000)
+        self.assertEqual(self.player.reads, 1)
+
+    def test_resync(self):
+        # metadata of the same track doesn't resync
+        self.player.emit('PropertiesChanged', {'Metadata': {
+            'mpris:trackid': '/t/1', 'mpris:length': 10000000}}, [])
+        self.assertEqual(self.player.reads, 1)
+
+        self.player.props['Position'] = 0
+        self.player.emit('PropertiesChanged', {'Metadata': {
+            'mpris:trackid': '/t/2', 'mpris:length': 5000000}}, [])
+        self.assertEqual(self.player.reads, 2)
+        self.assertEqual(self.clock.length, 5000000)
+        self.assertEqual(self.clock.position, 0)
+
+        self.player.emit('PropertiesChanged',
+                         {'PlaybackStatus': 'Stopped'}, [])
+        self.assertEqual(self.player.reads, 3)
+        self.assertFalse(self.clock.playing)
+
+        self.player.emit('PropertiesChanged', {}, ['Metadata'])
+        self.assertEqual(self.player.reads, 4)
+
+    def test_close(self):
+        self.clock.close()
+        self.assertEqual(self.player.handlers, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.SignalDispatcher import SignalDispatcher
+from tests.fakes import FakeBus
+
+IPLAYER = 'org.mpris.MediaPlayer2.Player'
+IPROPERTIES = 'org.freedesktop.DBus.Properties'
+
+
+class SignalDispatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.bus = FakeBus()
+        self.dispatcher = SignalDispatcher(self.bus,
+                                           'org.mpris.MediaPlayer2.test',
+                                           '/org/mpris/MediaPlayer2')
+        self.received = []
+
+    def handler(self, name):
+        return lambda *args: self.received.append((name, ) + args)
+
+    def test_one_match_rule(self):
+        seeked = self.handler('seeked')
+        self.dispatcher.connect(IPLAYER, 'Seeked', seeked)
+        self.dispatcher.connect(IPLAYER, None, self.handler('any'))
+        self.dispatcher.connect(IPROPERTIES, 'PropertiesChanged',
+                                self.handler('props'), arg0=IPLAYER)
+        self.assertEqual(len(self.bus.matches), 1)
+        self.assertEqual(len(self.dispatcher), 3)
+        kwargs = self.bus.matches[0].kwargs
+        self.assertEqual(kwargs['bus_name'], 'org.mpris.MediaPlayer2.test')
+        self.assertEqual(kwargs['path'], '/org/mpris/MediaPlayer2')
+
+    def test_routing(self):
+        self.dispatcher.connect(IPLAYER, 'Seeked', self.handler('seeked'))
+        self.dispatcher.connect(IPLAYER, None, self.handler('any'))
+        self.dispatcher.connect(IPROPERTIES, 'PropertiesChanged',
+                                self.handler('player'), arg0=IPLAYER)
+
+        self.bus.emit(IPLAYER, 'Seeked', 10)
+        self.assertEqual(self.received, [('seeked', 10), ('any', 10)])
+
+        del self.received[:]
+        self.bus.emit(IPROPERTIES, 'PropertiesChanged', IPLAYER, {}, [])
+        self.bus.emit(IPROPERTIES, 'PropertiesChanged',
+                      'org.mpris.MediaPlayer2', {}, [])
+        self.bus.emit(IPROPERTIES, 'PropertiesChanged', [1], {}, [])
+        self.assertEqual(self.received, [('player', IPLAYER, {}, [])])
+
+    def test_disconnect(self):
+        seeked = self.handler('seeked')
+        props = self.handler('props')
+        self.dispatcher.connect(IPLAYER, 'Seeked', seeked)
+        self.dispatcher.connect(IPROPERTIES, 'PropertiesChanged', props,
+                                arg0=IPLAYER)
+        self.assertRaises(ValueError, self.dispatcher.disconnect,
+                          IPROPERTIES, 'PropertiesChanged', props)
+
+        self.assertIs(self.dispatcher.disconnect(IPLAYER, 'Seeked', seeked),
+                      seeked)
+        self.bus.emit(IPLAYER, 'Seeked', 10)
+        self.assertEqual(self.received, [])
+        self.assertEqual(len(self.bus.matches), 1)
+
+        self.dispatcher.disconnect(IPROPERTIES, 'PropertiesChanged', props,
+                                   arg0=IPLAYER)
+        self.assertEqual(self.bus.matches, [])
+        self.assertEqual(len(self.dispatcher), 0)
+
+        self.dispatcher.connect(IPLAYER, 'Seeked', seeked)
+        self.assertEqual(len(self.bus.matches), 1)
+        self.dispatcher.close()
+        self.assertEqual(self.bus.matches, [])
+
+    def test_disconnect_while_dispatching(self):
+        def once(*args):
+            self.received.append(('once', ) + args)
+            self.dispatcher.disconnect(IPLAYER, 'Seeked', once)
+        self.dispatcher.connect(IPLAYER, 'Seeked', once)
+        self.dispatcher.connect(IPLAYER, 'Seeked', self.handler('seeked'))
+        self.bus.emit(IPLAYER, 'Seeked', 1)
+        self.bus.emit(IPLAYER, 'Seeked', 2)
+        self.assertEqual(self.received,
+                         [('once', 1), ('seeked', 1), ('seeked', 2)])
+
+    def test_handler_error(self):
+        def fail(*args):
+            raise RuntimeError()
+        self.dispatcher.connect(IPLAYER, 'Seeked', fail)
+        self.dispatcher.connect(IPLAYER, 'Seeked', self.handler('seeked'))
+        with self.assertLogs('pympris.SignalDispatcher', 'ERROR'):
+            self.bus.emit(IPLAYER, 'Seeked', 1)
+        self.assertEqual(self.received, [('seeked', 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+import unittest
+
+import dbus
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.common import (deadline, effective_timeout, pympris_exception,
+                            PyMPRISException, PyMPRISTimeout)
+
+
+class TimeoutTest(unittest.TestCase):
+
+    def test_effective_timeout(self):
+        self.assertEqual(effective_timeout(None), -1)
+        self.assertEqual(effective_timeout(-1), -1)
+        self.assertEqual(effective_timeout(2.5), 2.5)
+
+    def test_deadline(self):
+        with deadline(10):
+            self.assertTrue(0 < effective_timeout(None) <= 10)
+            self.assertEqual(effective_timeout(1), 1)
+            self.assertTrue(effective_timeout(20) <= 10)
+            # nested deadlines can only shorten the time left
+            with deadline(100):
+                self.assertTrue(effective_timeout(None) <= 10)
+            with deadline(1):
+                self.assertTrue(effective_timeout(None) <= 1)
+            self.assertTrue(effective_timeout(None) > 1)
+        self.assertEqual(effective_timeout(None), -1)
+
+    def test_expired_deadline(self):
+        with deadline(0.01):
+            time.sleep(0.02)
+            self.assertRaises(PyMPRISTimeout, effective_timeout, None)
+        self.assertEqual(effective_timeout(None), -1)
+
+    def test_exception(self):
+        err = dbus.exceptions.DBusException(
+            'no reply', name='org.freedesktop.DBus.Error.NoReply')
+        self.assertTrue(isinstance(pympris_exception(err), PyMPRISTimeout))
+        err = dbus.exceptions.DBusException(
+            'unknown', name='org.freedesktop.DBus.Error.UnknownMethod')
+        exc = pympris_exception(err)
+        self.assertTrue(isinstance(exc, PyMPRISException))
+        self.assertFalse(isinstance(exc, PyMPRISTimeout))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.TrackListMirror import TrackListMirror, NO_TRACK
+
+
+class FakeTrackList(object):
+
+    """Stands for pympris.TrackList and records metadata requests."""
+
+    def __init__(self, tracks):
+        self.Tracks = tracks
+        self.handlers = {}
+        self.requested = []
+
+    def register_signal_handler(self, signal_name, handler_function):
+        self.handlers[signal_name] = handler_function
+
+    def unregister_signal_handler(self, signal_name, handler_function):
+        assert self.handlers.pop(signal_name) == handler_function
+
+    def iter_tracks_metadata(self, track_ids, compact=False):
+        self.requested.append(track_ids)
+        return [{'mpris:trackid': track_id, 'xesam:title': track_id[-1]}
+                for track_id in track_ids]
+
+    def emit(self, signal_name, *args):
+        self.handlers[signal_name](*args)
+
+
+class TrackListMirrorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.track_list = FakeTrackList(['/t/a', '/t/b', '/t/c'])
+        self.mirror = TrackListMirror(self.track_list)
+
+    def test_load(self):
+        """test loading track ids and fetching metadata on demand"""
+        self.assertEqual(list(self.mirror), ['/t/a', '/t/b', '/t/c'])
+        self.assertEqual(self.mirror.index('/t/c'), 2)
+        self.assertEqual(self.track_list.requested, [])
+
+        self.assertEqual(self.mirror.metadata('/t/b')['xesam:title'], 'b')
+        self.mirror.metadata('/t/b')
+        self.mirror.fetch_metadata(self.mirror.tracks)
+        self.assertEqual(self.track_list.requested,
+                         [['/t/b'], ['/t/a', '/t/c']])
+
+        self.assertRaises(KeyError, self.mirror.metadata, '/t/x')
+        self.assertRaises(ValueError, self.mirror.index, '/t/x')
+
+    def test_prefetch(self):
+        """test loading metadata of all tracks at once"""
+        mirror = TrackListMirror(self.track_list, prefetch=True)
+        self.assertEqual(self.track_list.requested,
+                         [['/t/a', '/t/b', '/t/c']])
+        self.assertEqual(mirror.metadata('/t/c')['xesam:title'], 'c')
+
+    def test_signals(self):
+        """test applying TrackList signals"""
+        mirror = self.mirror
+        self.track_list.emit('TrackAdded',
+                             {'mpris:trackid': '/t/d'}, '/t/a')
+        self.track_list.emit('TrackAdded',
+                             {'mpris:trackid': '/t/e'}, NO_TRACK)
+        self.assertEqual(mirror.tracks,
+                         ['/t/e', '/t/a', '/t/d', '/t/b', '/t/c'])
+        self.assertEqual(mirror.index('/t/d'), 2)
+
+        self.track_list.emit('TrackRemoved', '/t/a')
+        self.track_list.emit('TrackRemoved', '/t/x')
+        self.assertNotIn('/t/a', mirror)
+        self.assertEqual(len(mirror), 4)
+        self.assertEqual(mirror.index('/t/d'), 1)
+
+        self.track_list.emit('TrackMetadataChanged', '/t/d',
+                             {'mpris:trackid': '/t/d', 'xesam:title': 'D'})
+        self.assertEqual(mirror.metadata('/t/d')['xesam:title'], 'D')
+
+        self.track_list.emit('TrackListReplaced', ['/t/d', '/t/f'], '/t/d')
+        self.assertEqual(mirror.tracks, ['/t/d', '/t/f'])
+        self.assertEqual(mirror.metadata('/t/d')['xesam:title'], 'D')
+        self.assertEqual(self.track_list.requested, [])
+        self.assertEqual(mirror.metadata('/t/f')['xesam:title'], 'f')
+        self.assertEqual(self.track_list.requested, [['/t/f']])
+
+        mirror.close()
+        self.assertEqual(self.track_list.handlers, {})
+
+    def test_move_track(self):
+        """test TrackAdded signal for a track already in the tracklist"""
+        mirror = TrackListMirror(FakeTrackList(['/t/a', '/t/b', '/t/c',
+                                                '/t/d']))
+        self.assertEqual(mirror.index('/t/a'), 0)
+        mirror.track_list.emit('TrackAdded',
+                               {'mpris:trackid': '/t/a'}, '/t/c')
+        self.assertEqual(mirror.tracks, ['/t/b', '/t/c', '/t/a', '/t/d'])
+        mirror.track_list.emit('TrackAdded',
+                               {'mpris:trackid': '/t/d'}, '/t/b')
+        self.assertEqual(mirror.tracks, ['/t/b', '/t/d', '/t/c', '/t/a'])
+        self.assertEqual(mirror.index('/t/a'), 3)
+
+    def test_track_replaced(self):
+        """test TrackMetadataChanged signal changing the track id"""
+        mirror = self.mirror
+        self.assertEqual(mirror.index('/t/b'), 1)
+        self.track_list.emit('TrackMetadataChanged', '/t/b',
+                             {'mpris:trackid': '/t/z', 'xesam:title': 'Z'})
+        self.assertEqual(mirror.tracks, ['/t/a', '/t/z', '/t/c'])
+        self.assertIn('/t/z', mirror)
+        self.assertNotIn('/t/b', mirror)
+        self.assertEqual(mirror.index('/t/z'), 1)
+        self.assertRaises(ValueError, mirror.index, '/t/b')
+        self.assertEqual(mirror.metadata('/t/z')['xesam:title'], 'Z')
+        self.assertEqual(self.track_list.requested, [])
+
+    def test_add_after_unknown_track(self):
+        """test TrackAdded signal after a track missing in the tracklist"""
+        self.mirror.index('/t/a')
+        self.mirror.metadata('/t/a')
+        # the mirror missed adding /t/x
+        self.track_list.Tracks = ['/t/a', '/t/x', '/t/y', '/t/b', '/t/c']
+        self.track_list.emit('TrackAdded',
+                             {'mpris:trackid': '/t/y', 'xesam:title': 'Y'},
+                             '/t/x')
+        self.assertEqual(self.mirror.tracks, self.track_list.Tracks)
+        self.assertIn('/t/x', self.mirror)
+        self.assertEqual(self.mirror.index('/t/c'), 4)
+        self.assertEqual(self.mirror.metadata('/t/y')['xesam:title'], 'Y')
+        self.assertEqual(self.track_list.requested, [['/t/a']])
+
+
+if __name__ == '__main__':
+    unittest.main()
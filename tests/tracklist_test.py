@@ -0,0 +1,81 @@
+import os
+import sys
+import unittest
+
+import dbus
+
+sys.path.insert(0, os.path.abspath('..'))
+
+from pympris.common import TrackMetadata
+from pympris.TrackList import TrackList
+from tests.fakes import FakeBus, FakeProxy, FakeDispatcher
+
+
+class IterTracksMetadataTest(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = []
+        self.in_flight = []
+        self.bus = FakeBus({'GetTracksMetadata': self.get_tracks_metadata})
+        self.track_list = TrackList('org.mpris.MediaPlayer2.test',
+                                    bus=self.bus, proxy=FakeProxy(),
+                                    dispatcher=FakeDispatcher())
+        self.track_ids = ['/t/%d' % index for index in range(7)]
+
+    def get_tracks_metadata(self, track_ids):
+        self.batches.append(list(track_ids))
+        # calls sent but not answered, including this one
+        self.in_flight.append(len(self.bus.pending) + 1)
+        return dbus.Array([dbus.Dictionary(
+            {'mpris:trackid': dbus.ObjectPath(track_id)}, signature='sv')
+            for track_id in track_ids], signature='a{sv}')
+
+    def test_batches(self):
+        metadata = list(self.track_list.iter_tracks_metadata(
+            self.track_ids, batch_size=3, in_flight=2))
+        self.assertEqual([item['mpris:trackid'] for item in metadata],
+                         self.track_ids)
+        self.assertEqual(type(metadata[0]), dict)
+        self.assertEqual([len(batch) for batch in self.batches], [3, 3, 1])
+        self.assertEqual(self.in_flight, [2, 2, 1])
+        self.assertEqual(self.bus.pending, [])
+
+    def test_in_flight(self):
+        metadata = self.track_list.iter_tracks_metadata(
+            self.track_ids, batch_size=1, in_flight=3)
+        next(metadata)
+        self.assertEqual(len(self.bus.calls), 3)
+        self.assertEqual(len(self.bus.pending), 2)
+        list(metadata)
+        self.assertEqual(len(self.bus.calls), 7)
+        self.assertEqual(max(self.in_flight), 3)
+
+    def test_compact(self):
+        metadata = list(self.track_list.iter_tracks_metadata(
+            self.track_ids, compact=True))
+        self.assertTrue(all(isinstance(item, TrackMetadata)
+                            for item in metadata))
+        self.assertEqual(metadata[6].trackid, '/t/6')
+        self.assertEqual(len(self.batches), 1)
+
+    def test_close(self):
+        metadata = self.track_list.iter_tracks_metadata(
+            self.track_ids, batch_size=2, in_flight=3)
+        next(metadata)
+        self.assertEqual(len(self.bus.pending), 2)
+        metadata.close()
+        self.assertEqual(self.bus.pending, [])
+        self.assertEqual(len(self.bus.calls), 3)
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, list,
+                          self.track_list.iter_tracks_metadata(
+                              self.track_ids, batch_size=0))
+        self.assertRaises(ValueError, list,
+                          self.track_list.iter_tracks_metadata(
+                              self.track_ids, in_flight=0))
+        self.assertEqual(self.bus.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()